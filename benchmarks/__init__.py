@@ -0,0 +1,8 @@
+"""
+Benchmarks for SurviveIsland.
+
+- suite: micro and macro benchmarks of the game's hot paths
+- runner: runs the suite, keeps a JSON history and gates on a baseline
+  (python -m benchmarks)
+- bench_events, loadgen_server: standalone benchmarks
+"""
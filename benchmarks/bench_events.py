@@ -0,0 +1,70 @@
+"""
+Event sampling microbenchmark.
+
+Compares the per-event cost of the original generate_event implementation
+(lists rebuilt on every call, random.choices, one function per event) with the
+precompiled EventRegistry.
+
+Usage:
+    python -m benchmarks.bench_events [--number N]
+"""
+
+import argparse
+import random
+import timeit
+
+from game.player import Player
+from game.evenements import EVENTS, EVENT_REGISTRY, generate_event
+
+
+def legacy_generate_event(player, rng=random):
+    """Original implementation of generate_event, kept as the reference."""
+    event_names = list(EVENTS.keys())
+    weights = [EVENTS[event]["weight"] for event in event_names]
+
+    chosen_event = rng.choices(event_names, weights=weights, k=1)[0]
+    event_info = EVENTS[chosen_event]
+
+    # Per-event function: uniform outcome choice, then the gauge update
+    message, delta_hunger, delta_thirst, delta_energy = rng.choice(event_info["outcomes"])
+    player.update_gauges(delta_hunger, delta_thirst, delta_energy)
+    return message
+
+
+def legacy_draw(rng=random):
+    """Original event draw, without applying the event."""
+    event_names = list(EVENTS.keys())
+    weights = [EVENTS[event]["weight"] for event in event_names]
+    return rng.choices(event_names, weights=weights, k=1)[0]
+
+
+def per_call_ns(function, number):
+    """Best of 5 runs, in nanoseconds per call."""
+    return min(timeit.repeat(function, number=number, repeat=5)) / number * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Event sampling microbenchmark")
+    parser.add_argument("--number", type=int, default=200_000, help="calls per run")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    player = Player()
+    batch = 1000
+
+    results = [
+        ("draw (legacy)", per_call_ns(lambda: legacy_draw(rng), args.number)),
+        ("draw (registry)", per_call_ns(lambda: EVENT_REGISTRY.draw(rng), args.number)),
+        ("draw_many k=1000, per event",
+         per_call_ns(lambda: EVENT_REGISTRY.draw_many(batch, rng), args.number // batch) / batch),
+        ("generate_event (legacy)", per_call_ns(lambda: legacy_generate_event(player, rng), args.number)),
+        ("generate_event (registry)", per_call_ns(lambda: generate_event(player, rng), args.number)),
+    ]
+
+    width = max(len(name) for name, _ in results)
+    for name, ns in results:
+        print(f"{name:<{width}}  {ns:8.1f} ns/event")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Shared island benchmark.
+
+Times the ticks of game.island (one day for every castaway: search of the
+surrounding tiles, moves, shared-out resources, events, decay, end checks)
+on the same island for increasing numbers of castaways, and reports the
+time per tick and per castaway. The castaways tend their lowest gauge, so
+most of them fish or look for water and stay alive during the measure.
+
+Requires NumPy.
+
+Usage:
+    python -m benchmarks.bench_island [--agents 1000 10000 100000] [--size 512] [--ticks 10]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from game.island import Island, ACTION_FISH, ACTION_SLEEP, ACTION_WATER
+
+
+# Action tending the lowest gauge (hunger, thirst, energy)
+TEND = np.array([ACTION_FISH, ACTION_WATER, ACTION_SLEEP])
+
+
+def tend_lowest(hunger, thirst, energy, days):
+    """Vectorized policy: fish, search water or sleep, whichever gauge is lowest."""
+    return TEND[np.argmin(np.stack([hunger, thirst, energy]), axis=0)]
+
+
+def measure(agents, size, ticks, seed):
+    """
+    Play ticks days with a number of castaways.
+
+    Returns:
+        dict: agents, mean and best milliseconds per tick, nanoseconds per
+            castaway per tick, castaways left
+    """
+    island = Island(agents, width=size, height=size, total_days=10_000, policy=tend_lowest, seed=seed)
+    island.tick()  # Warm-up
+    times = []
+    played = 0
+    for _ in range(ticks):
+        playing = len(island)
+        start = time.perf_counter()
+        island.tick()
+        times.append(time.perf_counter() - start)
+        played += playing
+    return {
+        "agents": agents,
+        "mean_ms": 1000 * sum(times) / len(times),
+        "best_ms": 1000 * min(times),
+        "ns_per_agent": 1e9 * sum(times) / played,
+        "left": len(island),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tick time of the shared island against the number of castaways")
+    parser.add_argument("--agents", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--size", type=int, default=512, help="island width and height, in tiles")
+    parser.add_argument("--ticks", type=int, default=10, help="ticks timed per run")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{args.size}x{args.size} island, {args.ticks} ticks")
+    print(f"{'agents':>8} {'mean ms':>9} {'best ms':>9} {'ns/agent':>9} {'left':>8}")
+    for agents in args.agents:
+        result = measure(agents, args.size, args.ticks, args.seed)
+        print(f"{result['agents']:>8} {result['mean_ms']:>9.2f} {result['best_ms']:>9.2f} "
+              f"{result['ns_per_agent']:>9.0f} {result['left']:>8}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
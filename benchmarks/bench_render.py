@@ -0,0 +1,161 @@
+"""
+Console rendering benchmark.
+
+Plays the same seeded games through the print renderer and the curses
+renderer inside a pseudo-terminal of a fixed size, and reports the bytes
+written to the terminal per turn and the rendering time per turn (gauges,
+menu, prompt and turn messages, as in game.gestion; the game rules are not
+timed). Each turn also prints the autosave message, as save_game does.
+
+Linux and macOS only (needs the pty module).
+
+Usage:
+    python -m benchmarks.bench_render [--games 20] [--days 30] [--rows 24] [--cols 80]
+"""
+
+import argparse
+import fcntl
+import json
+import os
+import pty
+import random
+import statistics
+import struct
+import sys
+import termios
+import time
+
+from benchmarks.suite import survival_policy
+from game.actions import ACTIONS
+from game.engine import GameSession, RESCUED
+from game.gestion import check_conditions, format_rescue
+from game.player import Player
+from game.render import PrintRenderer, CursesRenderer
+
+
+MODES = ("print", "curses")
+
+
+def play(mode, games, total_days, seed):
+    """
+    Play games through a renderer on the current terminal.
+
+    Returns:
+        list: Rendering seconds of every turn
+    """
+    current = {}
+
+    def read(prompt=""):
+        # Scripted answer; the print renderer writes its prompt like input() would
+        sys.stdout.write(prompt)
+        return survival_policy(current["player"], total_days)
+
+    renderer = PrintRenderer(read=read) if mode == "print" else CursesRenderer(read_key=read)
+    rng = random.Random(seed)
+    times = []
+    renderer.start()
+    try:
+        for _ in range(games):
+            player = current["player"] = Player(name="Kiosk")
+            session = GameSession(player=player, total_days=total_days, seed=rng.getrandbits(63))
+            while True:
+                start = time.perf_counter()
+                renderer.show_gauges(player, total_days)
+                continue_game, message = check_conditions(player, player.days_survived, total_days)
+                if not continue_game:
+                    renderer.show(["\n" + "=" * 50, message, "=" * 50 + "\n"])
+                    times.append(time.perf_counter() - start)
+                    break
+                action = renderer.choose_action()
+                elapsed = time.perf_counter() - start
+
+                outcome = session.play(action)
+
+                start = time.perf_counter()
+                lines = ["\n" + "-" * 40, "\n" + ACTIONS[action]["description"], outcome.action_message,
+                         "-" * 40, "\n🎲 Random event..."]
+                lines.extend(format_rescue(player) if outcome.status == RESCUED else [outcome.event_message])
+                renderer.show(lines)
+                if outcome.status == RESCUED:
+                    times.append(elapsed + time.perf_counter() - start)
+                    break
+                print("\n💾 Game saved successfully!")
+                times.append(elapsed + time.perf_counter() - start)
+    finally:
+        renderer.close()
+    return times
+
+
+def measure(mode, games, total_days, seed, rows, cols):
+    """
+    Play the games in a child process attached to a new pseudo-terminal.
+
+    Returns:
+        dict: mode, turns, bytes, bytes_per_turn, mean_ms and p99_ms per turn
+    """
+    results_read, results_write = os.pipe()
+    pid, master = pty.fork()
+    if pid == 0:
+        os.close(results_read)
+        fcntl.ioctl(sys.stdout.fileno(), termios.TIOCSWINSZ, struct.pack("HHHH", rows, cols, 0, 0))
+        os.environ.setdefault("TERM", "xterm")
+        status = 1
+        try:
+            times = play(mode, games, total_days, seed)
+            os.write(results_write, json.dumps(times).encode())
+            status = 0
+        finally:
+            os._exit(status)
+
+    os.close(results_write)
+    written = 0
+    while True:
+        try:
+            data = os.read(master, 65536)
+        except OSError:
+            # EIO once the child has closed the terminal
+            break
+        if not data:
+            break
+        written += len(data)
+    os.waitpid(pid, 0)
+    os.close(master)
+
+    with os.fdopen(results_read, "rb") as f:
+        times = json.loads(f.read() or b"[]")
+    if not times:
+        raise RuntimeError(f"{mode} renderer failed")
+    ordered = sorted(times)
+    return {
+        "mode": mode,
+        "turns": len(times),
+        "bytes": written,
+        "bytes_per_turn": written / len(times),
+        "mean_ms": 1000 * statistics.fmean(times),
+        "p99_ms": 1000 * ordered[min(len(ordered) - 1, int(0.99 * len(ordered)))],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bytes written and time per turn of the console renderers")
+    parser.add_argument("--games", type=int, default=20)
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--rows", type=int, default=24)
+    parser.add_argument("--cols", type=int, default=80)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    results = [measure(mode, args.games, args.days, args.seed, args.rows, args.cols) for mode in MODES]
+
+    print(f"{args.games} games of {args.days} days on a {args.cols}x{args.rows} terminal")
+    print(f"{'mode':<8} {'turns':>7} {'bytes/turn':>11} {'mean ms':>9} {'p99 ms':>8}")
+    for result in results:
+        print(f"{result['mode']:<8} {result['turns']:>7} {result['bytes_per_turn']:>11.0f} "
+              f"{result['mean_ms']:>9.3f} {result['p99_ms']:>8.3f}")
+    printed, drawn = results
+    print(f"curses writes {printed['bytes_per_turn'] / drawn['bytes_per_turn']:.1f}x fewer bytes per turn")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,109 @@
+"""
+Cold start benchmark.
+
+Runs short Python processes that only import part of the game, with
+`python -X importtime`, and reports how long the imports took (median of
+several runs) and which modules cost the most. Each statement has a
+budget in milliseconds; the exit status is 1 when one is exceeded.
+
+The timings only cover the imports done by the statement, not the
+interpreter start-up itself, and assume up-to-date bytecode caches (run
+`python -m compileall game` first when PYTHONDONTWRITEBYTECODE is set).
+
+Usage:
+    python -m benchmarks.bench_startup [--runs 7] [--scale 1.0]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Statement -> import time budget in milliseconds. game.engine reads the
+# built-in content file, which imports json (and re, its largest part).
+BUDGETS = {
+    "from game import Player": 2.0,
+    "import game.engine": 25.0,
+    "import game.gestion": 40.0,
+}
+
+
+def import_times(statement):
+    """
+    Run a statement in a fresh interpreter with -X importtime.
+
+    Args:
+        statement (str): Python code to run
+
+    Returns:
+        list: (name, self_us, cumulative_us, depth) per imported module, for
+            the modules imported by the statement (not by the interpreter start-up)
+    """
+    baseline = _parse(_run("pass"))
+    already = {name for name, _, _, _ in baseline}
+    return [row for row in _parse(_run(statement)) if row[0] not in already]
+
+
+def _run(statement):
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True
+    )
+    return completed.stderr
+
+
+def _parse(output):
+    rows = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return rows
+
+
+def measure(statement, runs):
+    """
+    Import time of a statement.
+
+    Returns:
+        tuple: (median milliseconds, rows of the median run)
+    """
+    samples = []
+    for _ in range(runs):
+        rows = import_times(statement)
+        total = sum(cumulative for _, _, cumulative, depth in rows if depth == 0)
+        samples.append((total / 1000, rows))
+    samples.sort(key=lambda sample: sample[0])
+    return samples[len(samples) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold start (import time) benchmark")
+    parser.add_argument("--runs", type=int, default=7, help="runs per statement")
+    parser.add_argument("--top", type=int, default=5, help="slowest modules listed per statement")
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply every budget (slow machines)")
+    args = parser.parse_args()
+
+    over = 0
+    for statement, budget in BUDGETS.items():
+        budget *= args.scale
+        total, rows = measure(statement, args.runs)
+        status = "✅" if total <= budget else "❌"
+        over += total > budget
+        print(f"{status} {statement:28} {total:7.2f} ms  (budget {budget:.1f} ms)")
+        game_modules = [name for name, _, _, _ in rows if name == "game" or name.startswith("game.")]
+        print(f"   game modules: {', '.join(game_modules)}")
+        for name, self_us, _, _ in sorted(rows, key=lambda row: -row[1])[:args.top]:
+            print(f"   {self_us / 1000:6.2f} ms  {name}")
+
+    sys.exit(1 if over else 0)
+
+
+if __name__ == "__main__":
+    main()
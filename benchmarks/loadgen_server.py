@@ -0,0 +1,164 @@
+"""
+Load generator for the game server.
+
+Opens a number of idle connections (connected, sitting at the name prompt)
+and a number of active clients playing random actions as fast as the server
+answers, then reports throughput and per-turn latency percentiles.
+
+By default the server is started in this process on a random port, with an
+SQLite store in a temporary directory; use --host/--port to target a server
+started separately with `python -m game.server`.
+
+Usage:
+    python -m benchmarks.loadgen_server [--idle 10000] [--active 1000] [--duration 10]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import resource
+import tempfile
+import time
+
+from game.server import GameServer, PROMPT_PREFIX
+
+
+PREFIX = PROMPT_PREFIX.encode("utf-8")
+
+
+async def read_prompt(reader):
+    """Read lines until the next prompt; returns the prompt text."""
+    while True:
+        line = await reader.readline()
+        if not line:
+            raise ConnectionError("server closed the connection")
+        if line.startswith(PREFIX):
+            return line[len(PREFIX):].decode("utf-8")
+
+
+async def idle_client(host, port, stop):
+    reader, writer = await asyncio.open_connection(host, port)
+    await read_prompt(reader)
+    await stop.wait()
+    writer.close()
+
+
+async def active_client(host, port, index, stop, latencies, seed):
+    rng = random.Random(f"{seed}:{index}")
+    reader, writer = await asyncio.open_connection(host, port)
+    await read_prompt(reader)
+    writer.write(f"bot{index}\n".encode())
+    prompt = await read_prompt(reader)
+    if prompt.startswith("Do you want to load"):
+        writer.write(b"n\n")
+        prompt = await read_prompt(reader)
+    writer.write(b"50\n")
+    prompt = await read_prompt(reader)
+
+    while not stop.is_set():
+        if prompt.startswith("Your choice"):
+            start = time.perf_counter()
+            writer.write(rng.choice("1234").encode() + b"\n")
+            prompt = await read_prompt(reader)
+            latencies.append(time.perf_counter() - start)
+        elif prompt.startswith("🔄"):
+            writer.write(b"y\n")
+            prompt = await read_prompt(reader)
+        else:
+            writer.write(b"50\n")
+            prompt = await read_prompt(reader)
+
+    writer.write(b"quit\n")
+    await writer.drain()
+    writer.close()
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def run(args):
+    server = None
+    store = None
+    cache = None
+    host, port = args.host, args.port
+
+    if port is None:
+        from game.save.sqlite import SQLiteStore, SQLiteBackend
+        directory = tempfile.mkdtemp(prefix="surviveisland-loadgen-")
+        store = SQLiteStore(os.path.join(directory, "server.db"))
+        backend_factory = lambda name: SQLiteBackend(store, player_key=name)
+        if args.cache_size > 0:
+            from game.save.cache import SessionCache
+            cache = SessionCache(backend_factory, max_sessions=args.cache_size)
+            backend_factory = cache.backend
+        server = GameServer(backend_factory)
+        listener = await server.start(host, 0)
+        port = listener.sockets[0].getsockname()[1]
+
+    stop = asyncio.Event()
+    latencies = []
+
+    start = time.perf_counter()
+    idle = []
+    for offset in range(0, args.idle, 500):
+        batch = [asyncio.create_task(idle_client(host, port, stop))
+                 for _ in range(min(500, args.idle - offset))]
+        await asyncio.sleep(0)
+        idle += batch
+    await asyncio.sleep(0.5)
+    print(f"opened {args.idle} idle connections in {time.perf_counter() - start:.1f}s")
+
+    active = [asyncio.create_task(active_client(host, port, i, stop, latencies, args.seed))
+              for i in range(args.active)]
+    await asyncio.sleep(args.warmup)
+    latencies.clear()
+    measure_start = time.perf_counter()
+    await asyncio.sleep(args.duration)
+    elapsed = time.perf_counter() - measure_start
+    turns = len(latencies)
+    measured = list(latencies)
+
+    stop.set()
+    await asyncio.gather(*active, *idle, return_exceptions=True)
+
+    if server is not None:
+        await server.close()
+        if cache is not None:
+            cache.close()
+            print(f"save cache: {cache.stats()}")
+        store.close()
+
+    print(f"active sessions: {args.active}, idle sessions: {args.idle}")
+    print(f"turns: {turns} in {elapsed:.1f}s -> {turns / elapsed:.0f} turns/s")
+    if measured:
+        print("latency p50 {:.2f} ms | p90 {:.2f} ms | p99 {:.2f} ms | max {:.2f} ms".format(
+            *(1000 * percentile(measured, q) for q in (0.5, 0.9, 0.99)), 1000 * max(measured)))
+    print(f"peak RSS: {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.0f} MiB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load generator for game.server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=None, help="existing server (default: start one here)")
+    parser.add_argument("--idle", type=int, default=10_000)
+    parser.add_argument("--active", type=int, default=1_000)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--warmup", type=float, default=2.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--cache-size", type=int, default=10_000,
+                        help="session cache of the local server (0: write every turn)")
+    args = parser.parse_args()
+
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    needed = 2 * (args.idle + args.active) + 100
+    if soft < needed:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (min(needed, hard), hard))
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
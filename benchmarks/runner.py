@@ -0,0 +1,210 @@
+"""
+Benchmark runner.
+
+Runs the suite, appends the results to a JSON-lines history file and
+compares them with a stored baseline. A benchmark regresses when it is
+slower than its baseline by more than the threshold percentage; the exit
+status is then 1, so the runner can gate a release.
+
+Timings are the best of several repeats (the least disturbed by other
+processes), in nanoseconds per call. Everything runs offline with the
+standard library.
+
+The default history and baseline files live in data/benchmarks/, which is
+local to the machine and not versioned. A baseline meant to be shared
+(e.g. for a CI machine) is stored under benchmarks/baselines/ and passed
+explicitly with --baseline.
+
+Usage:
+    python -m benchmarks [--filter TEXT] [--threshold 10] [--save-baseline]
+    python -m benchmarks --baseline benchmarks/baselines/ci.json [--save-baseline]
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+import timeit
+
+from benchmarks import suite
+from game.save.json_file import write_json_atomic
+
+
+# Machine-local results (not versioned)
+HISTORY_FILE = "data/benchmarks/history.jsonl"
+BASELINE_FILE = "data/benchmarks/baseline.json"
+
+
+def measure(function, repeat=5, min_time=0.2):
+    """
+    Time a zero-argument callable.
+
+    Args:
+        function (callable): Code to time
+        repeat (int): Number of timed runs (default: 5)
+        min_time (float): Minimum duration of one run in seconds (default: 0.2)
+
+    Returns:
+        dict: best and median nanoseconds per call, and calls per run
+    """
+    timer = timeit.Timer(function)
+    number, elapsed = timer.autorange()
+    if elapsed < min_time:
+        number = max(number, int(number * min_time / max(elapsed, 1e-9)))
+
+    runs = sorted(timer.repeat(repeat=repeat, number=number))
+    return {
+        "ns": runs[0] / number * 1e9,
+        "median_ns": runs[len(runs) // 2] / number * 1e9,
+        "number": number,
+    }
+
+
+def run_suite(names=None, repeat=5, min_time=0.2):
+    """
+    Run benchmarks of the suite.
+
+    Args:
+        names (iterable): Benchmarks to run (default: all)
+        repeat (int): Number of timed runs per benchmark (default: 5)
+        min_time (float): Minimum duration of one run in seconds (default: 0.2)
+
+    Returns:
+        dict: benchmark name -> measure() result plus its kind
+    """
+    names = list(suite.BENCHMARKS) if names is None else list(names)
+    results = {}
+    workdir = tempfile.mkdtemp(prefix="surviveisland-bench-")
+    try:
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            for name in names:
+                kind, setup = suite.BENCHMARKS[name]
+                results[name] = dict(measure(setup(workdir), repeat, min_time), kind=kind)
+    finally:
+        suite.teardown()
+        shutil.rmtree(workdir, ignore_errors=True)
+    return results
+
+
+def compare(results, baseline, threshold):
+    """
+    Compare results with a baseline.
+
+    Args:
+        results (dict): Current results, as returned by run_suite()
+        baseline (dict): Baseline results, same layout
+        threshold (float): Allowed slowdown in percent
+
+    Returns:
+        list: (name, baseline_ns, current_ns, change_percent, regressed) for
+            every benchmark present in both
+    """
+    rows = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        reference = baseline[name]["ns"]
+        change = (result["ns"] / reference - 1) * 100
+        rows.append((name, reference, result["ns"], change, change > threshold))
+    return rows
+
+
+def environment():
+    """Description of the machine the benchmarks ran on."""
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def append_history(path, results):
+    """Append one run to the JSON-lines history file."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    entry = {"timestamp": time.time(), "environment": environment(), "results": results}
+    with open(path, 'a') as f:
+        f.write(json.dumps(entry) + "\n")
+
+
+def load_baseline(path):
+    """Read the baseline results, or None if there is no baseline."""
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r') as f:
+        return json.load(f)["results"]
+
+
+def save_baseline(path, results):
+    """Store results as the new baseline."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    write_json_atomic(path, {"timestamp": time.time(), "environment": environment(), "results": results})
+
+
+def format_ns(ns):
+    if ns >= 1e6:
+        return f"{ns / 1e6:.2f} ms"
+    if ns >= 1e3:
+        return f"{ns / 1e3:.2f} µs"
+    return f"{ns:.0f} ns"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="SurviveIsland benchmark suite")
+    parser.add_argument("--filter", default="", help="only run benchmarks whose name contains TEXT")
+    parser.add_argument("--threshold", type=float, default=10.0, help="allowed slowdown in percent")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.2, help="minimum seconds per timed run")
+    parser.add_argument("--history", default=HISTORY_FILE)
+    parser.add_argument("--baseline", default=BASELINE_FILE)
+    parser.add_argument("--save-baseline", action="store_true", help="store this run as the baseline")
+    parser.add_argument("--list", action="store_true", help="list the benchmarks and exit")
+    args = parser.parse_args(argv)
+
+    names = [name for name in suite.BENCHMARKS if args.filter in name]
+    if args.list:
+        for name in names:
+            print(f"{suite.BENCHMARKS[name][0]:6} {name}")
+        return 0
+
+    results = run_suite(names, args.repeat, args.min_time)
+    append_history(args.history, results)
+
+    baseline = load_baseline(args.baseline)
+    rows = compare(results, baseline, args.threshold) if baseline else []
+    compared = {row[0]: row for row in rows}
+
+    for name, result in results.items():
+        line = f"{result['kind']:6} {name:32} {format_ns(result['ns']):>10}"
+        if name in compared:
+            _, reference, _, change, regressed = compared[name]
+            line += f"  vs {format_ns(reference):>10}  {change:+6.1f}%"
+            if regressed:
+                line += "  ❌ REGRESSION"
+        print(line)
+
+    if args.save_baseline:
+        save_baseline(args.baseline, results)
+        print(f"💾 Baseline saved to {args.baseline}")
+    elif baseline is None:
+        print(f"📂 No baseline at {args.baseline}; run with --save-baseline to create one.")
+
+    regressions = [row for row in rows if row[4]]
+    if regressions:
+        print(f"❌ {len(regressions)} benchmark(s) slower than the baseline by more than {args.threshold}%.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
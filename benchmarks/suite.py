@@ -0,0 +1,191 @@
+"""
+Benchmark suite.
+
+Every benchmark is a setup function registered with @benchmark. The setup
+receives a scratch directory and returns the zero-argument callable to
+time; everything it builds beforehand is not measured.
+
+Micro benchmarks time a single call of a hot function, macro benchmarks a
+full turn, a full game or a save round-trip.
+"""
+
+import os
+import random
+import subprocess
+import sys
+
+from game import save
+from game.player import Player
+from game.actions import ACTIONS
+from game.evenements import generate_event
+from game.engine import GameSession, step
+from game.gestion import check_conditions
+from game.save.json_file import JsonFileBackend
+
+
+MICRO = "micro"
+MACRO = "macro"
+
+BENCHMARKS = {}
+
+# Resources opened by the setups, released by teardown()
+_open_writers = []
+
+
+def benchmark(name, kind):
+    """
+    Register a benchmark setup function.
+
+    Args:
+        name (str): Unique benchmark name
+        kind (str): MICRO or MACRO
+    """
+    def register(setup):
+        BENCHMARKS[name] = (kind, setup)
+        return setup
+    return register
+
+
+def survival_policy(player, total_days):
+    """Simple policy that survives long games most of the time."""
+    if player.energy < 40:
+        return "2"
+    if player.thirst < player.hunger:
+        return "3"
+    return "1"
+
+
+@benchmark("player.update_gauges", MICRO)
+def bench_update_gauges(workdir):
+    player = Player(hunger=50, thirst=50, energy=50)
+    return lambda: player.update_gauges(-5, 5, -3)
+
+
+@benchmark("player.is_alive", MICRO)
+def bench_is_alive(workdir):
+    player = Player(hunger=50, thirst=50, energy=50)
+    return player.is_alive
+
+
+def _bench_action(number):
+    def setup(workdir):
+        player = Player(hunger=50, thirst=50, energy=50)
+        function = ACTIONS[number]["function"]
+        rng = random.Random(0)
+        return lambda: function(player, rng)
+    return setup
+
+
+for _number, _action in ACTIONS.items():
+    benchmark(f"actions.{_action['function'].__name__}", MICRO)(_bench_action(_number))
+
+
+@benchmark("evenements.generate_event", MICRO)
+def bench_generate_event(workdir):
+    player = Player(hunger=50, thirst=50, energy=50)
+    rng = random.Random(0)
+    return lambda: generate_event(player, rng)
+
+
+@benchmark("gestion.check_conditions", MICRO)
+def bench_check_conditions(workdir):
+    player = Player(hunger=50, thirst=50, energy=50, days_survived=5)
+    return lambda: check_conditions(player, player.days_survived, 10)
+
+
+@benchmark("engine.turn", MACRO)
+def bench_turn(workdir):
+    rng = random.Random(0)
+
+    def turn():
+        player = Player(hunger=60, thirst=60, energy=60)
+        step(player, "1", 50, rng)
+    return turn
+
+
+def _bench_game(total_days):
+    def setup(workdir):
+        def game():
+            GameSession(Player(), total_days, rng=random.Random(42)).run(survival_policy)
+        return game
+    return setup
+
+
+benchmark("engine.game_10_days", MACRO)(_bench_game(10))
+benchmark("engine.game_50_days", MACRO)(_bench_game(50))
+
+
+def _bench_choice(rng_factory):
+    def setup(workdir):
+        rng = rng_factory(0)
+        outcomes = ("success", "failure")
+        return lambda: rng.choice(outcomes)
+    return setup
+
+
+def _portable_rng(seed):
+    from game.rng import PortableRandom
+    return PortableRandom(seed)
+
+
+benchmark("rng.choice_random", MICRO)(_bench_choice(random.Random))
+benchmark("rng.choice_portable", MICRO)(_bench_choice(_portable_rng))
+
+
+@benchmark("traces.record_game_10_days", MACRO)
+def bench_record_game(workdir):
+    from game.traces import TraceWriter, record_chunk
+    writer = TraceWriter(os.path.join(workdir, "traces"))
+    _open_writers.append(writer)
+    return lambda: record_chunk(writer, 42, 0, 1, 10, survival_policy)
+
+
+def _bench_round_trip(backend_factory):
+    def setup(workdir):
+        backend = backend_factory(os.path.join(workdir, "save.json"))
+        save.set_backend(backend)
+        player = Player(hunger=55, thirst=70, energy=40, days_survived=12)
+
+        def round_trip():
+            save.save_game(player, player.days_survived, 50)
+            save.load_game()
+        return round_trip
+    return setup
+
+
+def _journal_backend(path):
+    from game.save.journal import JournalBackend
+    return JournalBackend(path)
+
+
+def _cached_backend(path):
+    from game.save.cache import SessionCache
+    cache = SessionCache(lambda key: JsonFileBackend(path))
+    _open_writers.append(cache)
+    return cache.backend("default")
+
+
+benchmark("save.round_trip_journal", MACRO)(_bench_round_trip(_journal_backend))
+benchmark("save.round_trip_json", MACRO)(_bench_round_trip(JsonFileBackend))
+benchmark("save.round_trip_cached", MACRO)(_bench_round_trip(_cached_backend))
+
+
+def _bench_startup(statement):
+    def setup(workdir):
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        env = dict(os.environ, PYTHONPATH=root)
+        command = [sys.executable, "-c", statement]
+        return lambda: subprocess.run(command, cwd=root, env=env, check=True)
+    return setup
+
+
+benchmark("startup.python", MACRO)(_bench_startup("pass"))
+benchmark("startup.from_game_import_player", MACRO)(_bench_startup("from game import Player"))
+benchmark("startup.import_game_gestion", MACRO)(_bench_startup("import game.gestion"))
+
+
+def teardown():
+    """Undo the global changes made by the setups (save backend, trace writers, caches)."""
+    save.set_backend(None)
+    while _open_writers:
+        _open_writers.pop().close()
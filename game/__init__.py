@@ -3,38 +3,67 @@ SurviveIsland game package.
 
 This package contains all the game modules:
 - player: Player class and statistics management
+- state: Packed game state for search and bulk storage
 - actions: Available player actions (fish, sleep, search_water, explore)
 - evenements: Random events system
+- engine: Headless turn engine (no terminal or disk I/O)
 - gestion: Main game loop and flow control
 - save: Save/load game system
+
+The names below are imported lazily, on first access, so that
+`from game import Player` only loads game.player and short-lived
+processes do not pay for the modules they never use.
 """
 
-from game.player import Player
-from game.actions import fish, sleep, search_water, explore
-from game.evenements import generate_event
-from game.save import save_game, load_game, delete_save
-from game.gestion import game_loop, display_gauges, choose_action, check_conditions
+import sys
+
 
-__all__ = [
+# Public name -> module defining it
+_EXPORTS = {
     # Player
-    'Player',
+    'Player': 'game.player',
+    'SlottedPlayer': 'game.player',
+    # Packed state
+    'PackedState': 'game.state',
+    'StateArray': 'game.state',
     # Actions
-    'fish',
-    'sleep',
-    'search_water',
-    'explore',
+    'fish': 'game.actions',
+    'sleep': 'game.actions',
+    'search_water': 'game.actions',
+    'explore': 'game.actions',
     # Events
-    'generate_event',
+    'generate_event': 'game.evenements',
+    # Headless engine
+    'step': 'game.engine',
+    'GameSession': 'game.engine',
+    'TurnOutcome': 'game.engine',
     # Save system
-    'save_game',
-    'load_game',
-    'delete_save',
+    'save_game': 'game.save',
+    'load_game': 'game.save',
+    'delete_save': 'game.save',
+    'record_game': 'game.save',
     # Game management
-    'game_loop',
-    'display_gauges',
-    'choose_action',
-    'check_conditions',
-]
+    'game_loop': 'game.gestion',
+    'display_gauges': 'game.gestion',
+    'choose_action': 'game.gestion',
+    'check_conditions': 'game.gestion',
+}
+
+__all__ = list(_EXPORTS)
 
 __version__ = '1.0.0'
 __author__ = 'LoicAND'
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module 'game' has no attribute {name!r}")
+    __import__(module)
+    value = getattr(sys.modules[module], name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
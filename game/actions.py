@@ -3,12 +3,19 @@ Player actions module.
 
 Contains all the actions a player can perform during the game:
 fishing, sleeping, searching for water, and exploring.
+Actions apply their effects and return a message instead of printing it,
+so they can be driven by the interactive loop or by the headless engine.
+The names, descriptions and outcomes of the actions are read from the
+built-in content file (game/content.json) and compiled into ACTION_EFFECTS
+(see game.content), which draws and applies the outcomes of every action.
 """
 
 import random
 
+from game.content import EffectTable, builtin_content
 
-def fish(player):
+
+def fish(player, rng=random):
     """
     Attempt to catch fish to restore hunger.
     
@@ -16,23 +23,19 @@ def fish(player):
     
     Args:
         player (Player): The player performing the action
+        rng (random.Random): Source of randomness (default: the random module)
+        
+    Returns:
+        str: Message describing the outcome
         
-    Effects:
+    Effects (built-in content):
         - Success: +20 hunger, -10 energy
         - Failure: -15 energy
     """
-    print("\n🎣 You try to fish...")
-    success = random.choice([True, False])
-    
-    if success:
-        print("✅ You caught a fish!")
-        player.update_gauges(delta_hunger=20, delta_energy=-10)
-    else:
-        print("❌ The fish got away...")
-        player.update_gauges(delta_energy=-15)
+    return ACTION_EFFECTS.run("1", player, rng)
 
 
-def sleep(player):
+def sleep(player, rng=random):
     """
     Sleep to restore energy.
     
@@ -40,16 +43,19 @@ def sleep(player):
     
     Args:
         player (Player): The player performing the action
+        rng (random.Random): Source of randomness, only drawn from when sleeping
+            has several outcomes (default: the random module)
         
-    Effects:
+    Returns:
+        str: Message describing the outcome
+        
+    Effects (built-in content):
         - +50 energy, -10 hunger, -10 thirst
     """
-    print("\n😴 You go to sleep...")
-    player.update_gauges(delta_energy=50, delta_hunger=-10, delta_thirst=-10)
-    print(f"✅ You slept well!")
+    return ACTION_EFFECTS.run("2", player, rng)
 
 
-def search_water(player):
+def search_water(player, rng=random):
     """
     Search for fresh water to reduce thirst.
     
@@ -57,23 +63,19 @@ def search_water(player):
     
     Args:
         player (Player): The player performing the action
+        rng (random.Random): Source of randomness (default: the random module)
+        
+    Returns:
+        str: Message describing the outcome
         
-    Effects:
+    Effects (built-in content):
         - Success: +30 thirst, -5 energy
         - Failure: -10 energy
     """
-    print("\n💧 You search for water...")
-    success = random.choice([True, False])
-    
-    if success:
-        print("✅ You found fresh water!")
-        player.update_gauges(delta_thirst=30, delta_energy=-5)
-    else:
-        print("❌ No water found...")
-        player.update_gauges(delta_energy=-10)
+    return ACTION_EFFECTS.run("3", player, rng)
 
 
-def explore(player):
+def explore(player, rng=random):
     """
     Explore the island to find resources.
     
@@ -82,23 +84,46 @@ def explore(player):
     
     Args:
         player (Player): The player performing the action
+        rng (random.Random): Source of randomness (default: the random module)
+        
+    Returns:
+        str: Message describing the outcome
         
-    Possible outcomes:
+    Possible outcomes (built-in content):
         - Find berries: +15 hunger, -10 energy
         - Find nothing: -15 energy
         - Find water source: +20 thirst, -10 energy
         - Get lost: -20 energy
     """
-    print("\n🗺️ You explore the island...")
-    events = [
-        ("You found some berries!", 15, 0, -10),
-        ("You found nothing useful...", 0, 0, -15),
-        ("You found a water source!", 0, 20, -10),
-        ("You got lost and wasted energy...", 0, 0, -20),
-    ]
-    
-    event = random.choice(events)
-    message, delta_hunger, delta_thirst, delta_energy = event
-    
-    print(f"📢 {message}")
-    player.update_gauges(delta_hunger=delta_hunger, delta_thirst=delta_thirst, delta_energy=delta_energy)
+    return ACTION_EFFECTS.run("4", player, rng)
+
+
+# Action key -> function applying it
+FUNCTIONS = {
+    "1": fish,
+    "2": sleep,
+    "3": search_water,
+    "4": explore,
+}
+
+# Action key -> name, description, function and outcomes
+# (message, delta_hunger, delta_thirst, delta_energy), drawn uniformly
+ACTIONS = {
+    key: dict(entry, function=FUNCTIONS[key])
+    for key, entry in builtin_content()["actions"].items()
+}
+
+
+def compile_actions():
+    """
+    Rebuild ACTION_EFFECTS after the outcomes of ACTIONS were changed.
+
+    Returns:
+        EffectTable: The new compiled table
+    """
+    global ACTION_EFFECTS
+    ACTION_EFFECTS = EffectTable.from_table(ACTIONS)
+    return ACTION_EFFECTS
+
+
+ACTION_EFFECTS = EffectTable.from_table(ACTIONS)
@@ -0,0 +1,358 @@
+"""
+Hint advisor module.
+
+Recommends an action for the current game state by searching the turn tree
+built from game.actions and EVENTS: the player picks the action (max
+node), then the action outcome and the random event are drawn (chance
+node), then the daily decay is applied.
+
+The search is an expectimax with iterative deepening under a time budget:
+it searches 1 turn ahead, then 2, and so on, keeping the result of the
+deepest search that finished in time. Leaves that are not the end of the
+game are scored by a quick estimate. Because many paths reach the same
+clamped gauges, searched values are stored in a transposition table with
+approximate LRU eviction (two generations), which is kept between hints.
+The table holds only ints and
+floats in plain dicts, which the garbage collector does not track, so a
+large table does not lengthen the collector's pauses.
+
+Values are win probabilities: surviving until the goal or being rescued.
+When the gauges lie on the lattice of game.solver and NumPy is available,
+the advisor reads the exact values of the optimal solution instead of
+searching (solved once per set of rules, then loaded from the solver's disk
+cache). Otherwise the values are exact only when the search reaches the
+goal day; below that, they are heuristic scores, not probabilities.
+
+The search checks its deadline at every node, so a hint overruns its
+budget by at most one node.
+"""
+
+import time
+from collections import namedtuple
+
+from game import content, engine
+from game.actions import ACTIONS
+from game.evenements import EVENTS
+
+
+DEFAULT_TIME_BUDGET = 0.03
+DEFAULT_TABLE_SIZE = 200_000
+# Largest lattice the exact solution is computed for (the built-in rules
+# need 21 x 21 x 101 states)
+MAX_SOLVER_STATES = 200_000
+
+
+def _rescue_probability():
+    total = sum(info["weight"] for info in EVENTS.values())
+    return sum(info["weight"] for info in EVENTS.values() if info.get("terminal")) / total
+
+
+# Probability of a rescue on any given turn
+RESCUE_PROBABILITY = _rescue_probability()
+
+
+Hint = namedtuple("Hint", ["action", "win_probability", "action_values", "depth", "exact"])
+Hint.__doc__ = """
+Recommendation of the advisor.
+
+Fields:
+    action (str): Recommended action ("1" to "4")
+    win_probability (float): Win probability when following the advice if
+        exact, otherwise a heuristic score between 0 and 1
+    action_values (dict): Value of every action, on the same scale
+    depth (int): Number of turns searched ahead
+    exact (bool): True if the values are exact (optimal solution, or a
+        search that reached the end of the game)
+"""
+
+
+class _Timeout(Exception):
+    pass
+
+
+def load_solution():
+    """
+    Get the exact solution of the current rules from game.solver.
+
+    Returns:
+        Solution: Values for up to game.solver.MAX_HORIZON remaining days,
+            or None without NumPy or when the lattice of the rules is too large
+    """
+    try:
+        from game import solver
+        from game.markov import Lattice
+    except ImportError:
+        return None
+    lattice = Lattice()
+    states = lattice.shape[0] * lattice.shape[1] * lattice.shape[2]
+    if states > MAX_SOLVER_STATES:
+        return None
+    return solver.solve()
+
+
+def _clamp(value):
+    return 0 if value < 0 else 100 if value > 100 else value
+
+
+def _compile_turns():
+    """
+    Combine action outcomes and events into one list of turn outcomes per action.
+
+    Returns:
+        dict: action -> (rescue_probability, [(probability, action_deltas, event_deltas)])
+    """
+    total = sum(info["weight"] for info in EVENTS.values())
+    events = []
+    for info in EVENTS.values():
+        outcomes = info["outcomes"]
+        for _, delta_hunger, delta_thirst, delta_energy in outcomes:
+            events.append((info["weight"] / total / len(outcomes), (delta_hunger, delta_thirst, delta_energy),
+                           info.get("terminal", False)))
+
+    turns = {}
+    for action, info in ACTIONS.items():
+        outcomes = info["outcomes"]
+        rescue = 0.0
+        rows = []
+        for _, delta_hunger, delta_thirst, delta_energy in outcomes:
+            for probability, event_deltas, is_rescue in events:
+                probability /= len(outcomes)
+                if is_rescue:
+                    rescue += probability
+                elif probability > 0:
+                    rows.append((probability, (delta_hunger, delta_thirst, delta_energy), event_deltas))
+        turns[action] = (rescue, rows)
+    return turns
+
+
+TURNS = _compile_turns()
+_generation = content.generation
+
+
+def refresh():
+    """
+    Recompile the turn tables if game.content installed new rules.
+
+    Returns:
+        bool: True if the tables were rebuilt
+    """
+    global TURNS, RESCUE_PROBABILITY, _generation
+    if _generation == content.generation:
+        return False
+    TURNS = _compile_turns()
+    RESCUE_PROBABILITY = _rescue_probability()
+    _generation = content.generation
+    return True
+
+
+def transitions(hunger, thirst, energy):
+    """
+    Outcomes of one turn from a state, for every action.
+
+    Args:
+        hunger, thirst, energy (int): Gauges at the start of the turn
+
+    Returns:
+        tuple: (action, rescue_probability, death_probability,
+            ((probability, hunger, thirst, energy), ...)) per action, with
+            identical surviving states merged
+    """
+    decay_hunger, decay_thirst, decay_energy = engine.DAILY_DECAY
+    result = []
+
+    for action, (rescue, rows) in TURNS.items():
+        dead = 0.0
+        children = {}
+        for probability, (ah, at, ae), (eh, et, ee) in rows:
+            h = _clamp(_clamp(_clamp(hunger + ah) + eh) + decay_hunger)
+            t = _clamp(_clamp(_clamp(thirst + at) + et) + decay_thirst)
+            e = _clamp(_clamp(_clamp(energy + ae) + ee) + decay_energy)
+            if h <= 0 or t <= 0 or e <= 0:
+                dead += probability
+            else:
+                state = (h, t, e)
+                children[state] = children.get(state, 0.0) + probability
+        result.append((action, rescue, dead, tuple((p, *state) for state, p in children.items())))
+
+    return tuple(result)
+
+
+def estimate(hunger, thirst, energy, days_left):
+    """
+    Heuristic score of a state, used at the search leaves.
+
+    The chance of a rescue before the goal is exact; the chance of
+    surviving otherwise grows with the lowest gauge, relative to what the
+    remaining days will cost. The score orders states but is not a
+    calibrated probability.
+
+    Returns:
+        float: Score between 0 and 1
+    """
+    no_rescue = (1 - RESCUE_PROBABILITY) ** days_left
+    margin = min(hunger, thirst, energy) / 100
+    survival = margin ** (0.25 * days_left)
+    return 1 - no_rescue * (1 - survival)
+
+
+class Advisor:
+    """
+    Expectimax hint advisor with a transposition table.
+    """
+
+    def __init__(self, time_budget=DEFAULT_TIME_BUDGET, table_size=DEFAULT_TABLE_SIZE, exact=True):
+        """
+        Initialize the advisor.
+
+        Args:
+            time_budget (float): Seconds allowed per hint (default: 0.03)
+            table_size (int): Maximum number of transposition table entries
+                (default: 200,000)
+            exact (bool): Use the exact solution of game.solver when it
+                applies; loading it is not counted in the time budget
+                (default: True)
+        """
+        self.time_budget = time_budget
+        self.table_size = table_size
+        # Two generations of (packed state -> packed value): entries used
+        # again are moved to the recent one, and the old one is dropped when
+        # the recent one is full
+        self.table = {}
+        self._old_table = {}
+        self.generation = content.generation
+        self.exact = exact
+        self.solution = None
+        self._solution_generation = None
+        self.nodes = 0
+        self._deadline = None
+
+    def prepare(self):
+        """
+        Load the exact solution of the current rules now rather than on the
+        first hint (solving takes a fraction of a second when it is not in
+        the solver's disk cache yet).
+        """
+        self._solution()
+
+    def _solution(self):
+        if not self.exact:
+            return None
+        if self._solution_generation != content.generation:
+            self.solution = load_solution()
+            self._solution_generation = content.generation
+        return self.solution
+
+    def _solved(self, player, total_days):
+        # Exact hint from the optimal solution, or None if it does not apply
+        solution = self._solution()
+        if solution is None or not solution.lattice.contains(player.hunger, player.thirst, player.energy):
+            return None
+        days_left = max(0, total_days - player.days_survived)
+        if days_left > solution.horizon:
+            return None
+        values = solution.action_values(player, total_days)
+        if not values:
+            return None
+        action = max(values, key=values.get)
+        return Hint(action, values[action], values, days_left, True)
+
+    def clear(self):
+        """Empty the transposition table."""
+        self.table.clear()
+        self._old_table.clear()
+
+    def advise(self, player, total_days, time_budget=None, max_depth=None):
+        """
+        Recommend an action.
+
+        Args:
+            player (Player): Current player (not modified)
+            total_days (int): Target number of days to survive
+            time_budget (float): Seconds allowed (default: the advisor's budget)
+            max_depth (int): Maximum number of turns searched (default: until the goal)
+
+        Returns:
+            Hint: Recommended action and values of the actions
+        """
+        refresh()
+        if self.generation != content.generation:
+            # Values searched under the previous rules
+            self.clear()
+            self.generation = content.generation
+
+        hint = self._solved(player, total_days)
+        if hint is not None:
+            return hint
+
+        budget = self.time_budget if time_budget is None else time_budget
+        self._deadline = time.perf_counter() + budget
+        self.nodes = 0
+
+        state = (player.hunger, player.thirst, player.energy)
+        days_left = max(0, total_days - player.days_survived)
+        limit = days_left if max_depth is None else min(days_left, max_depth)
+
+        best = None
+        depth = 1
+        while depth <= max(1, limit):
+            try:
+                values = self._root(state, days_left, depth)
+            except _Timeout:
+                if best is not None:
+                    break
+                # Even one turn did not fit: finish it anyway
+                self._deadline = None
+                values = self._root(state, days_left, depth)
+            action = max(values, key=values.get)
+            best = Hint(action, values[action], values, depth, depth >= days_left)
+            if best.exact:
+                break
+            depth += 1
+
+        return best
+
+    def _root(self, state, days_left, depth):
+        values = {}
+        for action, rescue, _, children in transitions(*state):
+            value = rescue
+            for probability, h, t, e in children:
+                value += probability * self._value(h, t, e, days_left - 1, depth - 1)
+            values[action] = value
+        return values
+
+    def _value(self, hunger, thirst, energy, days_left, depth):
+        if days_left == 0:
+            return 1.0
+        if depth == 0:
+            return estimate(hunger, thirst, energy, days_left)
+
+        # A search reaching the goal is exact, whatever depth was asked
+        depth = min(depth, days_left)
+        key = ((days_left * 101 + hunger) * 101 + thirst) * 101 + energy
+        table = self.table
+        # Entries pack the depth searched and the value: depth + value / 2
+        entry = table.get(key)
+        if entry is None:
+            entry = self._old_table.get(key)
+            if entry is not None:
+                table[key] = entry
+        if entry is not None and int(entry) >= depth:
+            return 2 * (entry - int(entry))
+
+        self.nodes += 1
+        if self._deadline is not None and time.perf_counter() > self._deadline:
+            raise _Timeout()
+
+        best = 0.0
+        for _, rescue, _, children in transitions(hunger, thirst, energy):
+            value = rescue
+            for probability, h, t, e in children:
+                value += probability * self._value(h, t, e, days_left - 1, depth - 1)
+            if value > best:
+                best = value
+
+        table[key] = depth + best / 2
+        if len(table) >= self.table_size // 2:
+            self._old_table = table
+            self.table = {}
+        return best
@@ -0,0 +1,176 @@
+"""
+Strategy bots module.
+
+A strategy is any callable (player, total_days) -> action number ("1" to
+"4"), the same signature as the policies of GameSession.run. This module
+provides built-in bots and the BOTS registry used by game.tournament.
+
+Bots may carry two optional attributes, used by the tournament to pick its
+fastest simulation path:
+- deterministic (bool): the action only depends on the game state
+  (default when missing: False)
+- uses_days (bool): the action depends on days_survived or total_days,
+  not only on the gauges (default when missing: True)
+"""
+
+import random
+
+from game.actions import ACTIONS
+
+
+FISH = "1"
+SLEEP = "2"
+SEARCH_WATER = "3"
+EXPLORE = "4"
+
+
+class RandomBot:
+    """
+    Picks one of the four actions uniformly at random.
+    """
+
+    deterministic = False
+    uses_days = False
+
+    def __init__(self, rng=random):
+        """
+        Initialize the bot.
+
+        Args:
+            rng (random.Random): Source of randomness (default: the random module)
+        """
+        self.rng = rng
+        self.actions = list(ACTIONS)
+
+    def __call__(self, player, total_days):
+        return self.rng.choice(self.actions)
+
+
+class ConstantBot:
+    """
+    Always plays the same action.
+    """
+
+    deterministic = True
+    uses_days = False
+
+    def __init__(self, action):
+        """
+        Initialize the bot.
+
+        Args:
+            action (str): Action number ("1" to "4")
+        """
+        if action not in ACTIONS:
+            raise ValueError(f"Unknown action: {action!r}")
+        self.action = action
+
+    def __call__(self, player, total_days):
+        return self.action
+
+
+class GreedyBot:
+    """
+    Restores the lowest gauge: fish for hunger, search water for thirst,
+    sleep for energy.
+
+    With rest_below set, the bot sleeps first whenever energy drops under
+    that level, since every other action costs energy.
+    """
+
+    deterministic = True
+    uses_days = False
+
+    def __init__(self, rest_below=0):
+        """
+        Initialize the bot.
+
+        Args:
+            rest_below (int): Energy level under which the bot always sleeps (default: 0)
+        """
+        self.rest_below = rest_below
+
+    def __call__(self, player, total_days):
+        if player.energy < self.rest_below:
+            return SLEEP
+        lowest = min(player.hunger, player.thirst, player.energy)
+        if player.energy == lowest:
+            return SLEEP
+        if player.thirst == lowest:
+            return SEARCH_WATER
+        return FISH
+
+
+class ThresholdBot:
+    """
+    Fixed priority rules: sleep when energy is under sleep_below, otherwise
+    search water when thirst is under water_below, otherwise fish when hunger
+    is under fish_below, otherwise play the fallback action.
+    """
+
+    deterministic = True
+    uses_days = False
+
+    def __init__(self, sleep_below=40, water_below=60, fish_below=60, fallback=EXPLORE):
+        """
+        Initialize the bot.
+
+        Args:
+            sleep_below (int): Energy threshold for sleeping (default: 40)
+            water_below (int): Thirst threshold for searching water (default: 60)
+            fish_below (int): Hunger threshold for fishing (default: 60)
+            fallback (str): Action when no rule applies (default: explore)
+        """
+        self.sleep_below = sleep_below
+        self.water_below = water_below
+        self.fish_below = fish_below
+        self.fallback = fallback
+
+    def __call__(self, player, total_days):
+        if player.energy < self.sleep_below:
+            return SLEEP
+        if player.thirst < self.water_below:
+            return SEARCH_WATER
+        if player.hunger < self.fish_below:
+            return FISH
+        return self.fallback
+
+
+def _build_registry():
+    bots = {
+        "random": RandomBot(),
+        "always_fish": ConstantBot(FISH),
+        "always_sleep": ConstantBot(SLEEP),
+        "always_water": ConstantBot(SEARCH_WATER),
+        "always_explore": ConstantBot(EXPLORE),
+        "greedy_lowest": GreedyBot(),
+        "greedy_rest30": GreedyBot(rest_below=30),
+        "greedy_rest50": GreedyBot(rest_below=50),
+    }
+    for sleep_below in (25, 40, 55):
+        for level in (40, 60, 80):
+            bots[f"threshold_s{sleep_below}_g{level}"] = ThresholdBot(sleep_below, level, level)
+    bots["threshold_s40_g60_fish"] = ThresholdBot(40, 60, 60, fallback=FISH)
+    bots["threshold_s40_g60_water"] = ThresholdBot(40, 60, 60, fallback=SEARCH_WATER)
+    bots["threshold_s40_g60_sleep"] = ThresholdBot(40, 60, 60, fallback=SLEEP)
+    return bots
+
+
+# Built-in bots by name
+BOTS = _build_registry()
+
+
+def get_bot(name):
+    """
+    Look up a built-in bot.
+
+    Args:
+        name (str): Key of the bot in BOTS
+
+    Returns:
+        callable: The strategy
+
+    Raises:
+        KeyError: If there is no such bot
+    """
+    return BOTS[name]
@@ -0,0 +1,491 @@
+"""
+Game content module.
+
+The actions, events and daily decay of the game are data: the built-in
+content is game/content.json, read once at import by game.actions,
+game.evenements and game.engine. Custom content can be loaded from another
+data file (JSON, or TOML with Python 3.11+). The action and event tables
+are compiled into flat effect tables.
+
+An EffectTable holds one row per outcome:
+    (delta_hunger, delta_thirst, delta_energy, message_id, terminal)
+grouped by action or event. Drawing a row and applying it is the same for
+every action and event (EffectTable.run), so custom content needs no code.
+Within a group, outcomes are drawn uniformly like rng.choice, and a group
+with a single outcome consumes no random number, so seeded games are
+unchanged. Outcomes have no probability or weight of their own: to make
+an outcome more likely, list it several times.
+
+Data file format:
+    {
+        "actions": {
+            "1": {"name": "fish", "description": "🎣 You try to fish...",
+                  "outcomes": [{"id": "fish_caught", "message": "✅ You caught a fish!",
+                                "hunger": 20, "energy": -10}, ...]},
+            ...
+        },
+        "events": {
+            "rain": {"weight": 2, "description": "A tropical rain falls...",
+                     "outcomes": [{"message": "🌧️ ...", "thirst": 25}]},
+            "boat_rescue": {"weight": 1, "terminal": true, ...},
+            ...
+        },
+        "decay": {"hunger": -5, "thirst": -5, "energy": -3}
+    }
+Missing gauge deltas default to 0. The optional "id" of an outcome names it
+for code that refers to specific outcomes (the resource claims of
+game.island), whatever its message and position; an outcome listed several
+times keeps its id. Actions may only redefine the four menu
+actions; events replace the whole event table; decay is the gauge change
+applied at the end of every day. Every section is optional in a custom
+file; the built-in file defines all three.
+
+install() swaps the content of a running process in place, and
+ContentReloader reloads a data file whenever it changes on disk.
+
+Usage:
+    python -m game.content export PATH
+    python -m game.content check PATH
+"""
+
+import os
+import random
+
+
+BUILTIN_CONTENT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "content.json")
+
+
+# Fields of an effect row
+DELTA_HUNGER = 0
+DELTA_THIRST = 1
+DELTA_ENERGY = 2
+MESSAGE_ID = 3
+TERMINAL = 4
+
+GAUGES = ("hunger", "thirst", "energy")
+# Fields an outcome of a data file may have
+OUTCOME_FIELDS = ("id", "message") + GAUGES
+
+# Incremented every time install() changes the rules
+generation = 0
+
+# Decoded built-in content file, read on first use
+_builtin_data = None
+
+
+class EffectTable:
+    """
+    Flat table of outcome rows, grouped by action or event name.
+
+    Attributes:
+        rows (list): Every row, in table order
+        messages (list): Message texts, indexed by message id
+        groups (dict): name -> tuple of the rows of that action or event
+        terminal (dict): name -> True if the group ends the game (rescue)
+    """
+
+    def __init__(self, groups):
+        """
+        Compile outcome tables.
+
+        Args:
+            groups (iterable): (name, outcomes, terminal) triples, where
+                outcomes is a list of (message, delta_hunger, delta_thirst, delta_energy)
+
+        Raises:
+            ValueError: If a group has no outcome
+        """
+        self.rows = []
+        self.messages = []
+        self.groups = {}
+        self.terminal = {}
+        message_ids = {}
+
+        for name, outcomes, terminal in groups:
+            if not outcomes:
+                raise ValueError(f"{name!r} has no outcome.")
+            terminal = bool(terminal)
+            rows = []
+            for message, delta_hunger, delta_thirst, delta_energy in outcomes:
+                message_id = message_ids.get(message)
+                if message_id is None:
+                    message_id = message_ids[message] = len(self.messages)
+                    self.messages.append(message)
+                rows.append((delta_hunger, delta_thirst, delta_energy, message_id, terminal))
+            self.rows.extend(rows)
+            self.groups[name] = tuple(rows)
+            self.terminal[name] = terminal
+
+    @classmethod
+    def from_table(cls, table):
+        """
+        Compile an ACTIONS or EVENTS table.
+
+        Args:
+            table (dict): name -> entry with "outcomes" and an optional "terminal" flag
+
+        Returns:
+            EffectTable: The compiled table
+        """
+        return cls((name, info["outcomes"], info.get("terminal", False)) for name, info in table.items())
+
+    def draw(self, name, rng=random):
+        """
+        Pick one outcome row of an action or event.
+
+        Args:
+            name (str): Action or event key
+            rng (random.Random): Source of randomness (default: the random module)
+
+        Returns:
+            tuple: The chosen row
+
+        Raises:
+            KeyError: If there is no such group
+        """
+        rows = self.groups[name]
+        if len(rows) == 1:
+            return rows[0]
+        return rng.choice(rows)
+
+    def apply(self, row, player):
+        """
+        Apply one outcome row to the player.
+
+        Args:
+            row (tuple): Row of this table
+            player (Player): The player affected
+
+        Returns:
+            str: Message of the outcome
+        """
+        player.update_gauges(row[DELTA_HUNGER], row[DELTA_THIRST], row[DELTA_ENERGY])
+        return self.messages[row[MESSAGE_ID]]
+
+    def run(self, name, player, rng=random):
+        """
+        Draw and apply one outcome of an action or event.
+
+        Args:
+            name (str): Action or event key
+            player (Player): The player affected
+            rng (random.Random): Source of randomness (default: the random module)
+
+        Returns:
+            str: Message of the outcome
+        """
+        rows = self.groups[name]
+        row = rows[0] if len(rows) == 1 else rng.choice(rows)
+        player.update_gauges(row[DELTA_HUNGER], row[DELTA_THIRST], row[DELTA_ENERGY])
+        return self.messages[row[MESSAGE_ID]]
+
+
+def _outcome(where, outcome):
+    if not isinstance(outcome, dict) or not isinstance(outcome.get("message"), str):
+        raise ValueError(f"{where}: an outcome needs a \"message\" text.")
+    unknown = [field for field in outcome if field not in OUTCOME_FIELDS]
+    if unknown:
+        raise ValueError(f"{where}: unknown outcome field(s) {', '.join(map(repr, unknown))}, expected "
+                         f"{', '.join(OUTCOME_FIELDS)}. Outcomes are equally likely: list one several "
+                         f"times to make it more likely.")
+    deltas = []
+    for gauge in GAUGES:
+        delta = outcome.get(gauge, 0)
+        if isinstance(delta, bool) or not isinstance(delta, int):
+            raise ValueError(f"{where}: {gauge} must be an integer.")
+        deltas.append(delta)
+    return (outcome["message"], *deltas)
+
+
+def _outcomes(where, entry):
+    if not isinstance(entry, dict):
+        raise ValueError(f"{where}: expected a table.")
+    outcomes = entry.get("outcomes")
+    if not isinstance(outcomes, list) or not outcomes:
+        raise ValueError(f"{where}: \"outcomes\" must be a non-empty list.")
+    return [_outcome(where, outcome) for outcome in outcomes]
+
+
+def _outcome_ids(where, entry):
+    ids = tuple(outcome.get("id") for outcome in entry["outcomes"])
+    if not all(outcome_id is None or isinstance(outcome_id, str) for outcome_id in ids):
+        raise ValueError(f"{where}: an outcome id must be a string.")
+    return ids
+
+
+def parse_content(data, builtin=False):
+    """
+    Check and normalize content read from a data file.
+
+    Args:
+        data (dict): Decoded data file
+        builtin (bool): The data defines the actions instead of overriding
+            the current ones, so every action needs a name and a description
+            (default: False)
+
+    Returns:
+        dict: {"actions": {key: entry}, "events": {name: entry}, "decay": tuple or None}
+            with entries shaped like ACTIONS and EVENTS ("outcomes" as tuples,
+            "ids" as the outcome ids, None for the outcomes without one)
+
+    Raises:
+        ValueError: If the content is invalid
+    """
+    if builtin:
+        current = {}
+    else:
+        from game.actions import ACTIONS as current
+
+    if not isinstance(data, dict):
+        raise ValueError("Content must be a table with \"actions\" and \"events\".")
+
+    actions = {}
+    for key, entry in (data.get("actions") or {}).items():
+        if not builtin and key not in current:
+            raise ValueError(f"actions.{key}: unknown action, expected one of {', '.join(current)}.")
+        outcomes = _outcomes(f"actions.{key}", entry)
+        defaults = current.get(key, {})
+        actions[key] = {
+            "name": entry.get("name", defaults.get("name")),
+            "description": entry.get("description", defaults.get("description")),
+            "outcomes": outcomes,
+            "ids": _outcome_ids(f"actions.{key}", entry),
+        }
+        if not isinstance(actions[key]["name"], str) or not isinstance(actions[key]["description"], str):
+            raise ValueError(f"actions.{key}: a \"name\" and a \"description\" are required.")
+
+    events = {}
+    for name, entry in (data.get("events") or {}).items():
+        outcomes = _outcomes(f"events.{name}", entry)
+        weight = entry.get("weight", 1)
+        if isinstance(weight, bool) or not isinstance(weight, (int, float)) or weight < 0:
+            raise ValueError(f"events.{name}: weight must be a number >= 0.")
+        events[name] = {
+            "weight": weight,
+            "description": entry.get("description", ""),
+            "function": None,
+            "outcomes": outcomes,
+            "ids": _outcome_ids(f"events.{name}", entry),
+            "terminal": bool(entry.get("terminal", False)),
+        }
+
+    if "events" in data and not sum(info["weight"] for info in events.values()):
+        raise ValueError("events: total of event weights must be greater than zero.")
+
+    decay = None
+    if data.get("decay") is not None:
+        if not isinstance(data["decay"], dict):
+            raise ValueError("decay: expected a table of gauge changes.")
+        decay = _outcome("decay", dict(data["decay"], message=""))[1:]
+
+    return {"actions": actions, "events": events, "decay": decay}
+
+
+def load_content(path):
+    """
+    Read and check a content file.
+
+    Args:
+        path (str): .json file, or .toml file (Python 3.11+)
+
+    Returns:
+        dict: Normalized content (see parse_content)
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the file is not valid content
+    """
+    if path.endswith(".toml"):
+        import tomllib
+        with open(path, "rb") as f:
+            data = tomllib.load(f)
+    else:
+        import json
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    return parse_content(data)
+
+
+def builtin_content():
+    """
+    Read the built-in content (game/content.json).
+
+    The file is decoded once; every call returns new tables, so installing
+    other content never alters them.
+
+    Returns:
+        dict: Normalized content (see parse_content)
+
+    Raises:
+        ValueError: If the file is not valid content
+    """
+    global _builtin_data
+    if _builtin_data is None:
+        # Imported here: only the first call pays for the json module
+        import json
+        with open(BUILTIN_CONTENT, "r", encoding="utf-8") as f:
+            _builtin_data = json.load(f)
+    content = parse_content(_builtin_data, builtin=True)
+    if not content["actions"] or not content["events"] or content["decay"] is None:
+        raise ValueError(f"{BUILTIN_CONTENT}: actions, events and decay are required.")
+    return content
+
+
+def export_content():
+    """
+    Describe the current actions and events in the data file format.
+
+    Returns:
+        dict: Content that can be written as JSON and loaded back
+    """
+    from game.actions import ACTIONS
+    from game.evenements import EVENTS
+    from game.engine import DAILY_DECAY
+
+    def outcomes(info):
+        ids = info.get("ids") or (None,) * len(info["outcomes"])
+        exported = []
+        for outcome_id, outcome in zip(ids, info["outcomes"]):
+            entry = {} if outcome_id is None else {"id": outcome_id}
+            entry.update(zip(("message",) + GAUGES, outcome))
+            exported.append(entry)
+        return exported
+
+    content = {"actions": {}, "events": {}, "decay": dict(zip(GAUGES, DAILY_DECAY))}
+    for key, info in ACTIONS.items():
+        content["actions"][key] = {
+            "name": info["name"],
+            "description": info["description"],
+            "outcomes": outcomes(info),
+        }
+    for name, info in EVENTS.items():
+        entry = {"weight": info["weight"], "description": info["description"], "outcomes": outcomes(info)}
+        if info.get("terminal"):
+            entry["terminal"] = True
+        content["events"][name] = entry
+    return content
+
+
+def install(content):
+    """
+    Replace the rules of the running process.
+
+    Actions keep their functions and only get new outcomes. Events are
+    replaced as a whole and applied by the generic effect applier. The
+    compiled tables are rebuilt, so games in progress use the new rules
+    from their next turn. Sections missing from the content are kept.
+
+    Args:
+        content (dict): Normalized content (see parse_content)
+    """
+    global generation
+    from game import actions, engine
+    from game.evenements import EVENTS
+
+    for key, entry in content["actions"].items():
+        actions.ACTIONS[key].update(entry)
+    if content["actions"]:
+        actions.compile_actions()
+
+    if content["events"]:
+        # One atomic swap: the registry recompiles on its next draw
+        dict.clear(EVENTS)
+        dict.update(EVENTS, content["events"])
+        EVENTS.touch()
+
+    if content.get("decay") is not None:
+        engine.DAILY_DECAY = tuple(content["decay"])
+
+    generation += 1
+
+
+class ContentReloader:
+    """
+    Reloads a content file when its modification time changes.
+    """
+
+    def __init__(self, path):
+        """
+        Args:
+            path (str): Content file to watch
+        """
+        self.path = path
+        self.mtime = None
+        self.error = None
+
+    def poll(self):
+        """
+        Read the file if it changed since the last check, without installing it.
+
+        Only touches the disk, so it can run in a worker thread. An invalid
+        file is reported in `error`.
+
+        Returns:
+            dict: Normalized content (see parse_content), or None if the
+                file did not change or is invalid
+        """
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except OSError as error:
+            self.error = error
+            return None
+        if mtime == self.mtime:
+            return None
+        self.mtime = mtime
+
+        try:
+            content = load_content(self.path)
+        except (OSError, ValueError) as error:
+            self.error = error
+            return None
+        self.error = None
+        return content
+
+    def check(self):
+        """
+        Install the file if it changed since the last check.
+
+        An invalid file is reported in `error` and the current rules are kept.
+
+        Returns:
+            bool: True if new content was installed
+        """
+        content = self.poll()
+        if content is None:
+            return False
+        install(content)
+        return True
+
+
+def main():
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="SurviveIsland content files")
+    commands = parser.add_subparsers(dest="command", required=True)
+    export = commands.add_parser("export", help="write the built-in content to a JSON file")
+    export.add_argument("path")
+    check = commands.add_parser("check", help="check a content file")
+    check.add_argument("path")
+    args = parser.parse_args()
+
+    if args.command == "export":
+        with open(args.path, "w", encoding="utf-8") as f:
+            json.dump(export_content(), f, ensure_ascii=False, indent=2)
+            f.write("\n")
+        print(f"✅ Content written to {args.path}")
+        return 0
+
+    try:
+        content = load_content(args.path)
+    except (OSError, ValueError) as error:
+        print(f"❌ {args.path}: {error}")
+        return 1
+    table = EffectTable.from_table(content["events"]) if content["events"] else None
+    print(f"✅ {args.path}: {len(content['actions'])} action(s), {len(content['events'])} event(s)"
+          + (f", {len(table.rows)} event outcome rows" if table else ""))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
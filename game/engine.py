@@ -0,0 +1,216 @@
+"""
+Headless game engine module.
+
+Advances a game turn by turn without any terminal or disk I/O.
+Actions and events are applied through the regular game modules, and their
+messages are returned as structured data so that any front end (console,
+server, simulation) decides what to display or persist.
+"""
+
+import random
+from collections import namedtuple
+
+from game import metrics
+from game.player import Player
+from game.actions import ACTIONS
+from game.content import builtin_content
+from game.evenements import EVENT_REGISTRY, draw_event, apply_event
+
+
+# Gauge decay applied at the end of every day (hunger, thirst, energy),
+# from the built-in content file
+DAILY_DECAY = builtin_content()["decay"]
+
+# Game status values
+ONGOING = "ongoing"
+VICTORY = "victory"
+RESCUED = "rescued"
+DEAD = "dead"
+
+
+TurnOutcome = namedtuple(
+    "TurnOutcome",
+    ["action", "action_message", "event", "event_message", "status", "causes"]
+)
+TurnOutcome.__doc__ = """
+Result of a single turn.
+
+Fields:
+    action (str): The action played ("1" to "4")
+    action_message (str): Message returned by the action
+    event (str): Key of the random event in EVENTS
+    event_message (str): Message returned by the event
+    status (str): Game status after the turn (ONGOING, VICTORY, RESCUED or DEAD)
+    causes (tuple): Names of the depleted gauges when status is DEAD
+"""
+
+
+def death_causes(player):
+    """
+    List the vital statistics that are depleted.
+
+    Args:
+        player (Player): The player to inspect
+
+    Returns:
+        tuple: Gauge names ("hunger", "thirst", "energy") that reached 0
+    """
+    causes = []
+    if player.hunger <= 0:
+        causes.append("hunger")
+    if player.thirst <= 0:
+        causes.append("thirst")
+    if player.energy <= 0:
+        causes.append("energy")
+    return tuple(causes)
+
+
+def check_status(player, current_day, total_days):
+    """
+    Compute the game status without producing any message.
+
+    Args:
+        player (Player): The player to check
+        current_day (int): Current day in the game
+        total_days (int): Target number of days to survive
+
+    Returns:
+        tuple: (status, causes)
+            - status (str): DEAD, VICTORY or ONGOING
+            - causes (tuple): Depleted gauges when DEAD, empty otherwise
+    """
+    if not player.is_alive():
+        return DEAD, death_causes(player)
+
+    if current_day >= total_days:
+        return VICTORY, ()
+
+    return ONGOING, ()
+
+
+def step(player, action, total_days, rng=random):
+    """
+    Play one full turn: action, random event, daily decay and end checks.
+
+    The player is updated in place. Nothing is printed or saved.
+
+    Args:
+        player (Player): The player taking the turn
+        action (str): Action number ("1" to "4")
+        total_days (int): Target number of days to survive
+        rng (random.Random): Source of randomness (default: the random module)
+
+    Returns:
+        tuple: (player, TurnOutcome)
+
+    Raises:
+        KeyError: If the action is unknown
+    """
+    instrumented = metrics.enabled
+    if instrumented:
+        start = metrics.clock()
+
+    action_message = ACTIONS[action]["function"](player, rng)
+
+    if instrumented:
+        after_action = metrics.clock()
+
+    event = draw_event(rng)
+    event_message = apply_event(event, player, rng)
+
+    if instrumented:
+        metrics.record_turn(action, event, start, after_action, metrics.clock())
+
+    if EVENT_REGISTRY.terminal[event]:
+        if instrumented:
+            metrics.record_end(RESCUED)
+        return player, TurnOutcome(action, action_message, event, event_message, RESCUED, ())
+
+    player.update_gauges(*DAILY_DECAY)
+
+    # Each action = 1 day
+    player.days_survived += 1
+
+    status, causes = check_status(player, player.days_survived, total_days)
+    if instrumented and status != ONGOING:
+        metrics.record_end(status, causes)
+    return player, TurnOutcome(action, action_message, event, event_message, status, causes)
+
+
+class GameSession:
+    """
+    A single game driven through the headless engine.
+
+    Holds the player, the survival goal and the random source, and keeps
+    track of the game status so callers only have to feed actions.
+    """
+
+    def __init__(self, player=None, total_days=10, rng=None, seed=None):
+        """
+        Initialize a new session.
+
+        Args:
+            player (Player): Player to use (default: a fresh Player)
+            total_days (int): Target number of days to survive (default: 10)
+            rng (random.Random): Source of randomness (default: the random module,
+                or a new random.Random(seed) when a seed is given)
+            seed (int): Seed for a private random generator (default: None)
+        """
+        if rng is None:
+            rng = random.Random(seed) if seed is not None else random
+
+        self.player = player if player is not None else Player()
+        self.total_days = total_days
+        self.rng = rng
+        self.status, self.causes = check_status(self.player, self.player.days_survived, total_days)
+
+    @property
+    def finished(self):
+        """bool: True once the game reached victory, rescue or death."""
+        return self.status != ONGOING
+
+    def play(self, action):
+        """
+        Play one turn with the given action.
+
+        Args:
+            action (str): Action number ("1" to "4")
+
+        Returns:
+            TurnOutcome: Structured description of the turn
+
+        Raises:
+            ValueError: If the game is over or the action is unknown
+        """
+        if self.status != ONGOING:
+            raise ValueError("The game is already over.")
+        if action not in ACTIONS:
+            raise ValueError(f"Unknown action: {action!r}")
+
+        _, outcome = step(self.player, action, self.total_days, self.rng)
+        self.status = outcome.status
+        self.causes = outcome.causes
+        return outcome
+
+    def run(self, policy):
+        """
+        Play until the game ends, asking a policy for every action.
+
+        Args:
+            policy (callable): Function (player, total_days) -> action number
+
+        Returns:
+            str: Final game status
+        """
+        player = self.player
+        total_days = self.total_days
+        rng = self.rng
+        status = self.status
+
+        while status == ONGOING:
+            _, outcome = step(player, policy(player, total_days), total_days, rng)
+            status = outcome.status
+            self.causes = outcome.causes
+
+        self.status = status
+        return status
@@ -2,82 +2,260 @@
 Random events module.
 
 Manages random events that occur after each player action.
-Events are weighted to control their probability of occurrence.
+Events are weighted to control their probability of occurrence. Their
+weights, descriptions and outcomes are read from the built-in content file
+(game/content.json). The EVENTS table is compiled once into an
+EventRegistry (cumulative weights, direct function references and an
+EffectTable of the outcomes), which is rebuilt only when EVENTS changes.
+
+Events are applied by the generic effect applier, so events (built-in or
+custom, see game.content) only need data; an entry may give a callable
+"function" (player, rng) -> message instead. Events flagged "terminal"
+end the game with a rescue.
 """
 
 import random
+from bisect import bisect
+from itertools import accumulate
 
+from game import metrics
+from game.content import EffectTable, builtin_content
 
-EVENTS = {
-    "rain": {
-        "weight": 2,
-        "description": "A tropical rain falls...",
-        "function": "rain"
-    },
-    "animal_encounter": {
-        "weight": 2,
-        "description": "You encounter a wild animal!",
-        "function": "animal_encounter"
-    },
-    "fruit_found": {
-        "weight": 3,
-        "description": "You find some delicious fruits!",
-        "function": "fruit_found"
-    },
-    "injury": {
-        "weight": 1,
-        "description": "You got injured!",
-        "function": "injury"
-    },
-    "nothing": {
-        "weight": 2,
-        "description": "Nothing interesting happens...",
-        "function": "nothing"
-    },
-    "boat_rescue": {
-        "weight": 1,
-        "description": "A rescue boat spots you!",
-        "function": "boat_rescue"
-    }
-}
 
+class EventTable(dict):
+    """
+    Dictionary of events that keeps track of its modifications.
+    
+    Every change made through the dict API increments `version`, which lets
+    EventRegistry know when it has to recompile. Changes made inside an
+    event entry (e.g. EVENTS["rain"]["weight"] = 5) must go through
+    set_weight() or be followed by touch().
+    """
+    
+    version = 0
+    
+    def touch(self):
+        """Mark the table as modified."""
+        self.version += 1
+    
+    def set_weight(self, event_name, weight):
+        """
+        Change the weight of an event.
+        
+        Args:
+            event_name (str): Key of the event
+            weight (float): New weight (0 disables the event)
+        """
+        self[event_name]["weight"] = weight
+        self.touch()
+    
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.touch()
+    
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.touch()
+    
+    def __ior__(self, other):
+        result = super().__ior__(other)
+        self.touch()
+        return result
+    
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self.touch()
+    
+    def setdefault(self, key, default=None):
+        result = super().setdefault(key, default)
+        self.touch()
+        return result
+    
+    def pop(self, *args):
+        result = super().pop(*args)
+        self.touch()
+        return result
+    
+    def popitem(self):
+        result = super().popitem()
+        self.touch()
+        return result
+    
+    def clear(self):
+        super().clear()
+        self.touch()
 
 
-def rain(player):
-    player.update_gauges(delta_thirst=25)
-    return "🌧️ A tropical rain falls, your thirst decreases significantly."
+# Event name -> weight, description and outcomes (message, delta_hunger,
+# delta_thirst, delta_energy), drawn uniformly; "terminal" events end the
+# game with a rescue
+EVENTS = EventTable(builtin_content()["events"])
 
 
-def animal_encounter(player):
-    choice = random.choice(["flee", "hunt"])
+class EventRegistry:
+    """
+    Compiled form of an event table, used to draw events quickly.
+    
+    Holds the event names, their cumulative weights, the event functions
+    resolved once and the EffectTable of the outcomes. Drawing consumes
+    exactly one rng.random() per event, like random.choices with the same
+    weights, so seeded games are unchanged.
+    """
+    
+    def __init__(self, events):
+        """
+        Initialize the registry.
+        
+        Args:
+            events (EventTable): Table of events to compile
+        """
+        self.events = events
+        self.version = None
+        self.names = []
+        self.functions = {}
+        self.cum_weights = []
+        self.total = 0.0
+        self.hi = 0
+        self.effects = None
+        self.terminal = {}
+    
+    def compile(self):
+        """Rebuild the cumulative weights, function references and effect table from the table."""
+        names = list(self.events.keys())
+        if not names:
+            raise ValueError("The event table is empty.")
+        
+        effects = EffectTable.from_table(self.events)
+        functions = {}
+        for name in names:
+            function = self.events[name].get("function")
+            if function is None:
+                functions[name] = _generic_function(effects, name)
+            else:
+                functions[name] = function
+        
+        self.effects = effects
+        self.terminal = effects.terminal
+        self.names = names
+        self.functions = functions
+        self.cum_weights = list(accumulate(self.events[name]["weight"] for name in names))
+        self.total = self.cum_weights[-1] + 0.0
+        if self.total <= 0.0:
+            raise ValueError("Total of event weights must be greater than zero.")
+        self.hi = len(names) - 1
+        self.version = self.events.version
+    
+    def draw(self, rng=random):
+        """
+        Pick one random event name.
+        
+        Args:
+            rng (random.Random): Source of randomness (default: the random module)
+            
+        Returns:
+            str: Key of the chosen event
+        """
+        if self.version != self.events.version:
+            self.compile()
+        return self.names[bisect(self.cum_weights, rng.random() * self.total, 0, self.hi)]
     
-    if choice == "flee":
-        player.update_gauges(delta_energy=-20)
-        return "🐯 You encounter a wild animal and flee in panic! You lose energy."
-    else:
-        player.update_gauges(delta_hunger=30, delta_energy=-25)
-        return "🐯 You encounter a wild animal and manage to hunt it! You gain food but lose energy."
+    def draw_many(self, k, rng=random):
+        """
+        Pick k random event names in one call.
+        
+        Args:
+            k (int): Number of events to draw
+            rng (random.Random): Source of randomness (default: the random module)
+            
+        Returns:
+            list: k event keys, in the order they would be drawn one by one
+        """
+        if self.version != self.events.version:
+            self.compile()
+        names, cum_weights, total, hi = self.names, self.cum_weights, self.total, self.hi
+        draw = rng.random
+        return [names[bisect(cum_weights, draw() * total, 0, hi)] for _ in range(k)]
+    
+    def function(self, event_name):
+        """
+        Get the function applying an event.
+        
+        Args:
+            event_name (str): Key of the event
+            
+        Returns:
+            callable: Event function (player, rng) -> message
+        """
+        if self.version != self.events.version:
+            self.compile()
+        return self.functions[event_name]
+    
+    def effect_table(self):
+        """
+        Get the compiled outcomes of the events.
+        
+        Returns:
+            EffectTable: Outcome rows grouped by event name
+        """
+        if self.version != self.events.version:
+            self.compile()
+        return self.effects
 
 
-def fruit_found(player):
-    player.update_gauges(delta_hunger=20)
-    return "🍎 You find some delicious fruits! Your hunger decreases."
+def _generic_function(effects, event_name):
+    # Specialized appliers: no draw for a single outcome, no update for no effect
+    rows = effects.groups[event_name]
+    messages = effects.messages
+    if len(rows) == 1:
+        delta_hunger, delta_thirst, delta_energy, message_id, _ = rows[0]
+        message = messages[message_id]
+        if not (delta_hunger or delta_thirst or delta_energy):
+            return lambda player, rng=random: message
 
+        def apply_single(player, rng=random):
+            player.update_gauges(delta_hunger, delta_thirst, delta_energy)
+            return message
+        return apply_single
 
-def injury(player):
-    player.update_gauges(delta_energy=-30)
-    return "🩹 You got injured while exploring! You lose a lot of energy."
+    def apply(player, rng=random):
+        row = rng.choice(rows)
+        player.update_gauges(row[0], row[1], row[2])
+        return messages[row[3]]
+    return apply
 
 
-def nothing(player):
-    return "😐 Nothing interesting happens on this day..."
+EVENT_REGISTRY = EventRegistry(EVENTS)
 
 
-def boat_rescue(player):
-    return "RESCUE"
+def draw_event(rng=random):
+    """
+    Pick a random event name according to the weights defined in EVENTS.
+    
+    Args:
+        rng (random.Random): Source of randomness (default: the random module)
+        
+    Returns:
+        str: Key of the chosen event in EVENTS
+    """
+    return EVENT_REGISTRY.draw(rng)
 
 
-def generate_event(player):
+def apply_event(event_name, player, rng=random):
+    """
+    Apply a given event to the player.
+    
+    Args:
+        event_name (str): Key of the event in EVENTS
+        player (Player): The player affected by the event
+        rng (random.Random): Source of randomness (default: the random module)
+        
+    Returns:
+        str: Message describing the event outcome, or "RESCUE" for boat rescue
+    """
+    return EVENT_REGISTRY.function(event_name)(player, rng)
+
+
+def generate_event(player, rng=random):
     """
     Generate and apply a random event to the player.
     
@@ -86,11 +264,12 @@ def generate_event(player):
     
     Args:
         player (Player): The player affected by the event
+        rng (random.Random): Source of randomness (default: the random module)
         
     Returns:
         str: Message describing the event outcome, or "RESCUE" for boat rescue
         
-    Event weights:
+    Event weights (built-in content):
         - rain: 2/11 (~18%)
         - animal_encounter: 2/11 (~18%)
         - fruit_found: 3/11 (~27%)
@@ -98,13 +277,11 @@ def generate_event(player):
         - nothing: 2/11 (~18%)
         - boat_rescue: 1/11 (~9%)
     """
-    event_names = list(EVENTS.keys())
-    weights = [EVENTS[event]["weight"] for event in event_names]
-    
-    chosen_event = random.choices(event_names, weights=weights, k=1)[0]
-    event_info = EVENTS[chosen_event]
-    
-    event_function = globals()[event_info["function"]]
-    message = event_function(player)
-    
-    return message
+    if metrics.enabled:
+        with metrics.timer("event_seconds"):
+            event_name = EVENT_REGISTRY.draw(rng)
+            metrics.increment("events_total", event_name)
+            return EVENT_REGISTRY.functions[event_name](player, rng)
+
+    event_name = EVENT_REGISTRY.draw(rng)
+    return EVENT_REGISTRY.functions[event_name](player, rng)
@@ -0,0 +1,213 @@
+"""
+Forward probability propagation module.
+
+Computes the exact probability distribution of the game state day after day
+under a fixed policy, by pushing probability mass through the transition
+operator built in game.markov (action outcomes, weighted events, daily
+decay, clamping). No sampling is involved.
+
+Requires NumPy.
+"""
+
+import numpy as np
+
+from game.player import Player
+from game.actions import ACTIONS
+from game import engine
+from game.markov import Lattice, action_outcomes, event_outcomes
+from game.population import CAUSE_HUNGER, CAUSE_THIRST, CAUSE_ENERGY, cause_label
+
+
+class Forecast:
+    """
+    Exact outcome distribution of a game under a fixed policy.
+
+    Arrays are indexed by days survived: entry d is the probability that
+    the game is in the given situation with player.days_survived == d.
+
+    Attributes:
+        total_days (int): Target number of days to survive
+        start_day (int): Days survived in the starting state
+        survival (ndarray): Probability of still playing with d days survived
+        rescue (ndarray): Probability of being rescued with d days survived
+        deaths (dict): Cause label (as in check_conditions) -> probability of
+            dying from exactly those causes with d days survived
+        victory (float): Probability of reaching the goal
+    """
+
+    def __init__(self, total_days, start_day):
+        size = total_days + 1
+        self.total_days = total_days
+        self.start_day = start_day
+        self.survival = np.zeros(size)
+        self.rescue = np.zeros(size)
+        self.deaths = {}
+        self.victory = 0.0
+
+    @property
+    def death(self):
+        """ndarray: Probability of dying at day d, all causes combined."""
+        total = np.zeros(self.total_days + 1)
+        for probabilities in self.deaths.values():
+            total += probabilities
+        return total
+
+    def totals(self):
+        """
+        Probability of every final outcome.
+
+        Returns:
+            dict: "victory", "rescued", "dead" and one entry per death cause
+        """
+        result = {
+            "victory": self.victory,
+            "rescued": float(self.rescue.sum()),
+            "dead": float(self.death.sum()),
+        }
+        for cause, probabilities in self.deaths.items():
+            result[cause] = float(probabilities.sum())
+        return result
+
+
+def _cause_masks(lattice):
+    masks = np.zeros(lattice.shape, dtype=np.int64)
+    masks[0, :, :] |= CAUSE_HUNGER
+    masks[:, 0, :] |= CAUSE_THIRST
+    masks[:, :, 0] |= CAUSE_ENERGY
+    return masks
+
+
+class PolicyTable:
+    """
+    Turns a policy into an action code for every lattice state.
+
+    Accepted policies:
+        - an action number ("1" to "4")
+        - a Solution from game.solver (optimal play)
+        - a callable (player, total_days) -> action number, evaluated once per
+          state that has probability mass on a given day
+        - with vectorized=True, a callable (hunger, thirst, energy, days) ->
+          int array of action codes, as accepted by game.population.simulate
+    """
+
+    def __init__(self, policy, lattice, total_days, vectorized=False):
+        self.policy = policy
+        self.lattice = lattice
+        self.total_days = total_days
+        self.vectorized = vectorized
+        self.gauges = np.meshgrid(*(lattice.values(axis) for axis in range(3)), indexing="ij")
+        self.player = Player()
+
+    def actions(self, distribution, day):
+        """
+        Action code of every state on a given day.
+
+        Args:
+            distribution (ndarray): Current probability of every state
+            day (int): Days survived at the start of the turn
+
+        Returns:
+            ndarray: int array with the lattice shape (0 where there is no mass)
+        """
+        policy = self.policy
+        lattice = self.lattice
+
+        if isinstance(policy, str):
+            return np.full(lattice.shape, int(policy))
+
+        if hasattr(policy, "policy") and hasattr(policy, "lattice"):
+            days_left = self.total_days - day
+            if tuple(policy.lattice.steps) != tuple(lattice.steps):
+                raise ValueError("The solution uses a different lattice.")
+            return policy.policy[days_left].astype(np.int64)
+
+        codes = np.zeros(lattice.shape, dtype=np.int64)
+        occupied = np.nonzero(distribution)
+        hunger, thirst, energy = (values[occupied] for values in self.gauges)
+
+        if self.vectorized:
+            codes[occupied] = policy(hunger, thirst, energy, np.full(len(hunger), day))
+            return codes
+
+        player = self.player
+        player.days_survived = day
+        chosen = []
+        for h, t, e in zip(hunger.tolist(), thirst.tolist(), energy.tolist()):
+            player.hunger, player.thirst, player.energy = h, t, e
+            chosen.append(int(policy(player, self.total_days)))
+        codes[occupied] = chosen
+        return codes
+
+
+def propagate(policy, total_days=10, player=None, vectorized=False, lattice=None):
+    """
+    Compute the exact day-by-day outcome distribution under a policy.
+
+    Args:
+        policy: Policy accepted by PolicyTable (action number, Solution or callable)
+        total_days (int): Target number of days to survive (default: 10)
+        player (Player): Starting state (default: a fresh Player)
+        vectorized (bool): The callable policy works on arrays (default: False)
+        lattice (Lattice): Gauge lattice (default: computed from the rules)
+
+    Returns:
+        Forecast: Survival, rescue and death probabilities per day
+
+    Raises:
+        ValueError: If the player is dead or has already survived more than total_days
+    """
+    lattice = lattice or Lattice()
+    player = player or Player()
+    start_day = player.days_survived
+
+    distribution = np.zeros(lattice.shape)
+    distribution[lattice.index(player.hunger, player.thirst, player.energy)] = 1.0
+
+    forecast = Forecast(total_days, start_day)
+    alive = lattice.alive()
+    causes = _cause_masks(lattice)
+    events = event_outcomes()
+    outcomes = {int(action): action_outcomes(action) for action in ACTIONS}
+    table = PolicyTable(policy, lattice, total_days, vectorized)
+
+    if not player.is_alive():
+        raise ValueError("The player is already dead.")
+    if start_day > total_days:
+        raise ValueError(f"The player has already survived {start_day} days, more than total_days ({total_days}).")
+
+    forecast.survival[start_day] = 1.0
+
+    for day in range(start_day, total_days):
+        codes = table.actions(distribution, day)
+
+        after_action = np.zeros(lattice.shape)
+        for code, rows in outcomes.items():
+            mass = np.where(codes == code, distribution, 0.0)
+            if not mass.any():
+                continue
+            for probability, dh, dt, de in rows:
+                after_action += probability * lattice.scatter(mass, dh, dt, de)
+
+        after_event = np.zeros(lattice.shape)
+        total = after_action.sum()
+        for probability, dh, dt, de, rescue in events:
+            if rescue:
+                forecast.rescue[day] += probability * total
+            else:
+                after_event += probability * lattice.scatter(after_action, dh, dt, de)
+
+        distribution = lattice.scatter(after_event, *engine.DAILY_DECAY)
+
+        dead = np.bincount(causes[~alive], weights=distribution[~alive], minlength=8)
+        for mask in range(1, 8):
+            if dead[mask]:
+                label = cause_label(mask)
+                if label not in forecast.deaths:
+                    forecast.deaths[label] = np.zeros(total_days + 1)
+                forecast.deaths[label][day + 1] = dead[mask]
+
+        distribution = np.where(alive, distribution, 0.0)
+        forecast.survival[day + 1] = distribution.sum()
+
+    forecast.victory = float(distribution.sum())
+    return forecast
@@ -5,10 +5,82 @@ Contains the main game loop and all game flow control functions.
 Manages player actions, event triggers, victory/defeat conditions, and UI display.
 """
 
-from game.player import Player
-from game.actions import fish, sleep, search_water, explore
-from game.evenements import generate_event
-from game.save import save_game, load_game, delete_save
+import random
+
+from game import metrics
+from game.player import SlottedPlayer
+from game.actions import ACTIONS
+from game.engine import GameSession, check_status, DEAD, RESCUED
+from game.save import save_game, load_game, delete_save, record_game
+from game.replay import ReplayRecorder, save_replay
+
+
+ACTION_MENU = [
+    "\n🎮 What do you want to do?",
+    "1 - Fish 🎣",
+    "2 - Sleep 😴",
+    "3 - Search for water 💧",
+    "4 - Explore 🗺️",
+    "5 - Quit and save 💾",
+    "6 - Get a hint 💡",
+]
+
+
+def format_gauges(player):
+    """
+    Format the player's current statistics.
+    
+    Args:
+        player (Player): The player whose stats to format
+        
+    Returns:
+        list: Lines of text, as printed by display_gauges
+    """
+    return [
+        f"\n📅 Day {player.days_survived} - 🏝️ {player.name.upper()}",
+        "=" * 40,
+        f"Hunger: {player.hunger}/100 | Thirst: {player.thirst}/100 | Energy: {player.energy}/100",
+        "=" * 40,
+    ]
+
+
+def format_rescue(player):
+    """
+    Format the boat rescue announcement.
+    
+    Args:
+        player (Player): The rescued player
+        
+    Returns:
+        list: Lines of text
+    """
+    return [
+        "🚢 A RESCUE BOAT SPOTTED YOU!",
+        "They're coming to save you!",
+        "\n" + "="*50,
+        f"🎉 RESCUED! You survived {player.days_survived} days and got rescued!",
+        "="*50 + "\n",
+    ]
+
+
+def format_hint(hint):
+    """
+    Format the advisor's recommendation.
+    
+    Args:
+        hint (Hint): Recommendation returned by Advisor.advise
+        
+    Returns:
+        list: Lines of text
+    """
+    if hint.exact:
+        value = f"Chance to win: {100 * hint.win_probability:.1f}%"
+    else:
+        value = f"Score: {100 * hint.win_probability:.0f}/100 (looking {hint.depth} day(s) ahead, not a probability)"
+    return [
+        f"\n💡 Hint: {ACTION_MENU[int(hint.action)]}",
+        value,
+    ]
 
 
 def display_gauges(player):
@@ -20,10 +92,8 @@ def display_gauges(player):
     Args:
         player (Player): The player whose stats to display
     """
-    print(f"\n📅 Day {player.days_survived} - 🏝️ {player.name.upper()}")
-    print("=" * 40)
-    print(f"Hunger: {player.hunger}/100 | Thirst: {player.thirst}/100 | Energy: {player.energy}/100")
-    print("=" * 40)
+    for line in format_gauges(player):
+        print(line)
 
 
 def choose_action():
@@ -33,7 +103,7 @@ def choose_action():
     Validates input to ensure a valid action is selected.
     
     Returns:
-        str: The chosen action number (1-5) as a string
+        str: The chosen action number (1-6) as a string
         
     Actions:
         1 - Fish
@@ -41,21 +111,18 @@ def choose_action():
         3 - Search for water
         4 - Explore
         5 - Quit and save
+        6 - Get a hint
     """
-    print("\n🎮 What do you want to do?")
-    print("1 - Fish 🎣")
-    print("2 - Sleep 😴")
-    print("3 - Search for water 💧")
-    print("4 - Explore 🗺️")
-    print("5 - Quit and save 💾")
+    for line in ACTION_MENU:
+        print(line)
     
     while True:
         try:
-            choice = input("\nYour choice (1-5): ").strip()
-            if choice in ["1", "2", "3", "4", "5"]:
+            choice = input("\nYour choice (1-6): ").strip()
+            if choice in ["1", "2", "3", "4", "5", "6"]:
                 return choice
             else:
-                print("❌ Invalid choice. Please enter 1, 2, 3, 4, or 5.")
+                print("❌ Invalid choice. Please enter 1, 2, 3, 4, 5, or 6.")
         except:
             print("❌ Invalid input. Please try again.")
 
@@ -78,16 +145,14 @@ def check_conditions(player, current_day, total_days):
         - Defeat: Any vital stat (hunger, thirst, energy) reaches 0
         - Victory: Survived the target number of days
     """
-    if not player.is_alive():
-        cause = []
-        if player.hunger <= 0:
-            cause.append("hunger")
-        if player.thirst <= 0:
-            cause.append("thirst")
-        if player.energy <= 0:
-            cause.append("energy")
-        
-        return False, f"💀 GAME OVER! You died from {' and '.join(cause)}..."
+    if metrics.enabled:
+        with metrics.timer("check_conditions_seconds"):
+            status, causes = check_status(player, current_day, total_days)
+    else:
+        status, causes = check_status(player, current_day, total_days)
+    
+    if status == DEAD:
+        return False, f"💀 GAME OVER! You died from {' and '.join(causes)}..."
     
     if current_day >= total_days:
         return False, f"🎉 VICTORY! You survived {total_days} days on the island! Well done!"
@@ -95,10 +160,48 @@ def check_conditions(player, current_day, total_days):
     return True, ""
 
 
+def write_replay(recorder, status):
+    """
+    Write the replay of the game being played next to the save.
+    
+    Args:
+        recorder (ReplayRecorder): Recorder of the game
+        status (str): Status of the game when the replay is written
+    """
+    try:
+        save_replay(recorder.finish(status))
+    except OSError as e:
+        print(f"❌ Error saving replay: {e}")
+
+
 def game_loop():
     """
     Main game loop - the heart of the game.
     
+    Plays games one after the other until the player declines to play
+    again or quits and saves.
+    
+    Metrics are collected when the SURVIVEISLAND_METRICS environment
+    variable names a snapshot file, which is written after every game.
+    """
+    metrics.enable_from_environment()
+    
+    while True:
+        finished = play_one_game()
+        metrics.flush()
+        if not finished:
+            return
+        
+        replay = input("\n🔄 Do you want to play again? (y/n): ").strip().lower()
+        if replay != "y":
+            print("\n👋 Thanks for playing! See you next time!")
+            return
+
+
+def play_one_game(renderer=None):
+    """
+    Play a single game from the welcome screen to its end.
+    
     Manages the entire game flow:
     1. Welcome screen and game setup
     2. Load existing save or create new player
@@ -108,15 +211,25 @@ def game_loop():
        - Display stats
        - Check win/lose conditions
        - Get player action
-       - Apply action effects
-       - Generate random event
+       - Play the turn through the headless engine (action, random event, daily decay)
+       - Display the returned action and event messages
        - Handle boat rescue (alternative victory)
        - Auto-save progress
-    6. Game over handling and replay option
+    6. Game over handling
+    
+    Args:
+        renderer: Output of the turns, a game.render renderer
+            (default: chosen by game.render.get_renderer)
+    
+    Returns:
+        bool: True if the game ended (victory, rescue or death),
+            False if the player quit and saved
     
     Special features:
     - Auto-save after each turn
+    - Replay of the game (seed and actions) written to data/replays/
     - Quit and save option (action 5)
+    - Hint option (action 6), answered by the expectimax advisor
     - Boat rescue random event for alternative victory
     - Custom survival goal between 10-50 days
     """
@@ -129,10 +242,10 @@ def game_loop():
     total_days = 10  # Default value
     
     if load_choice == "y":
-        player, current_day, total_days = load_game()
+        player, current_day, total_days = load_game(player_class=SlottedPlayer)
         if player is None:
             player_name = input("\n👤 Enter your name: ").strip() or "Survivor"
-            player = Player(name=player_name)
+            player = SlottedPlayer(name=player_name)
             print(f"\n🌴 Welcome, {player.name}! Good luck!\n")
             # Ask for days goal since no save was loaded
             while True:
@@ -149,7 +262,7 @@ def game_loop():
             print(f"Your goal: Survive {total_days} days!")
     else:
         player_name = input("\n👤 Enter your name: ").strip() or "Survivor"
-        player = Player(name=player_name)
+        player = SlottedPlayer(name=player_name)
         print(f"\n🌴 Welcome, {player.name}! Good luck!\n")
         # Ask for days goal for new game
         while True:
@@ -167,63 +280,74 @@ def game_loop():
     print("Manage your hunger, thirst, and energy wisely.")
     print("="*50 + "\n")
     
-    while True:
-        display_gauges(player)
-        
-        continue_game, message = check_conditions(player, player.days_survived, total_days)
-        
-        if not continue_game:
-            print("\n" + "="*50)
-            print(message)
-            print("="*50 + "\n")
-            delete_save()
-            break
-        
-        action_choice = choose_action()
-        
-        if action_choice == "5":
+    seed = random.getrandbits(63)
+    session = GameSession(player=player, total_days=total_days, seed=seed)
+    recorder = ReplayRecorder(player, total_days, seed)
+    advisor = None
+    
+    if renderer is None:
+        from game.render import get_renderer
+        renderer = get_renderer()
+    renderer.start()
+    
+    try:
+        while True:
+            with metrics.timer("render_seconds"):
+                renderer.show_gauges(player, total_days)
+            
+            continue_game, message = check_conditions(player, player.days_survived, total_days)
+            
+            if not continue_game:
+                renderer.show(["\n" + "="*50, message, "="*50 + "\n"])
+                record_game(player, total_days, session.status, " and ".join(session.causes))
+                delete_save()
+                write_replay(recorder, session.status)
+                break
+            
+            action_choice = renderer.choose_action()
+            
+            while action_choice == "6":
+                if advisor is None:
+                    # Imported on the first hint only, to keep the game start fast
+                    from game.advisor import Advisor
+                    advisor = Advisor()
+                renderer.show(format_hint(advisor.advise(player, total_days)))
+                action_choice = renderer.choose_action()
+            
+            if action_choice == "5":
+                save_game(player, player.days_survived, total_days)
+                write_replay(recorder, session.status)
+                renderer.show(["\n👋 Game saved! See you next time!"])
+                return False
+            
+            outcome = session.play(action_choice)
+            recorder.record(action_choice, player)
+            
+            with metrics.timer("render_seconds"):
+                lines = [
+                    "\n" + "-"*40,
+                    "\n" + ACTIONS[action_choice]["description"],
+                    outcome.action_message,
+                    "-"*40,
+                    "\n🎲 Random event...",
+                ]
+                if outcome.status == RESCUED:
+                    lines.extend(format_rescue(player))
+                else:
+                    lines.append(outcome.event_message)
+                renderer.show(lines)
+            
+            if outcome.status == RESCUED:
+                record_game(player, total_days, RESCUED)
+                delete_save()
+                write_replay(recorder, RESCUED)
+                break
+            
             save_game(player, player.days_survived, total_days)
-            print("\n👋 Game saved! See you next time!")
-            return
-        
-        print("\n" + "-"*40)
-        if action_choice == "1":
-            fish(player)
-        elif action_choice == "2":
-            sleep(player)
-        elif action_choice == "3":
-            search_water(player)
-        elif action_choice == "4":
-            explore(player)
-        
-        print("-"*40)
-        
-        print("\n🎲 Random event...")
-        event_message = generate_event(player)
-        
-        if event_message == "RESCUE":
-            print("🚢 A RESCUE BOAT SPOTTED YOU!")
-            print("They're coming to save you!")
-            print("\n" + "="*50)
-            print(f"🎉 RESCUED! You survived {player.days_survived} days and got rescued!")
-            print("="*50 + "\n")
-            delete_save()
-            break
-        
-        print(event_message)
-        
-        player.update_gauges(delta_hunger=-5, delta_thirst=-5, delta_energy=-3)
-        
-        # Each action = 1 day
-        player.days_survived += 1
-        
-        save_game(player, player.days_survived, total_days)
+    finally:
+        renderer.close()
     
-    replay = input("\n🔄 Do you want to play again? (y/n): ").strip().lower()
-    if replay == "y":
-        game_loop()
-    else:
-        print("\n👋 Thanks for playing! See you next time!")
+    return True
 
 
 if __name__ == "__main__":
@@ -0,0 +1,450 @@
+"""
+Shared island module.
+
+Simulates many castaways living on the same island at once. The island is
+a grid of tiles holding finite stocks of fish (on the coast), fresh water
+(at springs) and fruit (in the forest), which regrow every day up to the
+capacity of their tile. The castaways compete for them:
+- fishing and searching for water move the castaway to the best tile
+  within SEARCH_RADIUS (most units per castaway already there), then take
+  one unit of the resource; the success outcome of the action needs that
+  unit, without it the castaway gets the failure outcome
+- exploring moves the castaway to a random tile within SEARCH_RADIUS;
+  finding berries takes a unit of fruit there, finding a water source a
+  unit of water, otherwise nothing useful is found
+- the fruit_found event takes a unit of fruit from the castaway's tile
+  (nothing happens without one), and a hunt during an animal_encounter
+  succeeds for only one castaway per tile and day (the others flee)
+When more castaways claim a tile than it has units, the units go to a
+random subset of them.
+
+The odds are those of game.actions and game.evenements: on an island that
+never runs out of anything, the castaways have the same outcome
+distribution as the players of game.population.
+
+Every day is one batched tick over all the castaways still playing:
+resource lookups read the tile grid around each position (a fixed window,
+whatever the size of the island), crowding is a count of castaways per
+tile, and the units of each tile are shared out by sorting its claims.
+
+Requires NumPy.
+
+Example:
+    from game.island import Island
+
+    island = Island(100_000, width=512, height=512, total_days=30, seed=1)
+    result = island.run()
+    print(result.outcome_counts(), island.consumed)
+"""
+
+import numpy as np
+
+from game import engine
+from game.actions import ACTIONS
+from game.evenements import EVENTS
+from game.population import (
+    PopulationResult, _choose_actions, _compile_actions, _compile_events,
+    STATUS_VICTORY, STATUS_RESCUED, STATUS_DEAD, CAUSE_HUNGER, CAUSE_THIRST, CAUSE_ENERGY
+)
+
+
+# Resources stored on the tiles
+RESOURCE_NAMES = ("fish", "water", "fruit")
+FISH, WATER, FRUIT = range(3)
+# Animals are not stored: one hunt per tile and day
+ANIMAL = 3
+NO_RESOURCE = -1
+
+# Units per tile and units regrown per day
+RESOURCES = {
+    "fish": {"capacity": 4, "regen": 0.5},
+    "water": {"capacity": 30, "regen": 3.0},
+    "fruit": {"capacity": 3, "regen": 0.25},
+}
+
+# Width of the coast where fish live, share of springs and of fruit trees
+# among inland tiles
+COAST_WIDTH = 3
+SPRING_DENSITY = 0.03
+FRUIT_DENSITY = 0.3
+
+# Tiles searched around a castaway: a (2r + 1) x (2r + 1) window
+SEARCH_RADIUS = 2
+
+ACTION_FISH, ACTION_SLEEP, ACTION_WATER, ACTION_EXPLORE = 1, 2, 3, 4
+
+# Outcomes that take a unit of a resource, by (action or event, outcome id)
+# -> (resource, id of the outcome played without it, None for no effect)
+ACTION_CLAIMS = {
+    ("1", "fish_caught"): (FISH, "fish_escaped"),
+    ("3", "water_found"): (WATER, "no_water"),
+    ("4", "berries"): (FRUIT, "nothing_useful"),
+    ("4", "water_source"): (WATER, "nothing_useful"),
+}
+EVENT_CLAIMS = {
+    ("fruit_found", "fruit"): (FRUIT, None),
+    ("animal_encounter", "hunt"): (ANIMAL, "flee"),
+}
+
+
+class IslandMap:
+    """
+    Resource stocks of the island tiles.
+
+    Attributes:
+        width (int): Tiles per row
+        height (int): Tiles per column
+        stock (ndarray): float32 array (3, height, width) of the units on
+            each tile (whole units can be taken), indexed by FISH, WATER, FRUIT
+        capacity (ndarray): float32 array (3, height, width), maximum stock
+        regen (ndarray): float32 array (3, height, width), units regrown per day
+    """
+
+    def __init__(self, width, height, capacity, regen):
+        self.width = width
+        self.height = height
+        self.capacity = capacity
+        self.regen = regen
+        self.stock = capacity.copy()
+
+    @classmethod
+    def generate(cls, width, height, rng):
+        """
+        Generate an island: fish along the coast, springs and fruit trees inland.
+
+        Args:
+            width (int): Tiles per row
+            height (int): Tiles per column
+            rng (numpy.random.Generator): Source of randomness
+
+        Returns:
+            IslandMap: Island with every stock full
+        """
+        y, x = np.mgrid[0:height, 0:width]
+        coast = np.minimum(np.minimum(x, width - 1 - x), np.minimum(y, height - 1 - y)) < COAST_WIDTH
+        present = np.stack([
+            coast,
+            ~coast & (rng.random((height, width)) < SPRING_DENSITY),
+            ~coast & (rng.random((height, width)) < FRUIT_DENSITY),
+        ])
+
+        capacity = np.zeros((3, height, width), dtype=np.float32)
+        regen = np.zeros((3, height, width), dtype=np.float32)
+        for resource, name in enumerate(RESOURCE_NAMES):
+            capacity[resource][present[resource]] = RESOURCES[name]["capacity"]
+            regen[resource][present[resource]] = RESOURCES[name]["regen"]
+        return cls(width, height, capacity, regen)
+
+    def grow(self):
+        """Regrow one day of every resource, up to the tile capacities."""
+        self.stock += self.regen
+        np.minimum(self.stock, self.capacity, out=self.stock)
+
+    def totals(self):
+        """
+        Count the units left on the island.
+
+        Returns:
+            dict: Resource name -> whole units left
+        """
+        units = np.floor(self.stock).reshape(3, -1).sum(axis=1)
+        return {name: int(units[resource]) for resource, name in enumerate(RESOURCE_NAMES)}
+
+
+def _resolve_claims(rng, keys, available):
+    """
+    Share out units between the castaways claiming them.
+
+    Args:
+        rng (numpy.random.Generator): Source of randomness
+        keys (ndarray): Claimed stock of every claimant (one unit each)
+        available (ndarray): Whole units of that stock, per claimant
+
+    Returns:
+        ndarray: bool, True for the claimants that get their unit; when a
+            stock is short, a random subset of its claimants gets it
+    """
+    n = len(keys)
+    if not n:
+        return np.zeros(0, dtype=bool)
+    shuffled = rng.permutation(n)
+    order = shuffled[np.argsort(keys[shuffled], kind="stable")]
+    sorted_keys = keys[order]
+
+    # Rank of each claimant within its stock
+    position = np.arange(n)
+    first = np.empty(n, dtype=bool)
+    first[0] = True
+    np.not_equal(sorted_keys[1:], sorted_keys[:-1], out=first[1:])
+    rank = position - np.maximum.accumulate(np.where(first, position, 0))
+
+    granted = np.empty(n, dtype=bool)
+    granted[order] = rank < available[order]
+    return granted
+
+
+def _compile_claims(claims, table, first_rows, rows):
+    """
+    Build the claim tables of outcome rows.
+
+    Claims of an action or event that is not in the content are skipped:
+    it never happens, so there is nothing to claim.
+
+    Args:
+        claims (dict): (key, outcome id) -> (resource, fallback id or None)
+        table (dict): ACTIONS or EVENTS
+        first_rows (dict): key -> row of the compiled deltas holding the
+            first outcome of that action or event
+        rows (int): Number of rows of the compiled deltas
+
+    Returns:
+        tuple: (resource, fallback) int64 arrays per row: claimed resource
+            (NO_RESOURCE if none) and row played without it (-1: no effect)
+
+    Raises:
+        ValueError: If an action or event lacks a claimed outcome or its
+            fallback (no outcome with that id)
+    """
+    resource = np.full(rows, NO_RESOURCE, dtype=np.int64)
+    fallback = np.full(rows, -1, dtype=np.int64)
+    for (key, outcome_id), (claimed, instead) in claims.items():
+        if key not in first_rows:
+            continue
+        ids = table[key].get("ids") or ()
+        claimed_rows = [first_rows[key] + index for index, row_id in enumerate(ids) if row_id == outcome_id]
+        if not claimed_rows:
+            raise ValueError(f"{key!r} has no outcome with id {outcome_id!r} to claim a resource.")
+        resource[claimed_rows] = claimed
+        if instead is not None:
+            if instead not in ids:
+                raise ValueError(f"{key!r} has no outcome with id {instead!r} to play when {outcome_id!r} is short.")
+            fallback[claimed_rows] = first_rows[key] + ids.index(instead)
+    return resource, fallback
+
+
+class Island:
+    """
+    Castaways sharing one island, simulated one day (tick) at a time.
+
+    The castaways still playing are stored as a structure of arrays
+    (position, gauges, days); finished ones are written to the result
+    arrays and dropped from the tick.
+
+    Attributes:
+        map (IslandMap): Resource stocks
+        crowding (ndarray): Castaways per tile (y * width + x), as of the
+            start of the last tick
+        day (int): Ticks played
+        consumed (dict): Units taken per resource, plus "hunt" for animals
+    """
+
+    def __init__(self, n_agents, width=256, height=256, total_days=30, policy="random", seed=None):
+        """
+        Initialize the island and spread the castaways over it.
+
+        Args:
+            n_agents (int): Number of castaways
+            width (int): Tiles per row (default: 256)
+            height (int): Tiles per column (default: 256)
+            total_days (int): Target number of days to survive (default: 30)
+            policy: Action choice, as in game.population.simulate (default: "random")
+            seed: Seed for numpy.random.default_rng (default: None)
+
+        Raises:
+            ValueError: If the content lacks an outcome of a resource claim
+        """
+        self.rng = np.random.default_rng(seed)
+        self.map = IslandMap.generate(width, height, self.rng)
+        self.crowding = np.zeros(width * height, dtype=np.int64)
+        self.total_days = total_days
+        self.policy = policy
+        self.day = 0
+        self.consumed = dict.fromkeys(RESOURCE_NAMES + ("hunt",), 0)
+
+        self.action_deltas, self.action_counts = _compile_actions()
+        self.event_cumulative, self.event_deltas, self.event_rescue = _compile_events()
+        self.decay = np.array(engine.DAILY_DECAY, dtype=np.int16)
+
+        # Action rows are flattened as code * row_width + outcome, event rows
+        # in table order
+        row_width = self.action_deltas.shape[1]
+        action_rows = {
+            code: int(code) * row_width
+            for code in ACTIONS if code.isdigit() and int(code) < len(self.action_counts)
+        }
+        self.action_claim, self.action_fallback = _compile_claims(
+            ACTION_CLAIMS, ACTIONS, action_rows, len(self.action_counts) * row_width)
+        event_rows = {}
+        row = 0
+        for name, info in EVENTS.items():
+            event_rows[name] = row
+            row += len(info["outcomes"])
+        self.event_claim, self.event_fallback = _compile_claims(
+            EVENT_CLAIMS, EVENTS, event_rows, len(self.event_deltas))
+
+        dy, dx = np.mgrid[-SEARCH_RADIUS:SEARCH_RADIUS + 1, -SEARCH_RADIUS:SEARCH_RADIUS + 1]
+        self.window = (dx.ravel(), dy.ravel())
+
+        self.ids = np.arange(n_agents)
+        self.x = self.rng.integers(0, width, size=n_agents)
+        self.y = self.rng.integers(0, height, size=n_agents)
+        self.gauges = np.full((n_agents, 3), 100, dtype=np.int16)
+        self.days = np.zeros(n_agents, dtype=np.int16)
+
+        self.out_days = np.zeros(n_agents, dtype=np.int16)
+        self.out_status = np.zeros(n_agents, dtype=np.int8)
+        self.out_causes = np.zeros(n_agents, dtype=np.uint8)
+
+    def __len__(self):
+        """Number of castaways still playing."""
+        return len(self.ids)
+
+    def _search(self, who, resource):
+        # Move each castaway to the tile of the window with the most units
+        # per castaway already there; ties are broken at random. The scores
+        # are computed once per tile, on a grid padded with SEARCH_RADIUS
+        # off-island tiles (score -1), so a window is a fixed set of offsets.
+        width, height = self.map.width, self.map.height
+        r = SEARCH_RADIUS
+        padded_width = width + 2 * r
+        crowding = 1 + self.crowding.reshape(height, width)
+        scores = np.full((2, height + 2 * r, padded_width), -1, dtype=np.float32)
+        for searched in (FISH, WATER):
+            np.floor(self.map.stock[searched], out=scores[searched, r:r + height, r:r + width])
+            scores[searched, r:r + height, r:r + width] /= crowding
+
+        dx, dy = self.window
+        x, y = self.x[who], self.y[who]
+        centers = resource * scores[0].size + (y + r) * padded_width + (x + r)
+        score = scores.reshape(-1)[centers[:, None] + (dy * padded_width + dx)]
+        score += self.rng.random(score.shape, dtype=np.float32) * 1e-3
+        best = np.argmax(score, axis=1)
+        self.x[who] = x + dx[best]
+        self.y[who] = y + dy[best]
+
+    def _wander(self, who):
+        width, height = self.map.width, self.map.height
+        step = self.rng.integers(-SEARCH_RADIUS, SEARCH_RADIUS + 1, size=(2, len(who)))
+        self.x[who] = np.clip(self.x[who] + step[0], 0, width - 1)
+        self.y[who] = np.clip(self.y[who] + step[1], 0, height - 1)
+
+    def _claim(self, rows, claim, fallback):
+        # Take the units claimed by the given outcome rows; returns the rows
+        # actually played (the fallback row, or -1, when a claim fails)
+        resource = claim[rows]
+        claimants = np.flatnonzero(resource != NO_RESOURCE)
+        if not len(claimants):
+            return rows
+        resource = resource[claimants]
+        tiles = self.y[claimants] * self.map.width + self.x[claimants]
+        cells = self.map.width * self.map.height
+        keys = resource * cells + tiles
+
+        stock = self.map.stock.reshape(-1)
+        available = np.ones(len(keys), dtype=np.float32)
+        stored = resource != ANIMAL
+        available[stored] = np.floor(stock[keys[stored]])
+        granted = _resolve_claims(self.rng, keys, available)
+
+        taken = keys[granted & stored]
+        np.subtract.at(stock, taken, 1)
+        counts = np.bincount(resource[granted], minlength=4)
+        for code, name in enumerate(RESOURCE_NAMES + ("hunt",)):
+            self.consumed[name] += int(counts[code])
+
+        rows = rows.copy()
+        refused = claimants[~granted]
+        rows[refused] = fallback[rows[refused]]
+        return rows
+
+    def tick(self):
+        """
+        Play one day for every castaway still playing, then regrow the resources.
+
+        Returns:
+            int: Number of castaways still playing
+        """
+        n = len(self.ids)
+        if not n:
+            return 0
+        rng = self.rng
+        self.crowding = np.bincount(self.y * self.map.width + self.x, minlength=self.crowding.size)
+
+        # Action: move towards the resource, then take it
+        actions = _choose_actions(self.policy, rng, self.gauges, self.days)
+        searching = np.flatnonzero((actions == ACTION_FISH) | (actions == ACTION_WATER))
+        if len(searching):
+            self._search(searching, np.where(actions[searching] == ACTION_FISH, FISH, WATER))
+        self._wander(np.flatnonzero(actions == ACTION_EXPLORE))
+
+        row_width = self.action_deltas.shape[1]
+        outcomes = (rng.random(n) * self.action_counts[actions]).astype(np.int64)
+        rows = self._claim(actions * row_width + outcomes, self.action_claim, self.action_fallback)
+        self.gauges += self.action_deltas.reshape(-1, 3)[rows]
+        np.clip(self.gauges, 0, 100, out=self.gauges)
+
+        # Random event, on the tile reached by the action
+        drawn = np.searchsorted(self.event_cumulative, rng.random(n), side="right")
+        rows = self._claim(drawn, self.event_claim, self.event_fallback)
+        self.gauges += np.where((rows >= 0)[:, None], self.event_deltas[rows], 0).astype(np.int16)
+        np.clip(self.gauges, 0, 100, out=self.gauges)
+        rescued = self.event_rescue[drawn]
+
+        # Daily decay for everyone (the rescued castaways leave the island
+        # anyway), but the day only counts for those that were not rescued
+        self.gauges += self.decay
+        np.clip(self.gauges, 0, 100, out=self.gauges)
+        self.days += 1
+        self.days[rescued] -= 1
+
+        depleted = self.gauges <= 0
+        dead = depleted.any(axis=1) & ~rescued
+        victory = ~dead & ~rescued & (self.days >= self.total_days)
+        finished = rescued | dead | victory
+
+        if finished.any():
+            ended = self.ids[finished]
+            self.out_days[ended] = self.days[finished]
+            code = np.where(rescued, STATUS_RESCUED, np.where(dead, STATUS_DEAD, STATUS_VICTORY))
+            self.out_status[ended] = code[finished]
+            mask = (depleted[:, 0] * CAUSE_HUNGER) | (depleted[:, 1] * CAUSE_THIRST) | (depleted[:, 2] * CAUSE_ENERGY)
+            self.out_causes[ended] = np.where(dead, mask, 0)[finished]
+
+            keep = ~finished
+            self.ids = self.ids[keep]
+            self.x = self.x[keep]
+            self.y = self.y[keep]
+            self.gauges = self.gauges[keep]
+            self.days = self.days[keep]
+
+        self.map.grow()
+        self.day += 1
+        return len(self.ids)
+
+    def run(self, max_ticks=None):
+        """
+        Play days until every castaway has finished (or max_ticks days).
+
+        Args:
+            max_ticks (int): Maximum number of days to play (default: no limit)
+
+        Returns:
+            PopulationResult: Final state of every castaway (see result())
+        """
+        ticks = 0
+        while len(self.ids) and (max_ticks is None or ticks < max_ticks):
+            self.tick()
+            ticks += 1
+        return self.result()
+
+    def result(self):
+        """
+        Final state of every castaway so far.
+
+        Returns:
+            PopulationResult: Days, status and death causes (the castaways
+                still playing have status STATUS_ONGOING and their days so far)
+        """
+        days = self.out_days.copy()
+        days[self.ids] = self.days
+        return PopulationResult(days, self.out_status.copy(), self.out_causes.copy(), self.total_days)
@@ -0,0 +1,209 @@
+"""
+Markov model module.
+
+Describes the game as a finite Markov decision process built from the
+rules tables: ACTIONS outcomes, weighted EVENTS and DAILY_DECAY. States are
+the (hunger, thirst, energy) gauges; every effect is a fixed delta followed
+by clamping to 0-100, exactly as Player.update_gauges does.
+
+Gauges only move by multiples of the GCD of their deltas, so each axis is
+stored on a lattice of that step (hunger and thirst move by 5, energy by 1).
+This removes unreachable values, and clamping makes all values past the
+edges collapse onto the same index.
+
+Requires NumPy.
+"""
+
+import hashlib
+import json
+from math import gcd
+
+import numpy as np
+
+from game.actions import ACTIONS
+from game.evenements import EVENTS
+from game import engine
+
+
+MAX_GAUGE = 100
+
+
+def action_outcomes(action):
+    """
+    Probability distribution of the gauge deltas of an action.
+
+    Args:
+        action (str): Action number ("1" to "4")
+
+    Returns:
+        list: (probability, delta_hunger, delta_thirst, delta_energy) tuples
+    """
+    outcomes = ACTIONS[action]["outcomes"]
+    probability = 1 / len(outcomes)
+    return [(probability, dh, dt, de) for _, dh, dt, de in outcomes]
+
+
+def event_outcomes():
+    """
+    Probability distribution of the random events.
+
+    Returns:
+        list: (probability, delta_hunger, delta_thirst, delta_energy, rescue)
+            tuples, one per event outcome
+    """
+    total = sum(info["weight"] for info in EVENTS.values())
+    rows = []
+    for info in EVENTS.values():
+        if not info["weight"]:
+            continue
+        outcomes = info["outcomes"]
+        for _, dh, dt, de in outcomes:
+            rows.append((info["weight"] / total / len(outcomes), dh, dt, de, info.get("terminal", False)))
+    return rows
+
+
+def rules_fingerprint():
+    """
+    Hash of every rule the model depends on.
+
+    Used to key cached results so they are invalidated when the rules change.
+
+    Returns:
+        str: Hexadecimal digest
+    """
+    rules = {
+        "actions": {action: action_outcomes(action) for action in ACTIONS},
+        "events": event_outcomes(),
+        "decay": list(engine.DAILY_DECAY),
+    }
+    return hashlib.sha256(json.dumps(rules, sort_keys=True).encode()).hexdigest()[:16]
+
+
+class Lattice:
+    """
+    Grid of reachable gauge values for every axis.
+
+    Attributes:
+        steps (tuple): Gauge step for hunger, thirst and energy
+        shape (tuple): Number of lattice values per axis
+    """
+
+    def __init__(self, steps=None):
+        """
+        Initialize the lattice.
+
+        Args:
+            steps (tuple): Step per axis (default: computed from the rules)
+        """
+        self.steps = tuple(steps) if steps is not None else self.rule_steps()
+        self.shape = tuple(MAX_GAUGE // step + 1 for step in self.steps)
+
+    @staticmethod
+    def rule_steps():
+        """
+        Compute the largest step per axis that keeps every rule on the lattice.
+
+        Returns:
+            tuple: (hunger_step, thirst_step, energy_step)
+        """
+        deltas = [engine.DAILY_DECAY]
+        for action in ACTIONS:
+            deltas += [row[1:] for row in action_outcomes(action)]
+        deltas += [row[1:4] for row in event_outcomes()]
+
+        steps = []
+        for axis in range(3):
+            step = MAX_GAUGE
+            for delta in deltas:
+                step = gcd(step, abs(delta[axis]))
+            steps.append(step)
+        return tuple(steps)
+
+    def contains(self, hunger, thirst, energy):
+        """bool: True if the gauges lie on the lattice."""
+        return all(
+            0 <= value <= MAX_GAUGE and value % step == 0
+            for value, step in zip((hunger, thirst, energy), self.steps)
+        )
+
+    def index(self, hunger, thirst, energy):
+        """
+        Convert gauge values to lattice indices.
+
+        Raises:
+            ValueError: If the gauges are not on the lattice
+        """
+        if not self.contains(hunger, thirst, energy):
+            raise ValueError(
+                f"Gauges ({hunger}, {thirst}, {energy}) are not on the lattice of steps {self.steps}."
+            )
+        return hunger // self.steps[0], thirst // self.steps[1], energy // self.steps[2]
+
+    def values(self, axis):
+        """ndarray: Gauge value of every index along an axis."""
+        return np.arange(self.shape[axis]) * self.steps[axis]
+
+    def alive(self):
+        """ndarray: Boolean mask of the states where every gauge is above 0."""
+        mask = np.ones(self.shape, dtype=bool)
+        mask[0, :, :] = False
+        mask[:, 0, :] = False
+        mask[:, :, 0] = False
+        return mask
+
+    def shift(self, axis, delta):
+        """
+        Index map of a clamped gauge change along an axis.
+
+        Args:
+            axis (int): 0 hunger, 1 thirst, 2 energy
+            delta (int): Gauge change (must be a multiple of the axis step)
+
+        Returns:
+            ndarray: target[i] = index reached from index i
+        """
+        n = self.shape[axis]
+        return np.clip(np.arange(n) + delta // self.steps[axis], 0, n - 1)
+
+    def gather(self, array, delta_hunger, delta_thirst, delta_energy):
+        """
+        Read an array at the states reached by a gauge change (pull).
+
+        Returns:
+            ndarray: result[s] = array[clamp(s + delta)]
+        """
+        result = array
+        for axis, delta in enumerate((delta_hunger, delta_thirst, delta_energy)):
+            if delta:
+                result = np.take(result, self.shift(axis, delta), axis=axis)
+        return result
+
+    def scatter(self, array, delta_hunger, delta_thirst, delta_energy):
+        """
+        Move probability mass along a gauge change (push).
+
+        Returns:
+            ndarray: result[t] = sum of array[s] for all s with clamp(s + delta) == t
+        """
+        result = array
+        for axis, delta in enumerate((delta_hunger, delta_thirst, delta_energy)):
+            if delta:
+                result = _push_axis(result, axis, delta // self.steps[axis])
+        return result
+
+
+def _push_axis(array, axis, offset):
+    n = array.shape[axis]
+    moved = np.moveaxis(array, axis, 0)
+    result = np.zeros_like(moved)
+    if offset >= n or -offset >= n:
+        result[n - 1 if offset > 0 else 0] = moved.sum(axis=0)
+    elif offset > 0:
+        result[offset:] = moved[:n - offset]
+        result[n - 1] += moved[n - offset:].sum(axis=0)
+    elif offset < 0:
+        result[:n + offset] = moved[-offset:]
+        result[0] += moved[:-offset].sum(axis=0)
+    else:
+        result[:] = moved
+    return np.moveaxis(result, 0, axis)
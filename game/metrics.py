@@ -0,0 +1,354 @@
+"""
+Metrics module.
+
+Opt-in instrumentation of running games: counters (actions chosen, events,
+game endings, death causes, rescues) and latency histograms (action
+dispatch, events, end checks, saves, loads, rendering).
+
+Instrumentation is off by default. Hot paths (engine turns, events, end
+checks) only test the module flag `enabled` before doing any work, and
+slower paths (saves, loads, rendering) use timer(), which returns a shared
+no-op context manager while disabled. Enable them from code with enable(), or for
+the console game and the server by setting the SURVIVEISLAND_METRICS
+environment variable to a snapshot file path.
+
+Snapshots are exported as JSON or in the Prometheus text format (chosen by
+the file extension: ".prom" or ".txt" for Prometheus, anything else JSON).
+
+Example:
+    from game import metrics
+    metrics.enable("data/metrics.prom")
+    ...
+    metrics.flush()
+"""
+
+import bisect
+import time
+from _thread import allocate_lock
+from time import perf_counter as clock
+
+
+ENVIRONMENT_VARIABLE = "SURVIVEISLAND_METRICS"
+
+# Histogram bucket upper bounds in seconds: 1 µs to 10 s, 3 per decade
+BUCKETS = tuple(base * 10.0 ** exponent for exponent in range(-6, 1) for base in (1, 2.5, 5)) + (10.0,)
+
+# Help texts of the exported metrics
+DESCRIPTIONS = {
+    "actions_total": "Actions chosen, by action",
+    "events_total": "Random events, by event",
+    "games_ended_total": "Finished games, by status",
+    "deaths_total": "Deaths, by depleted gauge",
+    "rescues_total": "Boat rescues",
+    "turns_total": "Turns played",
+    "action_seconds": "Action dispatch latency, by action",
+    "event_seconds": "Random event draw and application latency",
+    "check_conditions_seconds": "End-of-game check latency",
+    "save_seconds": "Save latency (save_game and server autosaves)",
+    "delete_seconds": "Save deletion latency (delete_save and server autosaves)",
+    "load_seconds": "load_game latency",
+    "render_seconds": "Console rendering latency",
+    "save_cache_total": "Session cache hits, misses, evictions, flushes and writes, by result",
+    "save_cache_flush_seconds": "Session cache flush latency",
+}
+
+# Label name of the labelled metrics
+LABELS = {
+    "actions_total": "action",
+    "action_seconds": "action",
+    "events_total": "event",
+    "games_ended_total": "status",
+    "deaths_total": "cause",
+    "save_cache_total": "result",
+}
+
+enabled = False
+snapshot_path = None
+
+# Same lock as threading.Lock(), without importing threading at startup
+_lock = allocate_lock()
+_counters = {}
+_histograms = {}
+
+
+class Histogram:
+    """
+    Latency histogram with fixed buckets.
+    """
+
+    def __init__(self, bounds=BUCKETS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds):
+        """Add one measurement."""
+        self.counts[bisect.bisect_left(self.bounds, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+
+    def quantile(self, fraction):
+        """
+        Estimate a quantile (upper bound of the bucket holding it).
+
+        Returns:
+            float: Seconds, or None if the histogram is empty
+        """
+        if not self.count:
+            return None
+        rank = fraction * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "buckets": dict(zip([str(bound) for bound in self.bounds] + ["+Inf"], self.counts)),
+            "p50": self.quantile(0.5),
+            "p99": self.quantile(0.99),
+        }
+
+
+class Timer:
+    """
+    Context manager adding the duration of its block to a histogram.
+    """
+
+    __slots__ = ("name", "label", "start")
+
+    def __init__(self, name, label=None):
+        self.name = name
+        self.label = label
+
+    def __enter__(self):
+        self.start = clock()
+        return self
+
+    def __exit__(self, *exc_info):
+        observe(self.name, clock() - self.start, self.label)
+        return False
+
+
+def enable(path=None):
+    """
+    Turn instrumentation on.
+
+    Args:
+        path (str): File written by flush() (default: no snapshot file)
+    """
+    global enabled, snapshot_path
+    snapshot_path = path
+    enabled = True
+
+
+def enable_from_environment():
+    """
+    Turn instrumentation on if SURVIVEISLAND_METRICS is set.
+
+    Returns:
+        bool: True if metrics are enabled
+    """
+    import os
+
+    path = os.environ.get(ENVIRONMENT_VARIABLE)
+    if path:
+        enable(path)
+    return enabled
+
+
+def disable():
+    """Turn instrumentation off (collected values are kept)."""
+    global enabled
+    enabled = False
+
+
+def reset():
+    """Forget every collected value."""
+    with _lock:
+        _counters.clear()
+        _histograms.clear()
+
+
+def increment(name, label=None, amount=1):
+    """
+    Add to a counter.
+
+    Args:
+        name (str): Counter name
+        label (str): Label value, e.g. the action or event (default: none)
+        amount (int): Increment (default: 1)
+    """
+    key = (name, label)
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + amount
+
+
+def observe(name, seconds, label=None):
+    """
+    Add a latency measurement to a histogram.
+
+    Args:
+        name (str): Histogram name
+        seconds (float): Measured duration
+        label (str): Label value (default: none)
+    """
+    key = (name, label)
+    with _lock:
+        histogram = _histograms.get(key)
+        if histogram is None:
+            histogram = _histograms[key] = Histogram()
+        histogram.observe(seconds)
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+NULL_TIMER = _NullTimer()
+
+
+def timer(name, label=None):
+    """
+    Timer context manager for a histogram.
+
+    Returns a shared no-op context manager while metrics are disabled.
+    """
+    if not enabled:
+        return NULL_TIMER
+    return Timer(name, label)
+
+
+def record_turn(action, event, start, after_action, end):
+    """
+    Record one engine turn: the action and event chosen and their latencies.
+
+    Args:
+        action (str): Action played
+        event (str): Random event drawn
+        start (float): clock() before the action
+        after_action (float): clock() after the action
+        end (float): clock() after the event
+    """
+    with _lock:
+        for key in (("turns_total", None), ("actions_total", action), ("events_total", event)):
+            _counters[key] = _counters.get(key, 0) + 1
+    observe("action_seconds", after_action - start, action)
+    observe("event_seconds", end - after_action)
+
+
+def record_end(status, causes=()):
+    """
+    Record the end of a game.
+
+    Args:
+        status (str): Final status ("victory", "rescued" or "dead")
+        causes (tuple): Depleted gauges when the player died
+    """
+    increment("games_ended_total", status)
+    if status == "rescued":
+        increment("rescues_total")
+    for cause in causes:
+        increment("deaths_total", cause)
+
+
+def snapshot():
+    """
+    Current values of every metric.
+
+    Returns:
+        dict: {"counters": {name: {label: value}}, "histograms": {name: {label: histogram}}},
+            with "" as the label of unlabelled metrics
+    """
+    with _lock:
+        counters = {}
+        for (name, label), value in sorted(_counters.items(), key=lambda item: (item[0][0], item[0][1] or "")):
+            counters.setdefault(name, {})[label or ""] = value
+        histograms = {}
+        for (name, label), histogram in sorted(_histograms.items(), key=lambda item: (item[0][0], item[0][1] or "")):
+            histograms.setdefault(name, {})[label or ""] = histogram.to_dict()
+    return {"timestamp": time.time(), "counters": counters, "histograms": histograms}
+
+
+def to_prometheus(prefix="surviveisland_"):
+    """
+    Current values in the Prometheus text exposition format.
+
+    Returns:
+        str: Exposition text
+    """
+    data = snapshot()
+    lines = []
+
+    for name, values in data["counters"].items():
+        metric = prefix + name
+        lines.append(f"# HELP {metric} {DESCRIPTIONS.get(name, name)}")
+        lines.append(f"# TYPE {metric} counter")
+        for label, value in values.items():
+            lines.append(f"{metric}{_labels(name, label)} {value}")
+
+    for name, values in data["histograms"].items():
+        metric = prefix + name
+        lines.append(f"# HELP {metric} {DESCRIPTIONS.get(name, name)}")
+        lines.append(f"# TYPE {metric} histogram")
+        for label, histogram in values.items():
+            cumulative = 0
+            for bound, count in histogram["buckets"].items():
+                cumulative += count
+                lines.append(f"{metric}_bucket{_labels(name, label, le=bound)} {cumulative}")
+            lines.append(f"{metric}_sum{_labels(name, label)} {histogram['sum']}")
+            lines.append(f"{metric}_count{_labels(name, label)} {histogram['count']}")
+
+    return "\n".join(lines) + "\n"
+
+
+def _labels(name, label, le=None):
+    pairs = []
+    if label:
+        pairs.append(f'{LABELS.get(name, "label")}="{label}"')
+    if le is not None:
+        pairs.append(f'le="{le}"')
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def write_snapshot(path):
+    """
+    Write the current values to a file, replacing it atomically.
+
+    Args:
+        path (str): Destination; ".prom" and ".txt" files get the Prometheus
+            text format, other files JSON
+    """
+    import json
+    import os
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    if path.endswith((".prom", ".txt")):
+        content = to_prometheus()
+    else:
+        content = json.dumps(snapshot(), indent=2)
+
+    temporary = path + ".tmp"
+    with open(temporary, 'w') as f:
+        f.write(content)
+    os.replace(temporary, path)
+
+
+def flush():
+    """Write the snapshot file given to enable(), if any."""
+    if enabled and snapshot_path:
+        write_snapshot(snapshot_path)
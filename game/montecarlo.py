@@ -0,0 +1,263 @@
+"""
+Monte Carlo runner module.
+
+Plays many headless games across a process pool and merges their
+statistics: histogram of days survived, death causes (as reported by
+check_conditions) and victory/rescue rates.
+
+Games are split into fixed-size chunks and every chunk draws from its own
+random.Random seeded from (seed, chunk index). The aggregate result for a
+given seed is therefore identical whatever the number of workers.
+
+With backend="random" or "numpy", chunks draw from a game.rng.PortableRandom
+instead: the same games on both backends (but not the same games as the
+default random.Random), at the same speed.
+"""
+
+import random
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from game.player import Player
+from game.actions import ACTIONS
+from game.engine import GameSession, VICTORY, RESCUED, DEAD
+
+
+DEFAULT_CHUNK_SIZE = 10_000
+
+
+class SimulationResult:
+    """
+    Aggregated statistics of a batch of games with the same survival goal.
+
+    Results from different chunks or workers are combined with merge(),
+    which is associative and commutative.
+    """
+
+    def __init__(self, total_days):
+        """
+        Initialize an empty result.
+
+        Args:
+            total_days (int): Target number of days to survive
+        """
+        self.total_days = total_days
+        self.games = 0
+        self.outcomes = Counter()
+        self.death_causes = Counter()
+        self.days_histogram = [0] * (total_days + 1)
+
+    def add(self, status, causes, days_survived):
+        """
+        Record one finished game.
+
+        Args:
+            status (str): Final status (VICTORY, RESCUED or DEAD)
+            causes (tuple): Depleted gauges when dead
+            days_survived (int): Days survived when the game ended
+        """
+        self.games += 1
+        self.outcomes[status] += 1
+        if status == DEAD:
+            self.death_causes[" and ".join(causes)] += 1
+        self.days_histogram[days_survived] += 1
+
+    def merge(self, other):
+        """
+        Add the statistics of another result into this one.
+
+        Args:
+            other (SimulationResult): Result with the same survival goal
+
+        Returns:
+            SimulationResult: self, to allow chaining
+        """
+        if other.total_days != self.total_days:
+            raise ValueError("Cannot merge results with different survival goals.")
+
+        self.games += other.games
+        self.outcomes.update(other.outcomes)
+        self.death_causes.update(other.death_causes)
+        for day, count in enumerate(other.days_histogram):
+            self.days_histogram[day] += count
+        return self
+
+    def rate(self, status):
+        """
+        Fraction of games that ended with the given status.
+
+        Args:
+            status (str): VICTORY, RESCUED or DEAD
+
+        Returns:
+            float: Rate between 0 and 1 (0 if no game was played)
+        """
+        return self.outcomes[status] / self.games if self.games else 0.0
+
+    @property
+    def victory_rate(self):
+        """float: Fraction of games won by surviving until the goal."""
+        return self.rate(VICTORY)
+
+    @property
+    def rescue_rate(self):
+        """float: Fraction of games ended by the boat rescue."""
+        return self.rate(RESCUED)
+
+    @property
+    def death_rate(self):
+        """float: Fraction of games lost."""
+        return self.rate(DEAD)
+
+    @property
+    def mean_days(self):
+        """float: Average number of days survived (0 if no game was played)."""
+        if not self.games:
+            return 0.0
+        return sum(day * count for day, count in enumerate(self.days_histogram)) / self.games
+
+    @classmethod
+    def from_population(cls, population):
+        """
+        Summarize the games of a vectorized simulation.
+
+        Args:
+            population (PopulationResult): Result of game.population.simulate
+
+        Returns:
+            SimulationResult: Same statistics as if the games were played here
+        """
+        result = cls(population.total_days)
+        result.games = len(population)
+        result.outcomes.update({status: count for status, count in population.outcome_counts().items() if count})
+        result.death_causes.update(population.cause_counts())
+        result.days_histogram = [int(count) for count in population.days_histogram()]
+        return result
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, SimulationResult)
+            and self.total_days == other.total_days
+            and self.games == other.games
+            and self.outcomes == other.outcomes
+            and self.death_causes == other.death_causes
+            and self.days_histogram == other.days_histogram
+        )
+
+    def to_dict(self):
+        """
+        Convert the result to plain data (e.g. for JSON output).
+
+        Returns:
+            dict: All counters and rates
+        """
+        return {
+            "total_days": self.total_days,
+            "games": self.games,
+            "outcomes": dict(self.outcomes),
+            "death_causes": dict(self.death_causes),
+            "days_histogram": list(self.days_histogram),
+            "victory_rate": self.victory_rate,
+            "rescue_rate": self.rescue_rate,
+            "death_rate": self.death_rate,
+            "mean_days": self.mean_days,
+        }
+
+
+def chunk_rng(seed, chunk, backend=None):
+    """
+    Create the random generator dedicated to one chunk of games.
+
+    Args:
+        seed (int): Seed of the whole run
+        chunk (int): Index of the chunk
+        backend (str): None for a random.Random, "random" or "numpy" for a
+            game.rng.PortableRandom on that backend (default: None)
+
+    Returns:
+        random.Random or PortableRandom: Independent generator for this chunk
+    """
+    if backend is None:
+        return random.Random(f"{seed}:{chunk}")
+    from game.rng import PortableRandom
+    return PortableRandom(f"{seed}:{chunk}", backend=backend)
+
+
+def _make_policy(policy, rng):
+    if policy == "random":
+        actions = list(ACTIONS)
+        return lambda player, total_days: rng.choice(actions)
+    if isinstance(policy, str):
+        return lambda player, total_days: policy
+    return policy
+
+
+def run_chunk(seed, chunk, n_games, total_days, policy="random", backend=None):
+    """
+    Play one chunk of games with its own random generator.
+
+    Args:
+        seed (int): Seed of the whole run
+        chunk (int): Index of the chunk
+        n_games (int): Number of games in this chunk
+        total_days (int): Target number of days to survive
+        policy: "random", an action number ("1" to "4") or a picklable
+            callable (player, total_days) -> action number
+        backend (str): Random generator backend (see chunk_rng, default: None)
+
+    Returns:
+        SimulationResult: Statistics of the chunk
+    """
+    rng = chunk_rng(seed, chunk, backend)
+    choose = _make_policy(policy, rng)
+    result = SimulationResult(total_days)
+
+    for _ in range(n_games):
+        session = GameSession(player=Player(), total_days=total_days, rng=rng)
+        status = session.run(choose)
+        result.add(status, session.causes, session.player.days_survived)
+
+    return result
+
+
+def _run_chunk_args(args):
+    return run_chunk(*args)
+
+
+def run_monte_carlo(n_games, total_days=10, policy="random", seed=0, workers=None,
+                    chunk_size=DEFAULT_CHUNK_SIZE, backend=None):
+    """
+    Play n_games headless games in parallel and merge their statistics.
+
+    Args:
+        n_games (int): Total number of games
+        total_days (int): Target number of days to survive (default: 10)
+        policy: "random" (default), an action number ("1" to "4") or a
+            picklable callable (player, total_days) -> action number
+        seed (int): Seed of the run (default: 0)
+        workers (int): Number of processes; 1 runs in the current process
+            (default: one per CPU)
+        chunk_size (int): Games per chunk. Part of the experiment definition:
+            changing it changes the random streams (default: 10,000)
+        backend (str): None for random.Random chunks, "random" or "numpy" for
+            portable generators; both give the same result (default: None)
+
+    Returns:
+        SimulationResult: Merged statistics of all games
+    """
+    tasks = []
+    for chunk, start in enumerate(range(0, n_games, chunk_size)):
+        tasks.append((seed, chunk, min(chunk_size, n_games - start), total_days, policy, backend))
+
+    result = SimulationResult(total_days)
+
+    if workers == 1 or len(tasks) <= 1:
+        for task in tasks:
+            result.merge(_run_chunk_args(task))
+        return result
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for partial in executor.map(_run_chunk_args, tasks):
+            result.merge(partial)
+
+    return result
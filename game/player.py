@@ -66,3 +66,20 @@ class Player:
         if not self.is_alive():
             print("⚠️  ALERT: Player is in critical danger!")
             print("=" * 40)
+
+
+class SlottedPlayer:
+    """
+    Memory-compact variant of Player.
+    
+    Same attributes and methods as Player, but stored in __slots__ instead
+    of a per-instance __dict__, which makes instances smaller and attribute
+    access faster. Extra attributes cannot be added to instances.
+    """
+    
+    __slots__ = ("name", "hunger", "thirst", "energy", "days_survived")
+    
+    __init__ = Player.__init__
+    update_gauges = Player.update_gauges
+    is_alive = Player.is_alive
+    display_status = Player.display_status
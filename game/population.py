@@ -0,0 +1,240 @@
+"""
+Population simulator module.
+
+Simulates many castaways at once with NumPy. The state of every player is
+stored as a structure of arrays (hunger, thirst, energy, days, status) and
+each turn applies the action outcomes from game.actions, the weighted
+events from game.evenements and the daily decay from game.engine to all
+players that are still playing.
+
+Requires NumPy.
+"""
+
+import numpy as np
+
+from game import engine
+from game.actions import ACTIONS
+from game.evenements import EVENTS
+from game.engine import ONGOING, VICTORY, RESCUED, DEAD
+
+
+# Status codes stored in PopulationResult.status
+STATUS_NAMES = (ONGOING, VICTORY, RESCUED, DEAD)
+STATUS_ONGOING, STATUS_VICTORY, STATUS_RESCUED, STATUS_DEAD = range(4)
+
+# Bits stored in PopulationResult.causes
+CAUSE_HUNGER = 1
+CAUSE_THIRST = 2
+CAUSE_ENERGY = 4
+
+ACTION_CODES = (1, 2, 3, 4)
+
+
+def cause_label(mask):
+    """
+    Convert a death cause bitmask into the text used by check_conditions.
+
+    Args:
+        mask (int): Combination of CAUSE_HUNGER, CAUSE_THIRST and CAUSE_ENERGY
+
+    Returns:
+        str: Causes joined with " and ", e.g. "hunger and thirst"
+    """
+    names = []
+    if mask & CAUSE_HUNGER:
+        names.append("hunger")
+    if mask & CAUSE_THIRST:
+        names.append("thirst")
+    if mask & CAUSE_ENERGY:
+        names.append("energy")
+    return " and ".join(names)
+
+
+def _compile_actions():
+    """
+    Build the action outcome tables from ACTIONS.
+
+    Returns:
+        tuple: (deltas, counts)
+            - deltas: int16 array (5, max_outcomes, 3), indexed by action code
+            - counts: int64 array (5,) with the number of outcomes per action
+    """
+    width = max(len(ACTIONS[str(code)]["outcomes"]) for code in ACTION_CODES)
+    deltas = np.zeros((5, width, 3), dtype=np.int16)
+    counts = np.ones(5, dtype=np.int64)
+
+    for code in ACTION_CODES:
+        outcomes = ACTIONS[str(code)]["outcomes"]
+        counts[code] = len(outcomes)
+        for i, (_, delta_hunger, delta_thirst, delta_energy) in enumerate(outcomes):
+            deltas[code, i] = (delta_hunger, delta_thirst, delta_energy)
+
+    return deltas, counts
+
+
+def _compile_events():
+    """
+    Flatten EVENTS into one row per (event, outcome) pair.
+
+    Returns:
+        tuple: (cumulative, deltas, rescue)
+            - cumulative: float64 array of cumulative row probabilities
+            - deltas: int16 array (rows, 3)
+            - rescue: bool array flagging the terminal (rescue) rows
+    """
+    total = sum(info["weight"] for info in EVENTS.values())
+    probabilities, deltas, rescue = [], [], []
+
+    for info in EVENTS.values():
+        outcomes = info["outcomes"]
+        for _, delta_hunger, delta_thirst, delta_energy in outcomes:
+            probabilities.append(info["weight"] / total / len(outcomes))
+            deltas.append((delta_hunger, delta_thirst, delta_energy))
+            rescue.append(info.get("terminal", False))
+
+    cumulative = np.cumsum(probabilities)
+    cumulative[-1] = 1.0
+    return cumulative, np.array(deltas, dtype=np.int16), np.array(rescue, dtype=bool)
+
+
+class PopulationResult:
+    """
+    Final state of every simulated game.
+
+    Attributes:
+        days (ndarray): Days survived by each player
+        status (ndarray): Final status code (STATUS_VICTORY, STATUS_RESCUED or STATUS_DEAD)
+        causes (ndarray): Death cause bitmask (0 unless dead)
+        total_days (int): Target number of days to survive
+    """
+
+    def __init__(self, days, status, causes, total_days):
+        self.days = days
+        self.status = status
+        self.causes = causes
+        self.total_days = total_days
+
+    def __len__(self):
+        return len(self.days)
+
+    def outcome_counts(self):
+        """
+        Count the games per final status.
+
+        Returns:
+            dict: Status name -> number of games
+        """
+        counts = np.bincount(self.status, minlength=len(STATUS_NAMES))
+        return {name: int(counts[code]) for code, name in enumerate(STATUS_NAMES) if code != STATUS_ONGOING}
+
+    def cause_counts(self):
+        """
+        Count deaths per cause, labelled as in check_conditions.
+
+        Returns:
+            dict: Cause label (e.g. "thirst and energy") -> number of deaths
+        """
+        counts = np.bincount(self.causes[self.status == STATUS_DEAD], minlength=8)
+        return {cause_label(mask): int(counts[mask]) for mask in range(1, 8) if counts[mask]}
+
+    def days_histogram(self):
+        """
+        Count the games per number of days survived.
+
+        Returns:
+            ndarray: histogram[d] = number of games that ended after d days
+        """
+        return np.bincount(self.days, minlength=self.total_days + 1)
+
+
+def simulate(n_players, total_days=10, policy="random", seed=None, batch_size=1_000_000):
+    """
+    Simulate n_players independent games with the same survival goal.
+
+    Args:
+        n_players (int): Number of games to simulate
+        total_days (int): Target number of days to survive (default: 10)
+        policy: Action choice for every turn. One of:
+            - "random": uniform choice among the four actions (default)
+            - an action number ("1" to "4") or code (1 to 4)
+            - a callable (hunger, thirst, energy, days) -> int array of codes,
+              called with the arrays of the players still in play
+        seed: Seed for numpy.random.default_rng (default: None)
+        batch_size (int): Number of games simulated together (default: 1,000,000)
+
+    Returns:
+        PopulationResult: Final state of every game
+    """
+    rng = np.random.default_rng(seed)
+    action_deltas, action_counts = _compile_actions()
+    event_cumulative, event_deltas, event_rescue = _compile_events()
+    decay = np.array(engine.DAILY_DECAY, dtype=np.int16)
+
+    days = np.zeros(n_players, dtype=np.int16)
+    status = np.zeros(n_players, dtype=np.int8)
+    causes = np.zeros(n_players, dtype=np.uint8)
+
+    for start in range(0, n_players, batch_size):
+        stop = min(start + batch_size, n_players)
+        _simulate_batch(
+            rng, np.arange(start, stop), total_days, policy,
+            action_deltas, action_counts, event_cumulative, event_deltas, event_rescue, decay,
+            days, status, causes
+        )
+
+    return PopulationResult(days, status, causes, total_days)
+
+
+def _choose_actions(policy, rng, gauges, days):
+    if isinstance(policy, str) and policy == "random":
+        return rng.integers(1, 5, size=len(days))
+    if callable(policy):
+        return np.asarray(policy(gauges[:, 0], gauges[:, 1], gauges[:, 2], days), dtype=np.int64)
+    return np.full(len(days), int(policy), dtype=np.int64)
+
+
+def _simulate_batch(rng, index, total_days, policy,
+                    action_deltas, action_counts, event_cumulative, event_deltas, event_rescue, decay,
+                    out_days, out_status, out_causes):
+    n = len(index)
+    gauges = np.full((n, 3), 100, dtype=np.int16)
+    days = np.zeros(n, dtype=np.int16)
+
+    while n:
+        # Action
+        actions = _choose_actions(policy, rng, gauges, days)
+        rows = (rng.random(n) * action_counts[actions]).astype(np.int64)
+        gauges += action_deltas[actions, rows]
+        np.clip(gauges, 0, 100, out=gauges)
+
+        # Random event
+        rows = np.searchsorted(event_cumulative, rng.random(n), side="right")
+        gauges += event_deltas[rows]
+        np.clip(gauges, 0, 100, out=gauges)
+        rescued = event_rescue[rows]
+
+        # Daily decay for everyone (the rescued players leave the batch
+        # anyway), but the day only counts for those that were not rescued
+        gauges += decay
+        np.clip(gauges, 0, 100, out=gauges)
+        days += 1
+        days[rescued] -= 1
+
+        depleted = gauges <= 0
+        dead = depleted.any(axis=1) & ~rescued
+        victory = ~dead & ~rescued & (days >= total_days)
+        finished = rescued | dead | victory
+
+        if finished.any():
+            ended = index[finished]
+            out_days[ended] = days[finished]
+            code = np.where(rescued, STATUS_RESCUED, np.where(dead, STATUS_DEAD, STATUS_VICTORY))
+            out_status[ended] = code[finished]
+            mask = (depleted[:, 0] * CAUSE_HUNGER) | (depleted[:, 1] * CAUSE_THIRST) | (depleted[:, 2] * CAUSE_ENERGY)
+            out_causes[ended] = np.where(dead, mask, 0)[finished]
+
+            keep = ~finished
+            index = index[keep]
+            gauges = gauges[keep]
+            days = days[keep]
+            n = len(index)
@@ -0,0 +1,684 @@
+"""
+Rare-event estimation module.
+
+Estimates the probability of rare outcomes (surviving a long goal, dying
+from one specific cause) with far fewer simulated turns than plain
+sampling, through three variance reduction methods:
+- importance sampling: games are played with tilted odds (event weights,
+  action and event outcome odds) and every game is weighted by its
+  likelihood ratio, the product of original / tilted probabilities of its
+  draws, so the estimate stays unbiased. The tilt is tuned automatically
+  by the cross-entropy method, or given by hand.
+- multilevel splitting: the games that reach an intermediate level (days
+  survived, or how low a gauge went) are cloned and continued, and the
+  probability is the product of the level-to-level success rates.
+- common random numbers: two strategies play the same seeded games (one
+  uniform per draw, three per turn), so the noise of their difference is
+  much smaller than with independent games.
+
+Games are played on the compiled effect tables of game.content with the
+same rules as game.engine: action outcome, weighted event, event outcome,
+rescue on terminal events, daily decay, end checks. Every result is an
+Estimate with a 95% confidence interval, the number of turns simulated and
+the number of turns plain sampling would need for the same precision.
+
+Events: "victory", "rescued", "dead", or "death:<gauge>" (dying with that
+gauge depleted, e.g. "death:thirst").
+
+Usage:
+    python -m game.rare importance --days 50 --event victory --policy threshold_s40_g60 [--target 0.05]
+    python -m game.rare split --days 50 --event death:thirst --policy greedy_rest30
+    python -m game.rare compare --days 50 --policy threshold_s40_g60 --against greedy_rest30
+"""
+
+import math
+import random
+from bisect import bisect
+from itertools import accumulate
+
+from game import actions, engine
+from game.player import Player
+from game.actions import ACTIONS
+from game.content import DELTA_HUNGER, DELTA_THIRST, DELTA_ENERGY, GAUGES
+from game.engine import check_status, ONGOING, VICTORY, RESCUED, DEAD
+from game.evenements import EVENTS, EVENT_REGISTRY
+from game.tournament import Z_95
+
+
+# Cross-entropy tuning: games per iteration, elite fraction, smoothing
+CE_GAMES = 2_000
+CE_ELITE = 0.1
+CE_SMOOTHING = 0.7
+# Share of the original odds mixed into a tuned proposal, which keeps every
+# likelihood ratio bounded
+CE_FLOOR = 0.02
+
+
+class Estimate:
+    """
+    Probability estimate with its precision and cost.
+
+    Attributes:
+        value (float): Estimated probability
+        stderr (float): Standard error of the estimate
+        games (int): Games (or particles) simulated
+        turns (int): Turns simulated, tuning included
+        plain_turns (float): Turns plain sampling would need for the same
+            standard error (None if unknown)
+        method (str): Estimation method
+        bounded (bool): The value is a probability, so its interval is
+            clipped to [0, 1] (False for differences)
+    """
+
+    def __init__(self, value, stderr, games, turns, plain_turns=None, method="", bounded=True):
+        self.value = value
+        self.stderr = stderr
+        self.games = games
+        self.turns = turns
+        self.plain_turns = plain_turns
+        self.method = method
+        self.bounded = bounded
+
+    def interval(self, z=Z_95):
+        """
+        Confidence interval (normal approximation).
+
+        Returns:
+            tuple: (low, high), 95% by default
+        """
+        low, high = self.value - z * self.stderr, self.value + z * self.stderr
+        if self.bounded:
+            return max(0.0, low), min(1.0, high)
+        return low, high
+
+    @property
+    def relative_error(self):
+        """float: Standard error divided by the estimate (inf for a zero estimate)."""
+        return self.stderr / abs(self.value) if self.value else math.inf
+
+    @property
+    def speedup(self):
+        """float: plain_turns / turns, or None."""
+        if self.plain_turns is None or not self.turns:
+            return None
+        return self.plain_turns / self.turns
+
+    def to_dict(self):
+        low, high = self.interval()
+        return {
+            "method": self.method,
+            "value": self.value,
+            "stderr": self.stderr,
+            "interval": [low, high],
+            "games": self.games,
+            "turns": self.turns,
+            "plain_turns": self.plain_turns,
+        }
+
+    def __str__(self):
+        low, high = self.interval()
+        text = (f"{self.method}: {self.value:.4g} (95% CI {low:.4g} - {high:.4g}, "
+                f"relative error {100 * self.relative_error:.1f}%) in {self.turns:,} turns")
+        if self.speedup is not None:
+            text += f", {self.speedup:,.0f}x fewer than plain sampling"
+        return text
+
+
+class _Choice:
+    """One random draw of a turn, with its original and proposal odds."""
+
+    def __init__(self, key, items, probabilities, proposal=None):
+        if proposal is None:
+            proposal = probabilities
+        if len(proposal) != len(items):
+            raise ValueError(f"{key}: expected {len(items)} proposal weights, got {len(proposal)}.")
+        total_p = sum(probabilities)
+        total_q = sum(proposal)
+        if total_q <= 0 or any(q < 0 for q in proposal):
+            raise ValueError(f"{key}: proposal weights must be >= 0 with a positive total.")
+        ratios = []
+        for p, q in zip(probabilities, proposal):
+            if p > 0 and q <= 0:
+                raise ValueError(f"{key}: an outcome with a nonzero probability needs a nonzero proposal weight.")
+            ratios.append((p / total_p) / (q / total_q) if q > 0 else 0.0)
+
+        self.key = key
+        self.items = tuple(items)
+        self.probabilities = [p / total_p for p in probabilities]
+        self.proposal = [q / total_q for q in proposal]
+        self.ratios = ratios
+        self.cum_weights = list(accumulate(self.proposal))
+        self.total = self.cum_weights[-1]
+        self.hi = len(items) - 1
+
+    def index(self, u):
+        return bisect(self.cum_weights, u * self.total, 0, self.hi)
+
+
+class Dynamics:
+    """
+    Turn-by-turn game rules with optional tilted odds.
+
+    A proposal is a dict with any of these sections (relative weights):
+        {"events": {name: weight},
+         "actions": {action number: [weight per outcome]},
+         "outcomes": {event name: [weight per outcome]}}
+    Missing entries keep the original odds.
+    """
+
+    def __init__(self, proposal=None):
+        """
+        Compile the current rules.
+
+        Args:
+            proposal (dict): Tilted odds (default: None, the original odds)
+
+        Raises:
+            ValueError: If the proposal is invalid or cannot be corrected
+                (an outcome of the rules it never draws)
+        """
+        proposal = proposal or {}
+        effects = EVENT_REGISTRY.effect_table()
+
+        action_odds = proposal.get("actions", {})
+        outcomes = proposal.get("outcomes", {})
+        events = proposal.get("events", {})
+        for section, table in (("actions", action_odds), ("outcomes", outcomes), ("events", events)):
+            known = ACTIONS if section == "actions" else EVENTS
+            for key in table:
+                if key not in known:
+                    raise ValueError(f"{section}.{key}: unknown {section[:-1]}.")
+
+        self.proposal = proposal
+        self.actions = {}
+        for key in ACTIONS:
+            rows = actions.ACTION_EFFECTS.groups[key]
+            self.actions[key] = _Choice(f"actions.{key}", rows, [1.0] * len(rows), action_odds.get(key))
+
+        names = EVENT_REGISTRY.names
+        weights = [EVENTS[name]["weight"] for name in names]
+        self.events = _Choice("events", names, weights, [events.get(name, weight) for name, weight in zip(names, weights)])
+
+        self.outcomes = {}
+        for name in names:
+            rows = effects.groups[name]
+            self.outcomes[name] = _Choice(f"outcomes.{name}", rows, [1.0] * len(rows), outcomes.get(name))
+        self.terminal = dict(EVENT_REGISTRY.terminal)
+
+    def choices(self):
+        """
+        Every draw of a turn.
+
+        Returns:
+            list: _Choice objects (actions, events, event outcomes)
+        """
+        return list(self.actions.values()) + [self.events] + list(self.outcomes.values())
+
+    def run(self, player, policy, total_days, uniform, until=None, counts=None):
+        """
+        Play turns until the game ends (or reaches a level).
+
+        Every turn draws exactly three uniforms, in order: action outcome,
+        event, event outcome.
+
+        Args:
+            player (Player): Player, updated in place
+            policy (callable): (player, total_days) -> action number
+            total_days (int): Target number of days to survive
+            uniform (callable): Returns a float in [0, 1)
+            until (callable): player -> True to stop while the game goes on (default: None)
+            counts (dict): _Choice key -> list of draws per outcome, updated (default: None)
+
+        Returns:
+            tuple: (status, causes, likelihood ratio, turns); status is
+                ONGOING when stopped by `until`
+        """
+        action_choices = self.actions
+        events = self.events
+        outcomes = self.outcomes
+        terminal = self.terminal
+        decay = engine.DAILY_DECAY
+        weight = 1.0
+        turns = 0
+
+        while True:
+            choice = action_choices[policy(player, total_days)]
+            i = choice.index(uniform())
+            row = choice.items[i]
+            weight *= choice.ratios[i]
+            player.update_gauges(row[DELTA_HUNGER], row[DELTA_THIRST], row[DELTA_ENERGY])
+            if counts is not None:
+                counts[choice.key][i] += 1
+
+            j = events.index(uniform())
+            event = events.items[j]
+            weight *= events.ratios[j]
+            outcome = outcomes[event]
+            k = outcome.index(uniform())
+            row = outcome.items[k]
+            weight *= outcome.ratios[k]
+            player.update_gauges(row[DELTA_HUNGER], row[DELTA_THIRST], row[DELTA_ENERGY])
+            if counts is not None:
+                counts[events.key][j] += 1
+                counts[outcome.key][k] += 1
+
+            turns += 1
+            if terminal[event]:
+                return RESCUED, (), weight, turns
+
+            player.update_gauges(*decay)
+            player.days_survived += 1
+            status, causes = check_status(player, player.days_survived, total_days)
+            if status != ONGOING:
+                return status, causes, weight, turns
+            if until is not None and until(player):
+                return ONGOING, (), weight, turns
+
+
+def indicator(event):
+    """
+    Test of a final outcome.
+
+    Args:
+        event (str): "victory", "rescued", "dead" or "death:<gauge>"
+
+    Returns:
+        callable: (status, causes) -> bool
+
+    Raises:
+        ValueError: If the event is unknown
+    """
+    if event in (VICTORY, RESCUED, DEAD):
+        return lambda status, causes: status == event
+    if event.startswith("death:") and event[6:] in GAUGES:
+        gauge = event[6:]
+        return lambda status, causes: gauge in causes
+    raise ValueError(f"Unknown event {event!r}: expected victory, rescued, dead or death:<gauge>.")
+
+
+def score_function(event, total_days):
+    """
+    Progress of a game toward an event, used as importance function.
+
+    Args:
+        event (str): "victory", "dead" or "death:<gauge>"
+        total_days (int): Target number of days to survive
+
+    Returns:
+        tuple: (player -> score, score reached by the event)
+
+    Raises:
+        ValueError: If the event has no score (e.g. "rescued", which is not rare)
+    """
+    if event == VICTORY:
+        return (lambda player: player.days_survived), total_days
+    if event == DEAD:
+        return (lambda player: 100 - min(player.hunger, player.thirst, player.energy)), 100
+    if event.startswith("death:") and event[6:] in GAUGES:
+        gauge = event[6:]
+        return (lambda player: 100 - getattr(player, gauge)), 100
+    raise ValueError(f"No score for event {event!r}: expected victory, dead or death:<gauge>.")
+
+
+def resolve_policy(policy):
+    """
+    Get a strategy callable.
+
+    Args:
+        policy: Callable, name of a bot in game.bots.BOTS, or action number
+
+    Returns:
+        callable: (player, total_days) -> action number
+    """
+    if callable(policy):
+        return policy
+    if policy in ACTIONS:
+        return lambda player, total_days: policy
+    from game.bots import get_bot
+    return get_bot(policy)
+
+
+def _clone(player):
+    return Player(name=player.name, hunger=player.hunger, thirst=player.thirst,
+                  energy=player.energy, days_survived=player.days_survived)
+
+
+def importance_sampling(policy, total_days=50, event=VICTORY, proposal="auto", games=100_000,
+                        target=None, seed=0, player=None, batch_size=10_000):
+    """
+    Estimate the probability of an event with importance sampling.
+
+    Args:
+        policy: Strategy (see resolve_policy)
+        total_days (int): Target number of days to survive (default: 50)
+        event (str): Outcome to estimate (default: "victory")
+        proposal: "auto" to tune one with cross_entropy(), a proposal dict
+            (see Dynamics), or None for plain sampling (default: "auto")
+        games (int): Maximum number of games (default: 100,000)
+        target (float): Stop once the relative error is below this, e.g.
+            0.01 for 1% (default: play every game)
+        seed (int): Seed of the games (default: 0)
+        player (Player): Starting state (default: a fresh Player)
+        batch_size (int): Games between two precision checks (default: 10,000)
+
+    Returns:
+        Estimate: The estimate; plain_turns is estimated from the same games
+    """
+    policy = resolve_policy(policy)
+    test = indicator(event)
+    start = player or Player()
+    turns = 0
+    if proposal == "auto":
+        proposal, turns = cross_entropy(policy, total_days, event, seed=seed, player=start)
+    dynamics = Dynamics(proposal)
+    uniform = random.Random(f"{seed}:importance").random
+
+    played = 0
+    total = total_squares = weighted_turns = 0.0
+    while played < games:
+        for _ in range(min(batch_size, games - played)):
+            status, causes, weight, length = dynamics.run(_clone(start), policy, total_days, uniform)
+            played += 1
+            turns += length
+            weighted_turns += weight * length
+            if test(status, causes):
+                total += weight
+                total_squares += weight * weight
+        if target is not None and total > 0 and _stderr(total, total_squares, played) / (total / played) <= target:
+            break
+
+    value = total / played
+    stderr = _stderr(total, total_squares, played)
+    plain_turns = None
+    if proposal and stderr > 0:
+        # Plain sampling needs p(1 - p) / stderr² games of weighted_turns / played turns on average
+        plain_turns = value * (1 - value) / stderr ** 2 * (weighted_turns / played)
+    method = "importance sampling" if proposal else "plain sampling"
+    return Estimate(value, stderr, played, turns, plain_turns, method)
+
+
+def _stderr(total, total_squares, n):
+    if n < 2:
+        return math.inf
+    mean = total / n
+    variance = max(0.0, (total_squares - n * mean * mean) / (n - 1))
+    return math.sqrt(variance / n)
+
+
+def cross_entropy(policy, total_days=50, event=VICTORY, games=CE_GAMES, elite=CE_ELITE,
+                  smoothing=CE_SMOOTHING, iterations=20, seed=0, player=None):
+    """
+    Tune an importance sampling proposal with the cross-entropy method.
+
+    Every iteration plays games with the current proposal, keeps the best
+    `elite` fraction by score (see score_function), capped at the score of
+    the event, and sets the new odds of every draw to its likelihood-weighted
+    frequency among them, smoothed with the previous odds. It stops after
+    an iteration where the event itself was the elite level.
+
+    Args:
+        policy: Strategy (see resolve_policy)
+        total_days (int): Target number of days to survive (default: 50)
+        event (str): "victory", "dead" or "death:<gauge>" (default: "victory")
+        games (int): Games per iteration (default: 2,000)
+        elite (float): Elite fraction (default: 0.1)
+        smoothing (float): Weight of the new odds (default: 0.7)
+        iterations (int): Maximum number of iterations (default: 20)
+        seed (int): Seed of the games (default: 0)
+        player (Player): Starting state (default: a fresh Player)
+
+    Returns:
+        tuple: (proposal dict, turns simulated)
+    """
+    policy = resolve_policy(policy)
+    score, level = score_function(event, total_days)
+    test = indicator(event)
+    start = player or Player()
+    uniform = random.Random(f"{seed}:cross-entropy").random
+    proposal = None
+    turns = 0
+
+    for _ in range(iterations):
+        dynamics = Dynamics(proposal)
+        samples = []
+        for _ in range(games):
+            counts = {choice.key: [0] * len(choice.items) for choice in dynamics.choices()}
+            current = _clone(start)
+            status, causes, weight, length = dynamics.run(current, policy, total_days, uniform, counts=counts)
+            turns += length
+            reached = level if test(status, causes) else min(score(current), level - 1)
+            samples.append((reached, weight, counts))
+
+        ordered = sorted(reached for reached, _, _ in samples)
+        threshold = min(level, ordered[int((1 - elite) * (len(ordered) - 1))])
+        selected = [(weight, counts) for reached, weight, counts in samples if reached >= threshold]
+
+        tilted = {"events": {}, "actions": {}, "outcomes": {}}
+        for choice in dynamics.choices():
+            frequencies = [0.0] * len(choice.items)
+            for weight, counts in selected:
+                for i, count in enumerate(counts[choice.key]):
+                    frequencies[i] += weight * count
+            total = sum(frequencies)
+            odds = []
+            for i, p in enumerate(choice.probabilities):
+                new = frequencies[i] / total if total > 0 else choice.proposal[i]
+                q = smoothing * new + (1 - smoothing) * choice.proposal[i]
+                odds.append((1 - CE_FLOOR) * q + CE_FLOOR * p)
+            section, _, key = choice.key.partition(".")
+            if section == "events":
+                tilted["events"] = dict(zip(choice.items, odds))
+            else:
+                tilted[section][key] = odds
+        proposal = tilted
+
+        if threshold >= level:
+            break
+
+    return proposal, turns
+
+
+def splitting(policy, total_days=50, event=VICTORY, levels=None, particles=2_000, runs=10,
+              seed=0, player=None):
+    """
+    Estimate the probability of an event with multilevel splitting.
+
+    Each run starts `particles` games, plays them until they reach the next
+    level of the score (see score_function) or end, and restarts the same
+    number of games from copies of those that reached it. The probability
+    is the product of the success rates of the levels; the final level is
+    the event itself. The runs are independent, so the confidence interval
+    comes from their spread.
+
+    Args:
+        policy: Strategy (see resolve_policy)
+        total_days (int): Target number of days to survive (default: 50)
+        event (str): "victory", "dead" or "death:<gauge>" (default: "victory")
+        levels (list): Increasing intermediate score levels (default: 8
+            evenly spaced levels)
+        particles (int): Games per level (default: 2,000)
+        runs (int): Independent runs (default: 10)
+        seed (int): Seed of the games (default: 0)
+        player (Player): Starting state (default: a fresh Player)
+
+    Returns:
+        Estimate: The estimate (games counts every particle of every level)
+    """
+    policy = resolve_policy(policy)
+    score, level = score_function(event, total_days)
+    test = indicator(event)
+    start = player or Player()
+    if levels is None:
+        first = score(start)
+        levels = sorted({first + (level - first) * k // 9 for k in range(1, 9)} - {first, level})
+    levels = [value for value in levels if value < level] + [None]
+
+    dynamics = Dynamics()
+    rng = random.Random(f"{seed}:splitting")
+    uniform = rng.random
+    estimates = []
+    turns = 0
+
+    for _ in range(runs):
+        # (player, True once the game ended with the event, past every level)
+        states = [(start, False)] * particles
+        estimate = 1.0
+        for threshold in levels:
+            until = None if threshold is None else (lambda player, threshold=threshold: score(player) >= threshold)
+            survivors = []
+            for state, done in states:
+                if done:
+                    survivors.append((state, True))
+                    continue
+                current = _clone(state)
+                status, causes, _, length = dynamics.run(current, policy, total_days, uniform, until=until)
+                turns += length
+                if status == ONGOING:
+                    survivors.append((current, False))
+                elif test(status, causes):
+                    survivors.append((current, True))
+            estimate *= len(survivors) / particles
+            if not survivors:
+                break
+            if threshold is not None:
+                states = [rng.choice(survivors) for _ in range(particles)]
+        estimates.append(estimate)
+
+    value = sum(estimates) / runs
+    stderr = _stderr(sum(estimates), sum(x * x for x in estimates), runs)
+    plain_turns = None
+    if 0 < stderr < math.inf:
+        # Mean length of a plain game, from a small reference sample (not counted in turns)
+        plain = importance_sampling(policy, total_days, event, proposal=None, games=2_000, seed=seed, player=start)
+        plain_turns = value * (1 - value) / stderr ** 2 * (plain.turns / plain.games)
+    return Estimate(value, stderr, runs * particles * len(levels), turns, plain_turns, "multilevel splitting")
+
+
+class Comparison:
+    """
+    Two strategies estimated on common random numbers.
+
+    Attributes:
+        first (Estimate): Estimate for the first strategy
+        second (Estimate): Estimate for the second strategy
+        difference (Estimate): first - second (paired)
+        variance_reduction (float): Variance of the difference with
+            independent games divided by its variance with common ones
+    """
+
+    def __init__(self, first, second, difference, variance_reduction):
+        self.first = first
+        self.second = second
+        self.difference = difference
+        self.variance_reduction = variance_reduction
+
+
+def compare(first, second, total_days=50, event=VICTORY, games=100_000, seed=0, player=None):
+    """
+    Compare the probability of an event under two strategies.
+
+    Game i of both strategies draws from the same seeded stream, and every
+    turn consumes three uniforms whatever the action, so both strategies
+    face the same events on the same days as long as both are still playing.
+
+    Args:
+        first, second: Strategies (see resolve_policy)
+        total_days (int): Target number of days to survive (default: 50)
+        event (str): Outcome to estimate (default: "victory")
+        games (int): Games per strategy (default: 100,000)
+        seed (int): Seed of the games (default: 0)
+        player (Player): Starting state (default: a fresh Player)
+
+    Returns:
+        Comparison: Both estimates and their difference
+    """
+    policies = (resolve_policy(first), resolve_policy(second))
+    test = indicator(event)
+    start = player or Player()
+    dynamics = Dynamics()
+    sums = [0, 0]
+    difference = difference_squares = 0
+    turns = [0, 0]
+
+    for game in range(games):
+        results = []
+        for index, policy in enumerate(policies):
+            uniform = random.Random(f"{seed}:{game}").random
+            status, causes, _, length = dynamics.run(_clone(start), policy, total_days, uniform)
+            turns[index] += length
+            results.append(1 if test(status, causes) else 0)
+        sums[0] += results[0]
+        sums[1] += results[1]
+        delta = results[0] - results[1]
+        difference += delta
+        difference_squares += delta * delta
+
+    estimates = []
+    for index in (0, 1):
+        p = sums[index] / games
+        estimates.append(Estimate(p, math.sqrt(p * (1 - p) / games), games, turns[index], method="common random numbers"))
+    paired = _stderr(difference, difference_squares, games)
+    independent = estimates[0].stderr ** 2 + estimates[1].stderr ** 2
+    reduction = independent / paired ** 2 if paired > 0 else math.inf
+    delta = Estimate(difference / games, paired, games, turns[0] + turns[1],
+                     reduction * (turns[0] + turns[1]) if paired > 0 else None, "difference", bounded=False)
+    return Comparison(estimates[0], estimates[1], delta, reduction)
+
+
+def main():
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="SurviveIsland rare-event probability estimation")
+    commands = parser.add_subparsers(dest="command", required=True)
+    for name, description in (("importance", "importance sampling tuned by cross-entropy"),
+                              ("split", "multilevel splitting"),
+                              ("compare", "two strategies on common random numbers"),
+                              ("plain", "plain sampling, for reference")):
+        command = commands.add_parser(name, help=description)
+        command.add_argument("--days", type=int, default=50, help="survival goal")
+        command.add_argument("--event", default=VICTORY, help="victory, rescued, dead or death:<gauge>")
+        command.add_argument("--policy", default="threshold_s40_g60", help="bot name or action number")
+        command.add_argument("--seed", type=int, default=0)
+        if name in ("importance", "plain"):
+            command.add_argument("--games", type=int, default=100_000)
+            command.add_argument("--target", type=float, default=None, help="relative error to reach, e.g. 0.02")
+        if name == "importance":
+            command.add_argument("--show-proposal", action="store_true", help="print the tuned odds")
+        if name == "split":
+            command.add_argument("--particles", type=int, default=2_000)
+            command.add_argument("--runs", type=int, default=10)
+        if name == "compare":
+            command.add_argument("--against", required=True, help="second bot name or action number")
+            command.add_argument("--games", type=int, default=100_000)
+    args = parser.parse_args()
+
+    try:
+        if args.command == "compare":
+            comparison = compare(args.policy, args.against, args.days, args.event, args.games, args.seed)
+            print(f"🤖 {args.policy}: {comparison.first}")
+            print(f"🤖 {args.against}: {comparison.second}")
+            print(f"⚖️ {comparison.difference}")
+            print(f"📉 Variance of the difference divided by {comparison.variance_reduction:,.1f} "
+                  f"compared to independent games")
+            return 0
+        if args.command == "split":
+            estimate = splitting(args.policy, args.days, args.event, particles=args.particles,
+                                 runs=args.runs, seed=args.seed)
+        else:
+            proposal = "auto" if args.command == "importance" else None
+            if proposal and args.show_proposal:
+                proposal, _ = cross_entropy(args.policy, args.days, args.event, seed=args.seed)
+                print(json.dumps(proposal, indent=2, default=float))
+            estimate = importance_sampling(args.policy, args.days, args.event, proposal, args.games,
+                                           args.target, args.seed)
+    except (KeyError, ValueError) as error:
+        print(f"❌ {error}")
+        return 1
+    print(f"🎯 P({args.event}) with a {args.days}-day goal, {args.policy}")
+    print(f"📊 {estimate}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,289 @@
+"""
+Rendering module.
+
+Draws the turns of the console game. Two renderers share one interface
+(start, show_gauges, show, choose_action, close):
+- PrintRenderer: the historical output, every line printed one after the
+  other (default)
+- CursesRenderer: a full-screen fixed layout (title and day, gauge bars,
+  action menu, event log, prompt) drawn with the standard curses module.
+  Gauges and messages only update its state; one frame is drawn when the
+  player is asked for an action. Only the rows that changed since the
+  previous frame are redrawn, curses sends only the cells that differ,
+  and the frame is written to the terminal in one doupdate(). Anything
+  printed while it runs (save messages...) goes to the event log.
+
+Select the renderer with the SURVIVEISLAND_RENDERER environment variable
+("print" or "curses"). The curses renderer falls back to printing when
+the output is not a terminal or curses is not available.
+
+Example:
+    SURVIVEISLAND_RENDERER=curses python main.py
+"""
+
+import os
+import sys
+
+from game.gestion import ACTION_MENU, display_gauges, choose_action
+
+
+ENVIRONMENT_VARIABLE = "SURVIVEISLAND_RENDERER"
+PROMPT = "Your choice (1-6): "
+CHOICES = ("1", "2", "3", "4", "5", "6")
+
+BAR_WIDTH = 20
+
+
+def gauge_bar(label, value, width=BAR_WIDTH):
+    """
+    Format one gauge as a text bar.
+
+    Args:
+        label (str): Gauge name
+        value (int): Gauge value (0-100)
+        width (int): Number of cells of the bar (default: 20)
+
+    Returns:
+        str: e.g. "Hunger  [##########----------]  50/100"
+    """
+    filled = max(0, min(width, round(value * width / 100)))
+    return f"{label:<7} [{'#' * filled}{'-' * (width - filled)}] {value:>3}/100"
+
+
+def build_frame(player, total_days, log, prompt, height, width):
+    """
+    Lay out one full screen.
+
+    Args:
+        player (Player): The player
+        total_days (int): Target number of days to survive
+        log (list): Event log lines, oldest first
+        prompt (str): Text of the bottom row
+        height (int): Screen rows
+        width (int): Screen columns
+
+    Returns:
+        list: Exactly `height` rows of text
+    """
+    rule = "=" * (width - 1)
+    rows = [
+        f"🏝️ SURVIVE ISLAND - {player.name.upper()}",
+        f"📅 Day {player.days_survived}/{total_days}",
+        rule,
+        gauge_bar("Hunger", player.hunger),
+        gauge_bar("Thirst", player.thirst),
+        gauge_bar("Energy", player.energy),
+        rule,
+    ]
+    rows.extend(line.strip("\n") for line in ACTION_MENU)
+    rows.append("-" * (width - 1))
+
+    log_rows = max(0, height - len(rows) - 1)
+    shown = log[-log_rows:] if log_rows else []
+    rows.extend(shown)
+    rows.extend([""] * (log_rows - len(shown)))
+    rows.append(prompt)
+    return rows[-height:]
+
+
+class PrintRenderer:
+    """
+    Line-by-line renderer using print() and input().
+    """
+
+    def __init__(self, read=None):
+        """
+        Args:
+            read (callable): prompt -> answer line (default: choose_action
+                of game.gestion, reading input())
+        """
+        self.read = read
+
+    def start(self):
+        pass
+
+    def show_gauges(self, player, total_days):
+        """Print the day, name and gauges."""
+        display_gauges(player)
+
+    def show(self, lines):
+        """Print text lines."""
+        for line in lines:
+            print(line)
+
+    def choose_action(self):
+        """Print the menu and read a valid choice ("1" to "6")."""
+        if self.read is None:
+            return choose_action()
+        for line in ACTION_MENU:
+            print(line)
+        while True:
+            choice = self.read("\n" + PROMPT).strip()
+            if choice in CHOICES:
+                return choice
+            print("❌ Invalid choice. Please enter 1, 2, 3, 4, 5, or 6.")
+
+    def close(self):
+        pass
+
+
+class _LogWriter:
+    """File-like object sending printed text to the event log."""
+
+    def __init__(self, renderer):
+        self.renderer = renderer
+        self.buffer = ""
+
+    def write(self, text):
+        self.buffer += text
+        if "\n" in self.buffer:
+            *lines, self.buffer = self.buffer.split("\n")
+            self.renderer.show(lines)
+        return len(text)
+
+    def flush(self):
+        pass
+
+
+class CursesRenderer:
+    """
+    Full-screen renderer redrawing only what changed between frames.
+    """
+
+    def __init__(self, read_key=None, log_size=200):
+        """
+        Args:
+            read_key (callable): Returns the next key pressed (default: read
+                from the curses window)
+            log_size (int): Event log lines kept (default: 200)
+        """
+        self.read_key = read_key
+        self.log_size = log_size
+        self.log = []
+        self.player = None
+        self.total_days = 0
+        self.prompt = ""
+        self.frame = []
+        self.window = None
+        self.frames = 0
+        self._stdout = None
+
+    def start(self):
+        """Take over the terminal; printed text goes to the event log."""
+        import curses
+
+        self.window = curses.initscr()
+        curses.noecho()
+        curses.cbreak()
+        self.window.keypad(True)
+        # Lets curses scroll the event log with insert/delete line sequences
+        self.window.idlok(True)
+        self._stdout = sys.stdout
+        sys.stdout = _LogWriter(self)
+
+    def show_gauges(self, player, total_days):
+        """Show the day, name and gauges of the player (from the next frame)."""
+        self.player = player
+        self.total_days = total_days
+
+    def show(self, lines):
+        """
+        Add text lines to the event log (from the next frame).
+
+        Separators and blank lines are dropped.
+        """
+        for line in lines:
+            for part in line.split("\n"):
+                part = part.rstrip()
+                if part.strip("=- "):
+                    self.log.append(part)
+        del self.log[:-self.log_size]
+
+    def render(self):
+        """Draw the frame: only the changed rows, written in one update."""
+        import curses
+
+        if self.window is None or self.player is None:
+            return
+        height, width = self.window.getmaxyx()
+        frame = build_frame(self.player, self.total_days, self.log, self.prompt, height, width)
+        previous = self.frame
+        for y, row in enumerate(frame):
+            if y < len(previous) and previous[y] == row:
+                continue
+            try:
+                self.window.move(y, 0)
+                self.window.clrtoeol()
+                self.window.addnstr(y, 0, row, width - 1)
+            except curses.error:
+                # Rows wider than the screen are clipped at its edge
+                pass
+        try:
+            self.window.move(len(frame) - 1, min(len(self.prompt), width - 1))
+        except curses.error:
+            pass
+        self.frame = frame
+        self.frames += 1
+        self.window.noutrefresh()
+        curses.doupdate()
+
+    def choose_action(self):
+        """Wait for a valid key ("1" to "6")."""
+        import curses
+
+        self.prompt = PROMPT
+        self.render()
+        while True:
+            key = self.read_key() if self.read_key is not None else self.window.get_wch()
+            if key == curses.KEY_RESIZE:
+                self.frame = []
+                self.window.clear()
+                self.render()
+            elif key in CHOICES:
+                self.prompt = ""
+                return key
+            else:
+                self.show(["❌ Invalid choice. Please enter 1, 2, 3, 4, 5, or 6."])
+                self.render()
+
+    def close(self):
+        """Give the terminal back and print the final screen."""
+        import curses
+
+        if self.window is None:
+            return
+        if isinstance(sys.stdout, _LogWriter):
+            sys.stdout = self._stdout
+        height, width = self.window.getmaxyx()
+        self.window.keypad(False)
+        curses.nocbreak()
+        curses.echo()
+        curses.endwin()
+        self.window = None
+        if self.player is not None:
+            for row in build_frame(self.player, self.total_days, self.log, "", height, width):
+                if row.strip():
+                    print(row.rstrip())
+
+
+def get_renderer(name=None):
+    """
+    Create the renderer to use.
+
+    Args:
+        name (str): "print" or "curses" (default: SURVIVEISLAND_RENDERER, else "print")
+
+    Returns:
+        PrintRenderer or CursesRenderer: CursesRenderer only if the output is
+            a terminal and curses is available
+    """
+    name = name or os.environ.get(ENVIRONMENT_VARIABLE, "print")
+    if name == "curses" and sys.stdin.isatty() and sys.stdout.isatty():
+        try:
+            # Not shipped with Python on Windows
+            import curses
+        except ImportError:
+            pass
+        else:
+            return CursesRenderer()
+    return PrintRenderer()
@@ -0,0 +1,403 @@
+"""
+Replay module.
+
+Records games compactly so they can be re-executed exactly, and verifies
+recorded games against the current code.
+
+A replay holds the starting state, the seed of the game's random.Random
+and the list of actions, varint-packed. Optionally, a 16-bit checksum of
+the state after every turn is stored, so a divergence is located at the
+exact turn where it happens. Replays are re-executed through the headless
+engine (game.actions and game.evenements), without any I/O.
+
+Binary layout:
+    b"SIRP" | version (1 byte) | flags (1 byte) |
+    varints: seed, total_days, hunger, thirst, energy, days_survived |
+    varint name length | name (UTF-8) |
+    varint number of turns | one varint action per turn |
+    [one 2-byte checksum per turn, if FLAG_CHECKSUMS] |
+    varint final status index
+
+Usage:
+    python -m game.replay verify DIRECTORY [--workers N]
+"""
+
+import os
+import random
+import struct
+import time
+import zlib
+
+from game.player import Player
+from game.engine import step, check_status, ONGOING, VICTORY, RESCUED, DEAD
+from game.state import PackedState
+
+
+MAGIC = b"SIRP"
+VERSION = 1
+FLAG_CHECKSUMS = 1
+STATUSES = (ONGOING, VICTORY, RESCUED, DEAD)
+REPLAY_EXTENSION = ".replay"
+REPLAY_DIR = "data/replays"
+# Replays kept by save_replay; older ones are deleted
+MAX_REPLAYS = 100
+
+CHECKSUM = struct.Struct("<H")
+
+
+def write_varint(buffer, value):
+    """
+    Append an unsigned LEB128 varint to a bytearray.
+
+    Args:
+        buffer (bytearray): Destination
+        value (int): Value to encode (must be >= 0)
+    """
+    if value < 0:
+        raise ValueError("Varints must be positive.")
+    while value >= 0x80:
+        buffer.append(value & 0x7F | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def read_varint(data, position):
+    """
+    Decode an unsigned LEB128 varint.
+
+    Args:
+        data (bytes): Encoded data
+        position (int): Offset of the varint
+
+    Returns:
+        tuple: (value, offset after the varint)
+    """
+    value = 0
+    shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
+
+
+def state_checksum(player, total_days):
+    """
+    16-bit checksum of a game state.
+
+    Returns:
+        int: Checksum between 0 and 65535
+    """
+    packed = PackedState.from_player(player, total_days)
+    return zlib.crc32(packed.to_bytes(8, "little")) & 0xFFFF
+
+
+class Replay:
+    """
+    A recorded game: starting state, seed and actions.
+
+    Attributes:
+        seed (int): Seed of the game's random.Random
+        total_days (int): Target number of days to survive
+        start (tuple): (hunger, thirst, energy, days_survived) at the start
+        name (str): Player's name
+        actions (list): Actions played, as strings "1" to "4"
+        checksums (list): State checksum after every turn, or None
+        status (str): Final status recorded (ONGOING if the player quit)
+    """
+
+    def __init__(self, seed, total_days, start=(100, 100, 100, 0), name="Survivor",
+                 actions=None, checksums=None, status=ONGOING):
+        self.seed = seed
+        self.total_days = total_days
+        self.start = tuple(start)
+        self.name = name
+        self.actions = actions if actions is not None else []
+        self.checksums = checksums
+        self.status = status
+
+    def new_player(self):
+        """Player in the starting state of the replay."""
+        hunger, thirst, energy, days_survived = self.start
+        return Player(hunger=hunger, thirst=thirst, energy=energy,
+                      days_survived=days_survived, name=self.name)
+
+    def to_bytes(self):
+        """
+        Encode the replay.
+
+        Returns:
+            bytes: Binary replay
+        """
+        buffer = bytearray(MAGIC)
+        buffer.append(VERSION)
+        buffer.append(FLAG_CHECKSUMS if self.checksums is not None else 0)
+
+        for value in (self.seed, self.total_days) + self.start:
+            write_varint(buffer, value)
+
+        name = self.name.encode("utf-8")
+        write_varint(buffer, len(name))
+        buffer += name
+
+        write_varint(buffer, len(self.actions))
+        for action in self.actions:
+            write_varint(buffer, int(action))
+
+        if self.checksums is not None:
+            for checksum in self.checksums:
+                buffer += CHECKSUM.pack(checksum)
+
+        write_varint(buffer, STATUSES.index(self.status))
+        return bytes(buffer)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Decode a replay.
+
+        Args:
+            data (bytes): Binary replay
+
+        Returns:
+            Replay: Decoded replay
+
+        Raises:
+            ValueError: If the data is not a valid replay
+        """
+        if data[:4] != MAGIC:
+            raise ValueError("Not a replay file.")
+        if data[4] != VERSION:
+            raise ValueError(f"Unsupported replay version {data[4]}.")
+
+        try:
+            flags = data[5]
+            position = 6
+            values = []
+            for _ in range(6):
+                value, position = read_varint(data, position)
+                values.append(value)
+            seed, total_days = values[:2]
+
+            length, position = read_varint(data, position)
+            name = data[position:position + length].decode("utf-8")
+            position += length
+
+            count, position = read_varint(data, position)
+            actions = []
+            for _ in range(count):
+                action, position = read_varint(data, position)
+                actions.append(str(action))
+
+            checksums = None
+            if flags & FLAG_CHECKSUMS:
+                checksums = [value for (value,) in CHECKSUM.iter_unpack(data[position:position + 2 * count])]
+                position += 2 * count
+
+            status, position = read_varint(data, position)
+            return cls(seed, total_days, values[2:], name, actions, checksums, STATUSES[status])
+        except (IndexError, UnicodeDecodeError, struct.error) as e:
+            raise ValueError(f"Truncated or corrupted replay: {e}") from e
+
+    def save(self, path):
+        """Write the replay to a file."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        """Read a replay from a file."""
+        with open(path, 'rb') as f:
+            return cls.from_bytes(f.read())
+
+
+class ReplayRecorder:
+    """
+    Records the actions of a game while it is played.
+    """
+
+    def __init__(self, player, total_days, seed, checksums=True):
+        """
+        Start recording from the player's current state.
+
+        Args:
+            player (Player): Player at the start of the recording
+            total_days (int): Target number of days to survive
+            seed (int): Seed of the random.Random used by the game
+            checksums (bool): Store a state checksum after every turn (default: True)
+        """
+        start = (player.hunger, player.thirst, player.energy, player.days_survived)
+        self.replay = Replay(seed, total_days, start, player.name, [], [] if checksums else None)
+
+    def record(self, action, player):
+        """
+        Record one turn.
+
+        Args:
+            action (str): Action played
+            player (Player): Player after the turn
+        """
+        self.replay.actions.append(action)
+        if self.replay.checksums is not None:
+            self.replay.checksums.append(state_checksum(player, self.replay.total_days))
+
+    def finish(self, status):
+        """
+        Set the final status of the game.
+
+        Returns:
+            Replay: The recorded replay
+        """
+        self.replay.status = status
+        return self.replay
+
+
+def save_replay(replay, directory=REPLAY_DIR, keep=MAX_REPLAYS):
+    """
+    Write a replay to a new file of the replay directory.
+
+    Args:
+        replay (Replay): Replay to write
+        directory (str): Destination directory (default: REPLAY_DIR)
+        keep (int): Most recent replays kept in the directory, None to keep
+            them all (default: MAX_REPLAYS)
+
+    Returns:
+        str: Path of the replay file
+    """
+    path = os.path.join(directory, f"{time.strftime('%Y%m%d-%H%M%S')}-{replay.seed:016x}{REPLAY_EXTENSION}")
+    replay.save(path)
+    if keep is not None:
+        prune_replays(directory, keep)
+    return path
+
+
+def prune_replays(directory=REPLAY_DIR, keep=MAX_REPLAYS):
+    """
+    Delete the oldest replays of a directory.
+
+    Args:
+        directory (str): Replay directory (default: REPLAY_DIR)
+        keep (int): Number of most recent replays to keep (default: MAX_REPLAYS)
+
+    Returns:
+        int: Number of replays deleted
+    """
+    # File names start with their timestamp, so they sort by age
+    names = sorted(name for name in os.listdir(directory) if name.endswith(REPLAY_EXTENSION))
+    old = names[:max(0, len(names) - keep)]
+    for name in old:
+        os.remove(os.path.join(directory, name))
+    return len(old)
+
+
+def run_replay(replay):
+    """
+    Re-execute a replay through the engine.
+
+    Args:
+        replay (Replay): Replay to run
+
+    Returns:
+        tuple: (player, status, divergence) where divergence is None if every
+            checksum matched, or the index of the first turn that differs
+    """
+    rng = random.Random(replay.seed)
+    player = replay.new_player()
+    total_days = replay.total_days
+    checksums = replay.checksums
+    status, _ = check_status(player, player.days_survived, total_days)
+
+    for turn, action in enumerate(replay.actions):
+        if status != ONGOING:
+            return player, status, turn
+        _, outcome = step(player, action, total_days, rng)
+        status = outcome.status
+        if checksums is not None and state_checksum(player, total_days) != checksums[turn]:
+            return player, status, turn
+
+    return player, status, None
+
+
+def verify_replay(replay):
+    """
+    Check that a replay still produces the recorded game.
+
+    Args:
+        replay (Replay): Replay to verify
+
+    Returns:
+        tuple: (ok, message)
+    """
+    _, status, divergence = run_replay(replay)
+    if divergence is not None:
+        return False, f"diverges at turn {divergence + 1}"
+    if status != replay.status:
+        return False, f"ends with {status} instead of {replay.status}"
+    return True, f"{len(replay.actions)} turns, {status}"
+
+
+def verify_file(path):
+    """
+    Verify one replay file.
+
+    Returns:
+        tuple: (path, ok, message)
+    """
+    try:
+        ok, message = verify_replay(Replay.load(path))
+    except (OSError, ValueError) as e:
+        return path, False, f"unreadable: {e}"
+    return path, ok, message
+
+
+def verify_directory(directory, workers=None):
+    """
+    Verify every replay file of a directory in parallel.
+
+    Args:
+        directory (str): Directory containing .replay files (searched recursively)
+        workers (int): Number of processes (default: one per CPU)
+
+    Returns:
+        list: (path, ok, message) tuples, sorted by path
+    """
+    paths = sorted(
+        os.path.join(root, name)
+        for root, _, names in os.walk(directory)
+        for name in names if name.endswith(REPLAY_EXTENSION)
+    )
+    if workers == 1 or len(paths) < 2:
+        return [verify_file(path) for path in paths]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(verify_file, paths, chunksize=max(1, len(paths) // 64)))
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="SurviveIsland replays")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    verify = subparsers.add_parser("verify", help="re-run replays and report divergences")
+    verify.add_argument("directory")
+    verify.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    results = verify_directory(args.directory, args.workers)
+    failures = [result for result in results if not result[1]]
+    for path, ok, message in failures:
+        print(f"❌ {path}: {message}")
+    print(f"{len(results) - len(failures)}/{len(results)} replays verified.")
+    raise SystemExit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""
+Portable random generator module.
+
+PortableRandom is a drop-in source of randomness for the engine (the `rng`
+argument of actions, events, GameSession, game.montecarlo...) whose draws
+do not depend on the backend producing its uniform floats:
+- "random": the standard library Mersenne Twister
+- "numpy": a NumPy Generator on the MT19937 bit generator (requires NumPy),
+  drawn a block at a time
+
+Both backends start from the state of random.Random(seed), and NumPy
+produces its doubles from the Mersenne Twister output exactly like the
+standard library, so a seed gives the same draws, hence the same games,
+on either backend. choice(), choices() and coin() are derived from one
+float each with a multiplication or a bisection, so their draws differ
+from those of random.Random(seed) itself, whose choice() uses integer
+arithmetic instead.
+
+PortableRandom is about as fast as random.Random: it is meant for streams
+that do not depend on the backend, not for speed.
+
+Example:
+    from game.engine import GameSession
+    from game.rng import PortableRandom
+
+    session = GameSession(total_days=20, rng=PortableRandom(42, backend="numpy"))
+"""
+
+import random as _random
+from bisect import bisect as _bisect
+from itertools import accumulate, chain, repeat
+
+
+DEFAULT_BLOCK_SIZE = 4096
+
+
+def stdlib_floats(source, block_size):
+    """
+    Uniform floats from a random.Random.
+
+    Args:
+        source (random.Random): Generator to draw from
+        block_size (int): Unused, the floats are drawn one at a time
+
+    Returns:
+        callable: Function returning the next float in [0, 1)
+    """
+    return source.random
+
+
+def numpy_floats(source, block_size):
+    """
+    Uniform floats from NumPy, continuing the stream of a random.Random.
+    Requires NumPy.
+
+    Args:
+        source (random.Random): Generator whose state seeds the NumPy one
+        block_size (int): Floats drawn per call to NumPy
+
+    Returns:
+        callable: Function returning the next float in [0, 1), the one
+            source.random() would return
+    """
+    import numpy as np
+
+    _, state, _ = source.getstate()
+    bit_generator = np.random.MT19937()
+    bit_generator.state = {
+        "bit_generator": "MT19937",
+        "state": {"key": np.array(state[:-1], dtype=np.uint32), "pos": state[-1]},
+    }
+    generator = np.random.Generator(bit_generator)
+
+    def blocks():
+        while True:
+            yield generator.random(block_size).tolist()
+
+    return chain.from_iterable(blocks()).__next__
+
+
+BACKENDS = {
+    "random": stdlib_floats,
+    "numpy": numpy_floats,
+}
+
+
+class PortableRandom:
+    """
+    Random generator giving the same draws on every backend.
+
+    Implements the subset of random.Random used by the game: random(),
+    choice() and choices(), plus coin().
+    """
+
+    def __init__(self, seed=None, backend="random", block_size=DEFAULT_BLOCK_SIZE):
+        """
+        Initialize the generator.
+
+        Args:
+            seed: Seed, as accepted by random.Random (default: None, from the OS)
+            backend (str or callable): "random", "numpy", or a function
+                (random.Random, block_size) -> function returning the next
+                float (default: "random")
+            block_size (int): Floats drawn at once by the NumPy backend
+                (default: 4096)
+
+        Raises:
+            ValueError: If the backend is unknown
+        """
+        if isinstance(backend, str):
+            if backend not in BACKENDS:
+                raise ValueError(f"Unknown backend {backend!r}, expected one of {', '.join(BACKENDS)}.")
+            floats = BACKENDS[backend]
+        else:
+            floats = backend
+        self.backend = backend
+        self.block_size = block_size
+        self.random = floats(_random.Random(seed), block_size)
+
+    def coin(self):
+        """
+        Flip a fair coin.
+
+        Returns:
+            bool: True or False with probability 1/2
+        """
+        return self.random() < 0.5
+
+    def choice(self, seq):
+        """
+        Pick one element of a non-empty sequence, uniformly.
+
+        Raises:
+            IndexError: If the sequence is empty
+        """
+        return seq[int(self.random() * len(seq))]
+
+    def choices(self, population, weights=None, *, cum_weights=None, k=1):
+        """
+        Pick k elements with replacement, like random.Random.choices.
+
+        Args:
+            population (sequence): Elements to pick from
+            weights (sequence): Relative weights (default: uniform)
+            cum_weights (sequence): Cumulative weights, instead of weights
+            k (int): Number of picks (default: 1)
+
+        Returns:
+            list: The picked elements
+        """
+        random = self.random
+        n = len(population)
+        if cum_weights is None:
+            if weights is None:
+                return [population[int(random() * n)] for _ in repeat(None, k)]
+            cum_weights = list(accumulate(weights))
+        elif weights is not None:
+            raise TypeError("Cannot specify both weights and cumulative weights")
+        if len(cum_weights) != n:
+            raise ValueError("The number of weights does not match the population")
+        total = cum_weights[-1] + 0.0
+        if total <= 0.0:
+            raise ValueError("Total of weights must be greater than zero")
+        hi = n - 1
+        return [population[_bisect(cum_weights, random() * total, 0, hi)] for _ in repeat(None, k)]
@@ -0,0 +1,179 @@
+"""
+Save system module.
+
+Handles game state persistence.
+Allows players to save, load, and delete their game progress.
+
+The storage itself is delegated to a backend:
+- journal: JournalBackend, per-turn journal records plus a JSON snapshot (default)
+- json_file: JsonFileBackend, a single JSON file rewritten on every save
+- sqlite: SQLiteBackend, one slot of a multi-player SQLite store which also
+  keeps the history of finished games
+
+game.save.cache.SessionCache keeps the saves of many sessions in memory in
+front of any of them and writes them in the background.
+
+The journal and json_file backends keep SAVE_FILE in the original JSON
+layout, so existing saves load with either of them; the SQLite backend
+stores its slots in its own database.
+"""
+
+import json
+
+from game import metrics
+from game.player import Player
+from game.save.json_file import NoSaveError, EmptySaveError
+
+
+SAVE_FILE = "data/save.json"
+
+_backend = None
+_default_backend = True
+
+
+def set_backend(backend):
+    """
+    Select the storage backend used by save_game, load_game and delete_save.
+    
+    Args:
+        backend: Object with save(), load(), delete() and close() methods,
+            or None to go back to the default journaled backend on SAVE_FILE
+            
+    Returns:
+        The previously selected backend (or None)
+    """
+    global _backend, _default_backend
+    previous = _backend
+    if previous is not None and previous is not backend:
+        previous.close()
+    _backend = backend
+    _default_backend = backend is None
+    return previous
+
+
+def get_backend():
+    """
+    Get the storage backend, creating the default one if needed.
+    
+    Returns:
+        The current backend
+    """
+    global _backend
+    if _default_backend and (_backend is None or _backend.path != SAVE_FILE):
+        from game.save.journal import JournalBackend
+        if _backend is not None:
+            _backend.close()
+        _backend = JournalBackend(SAVE_FILE)
+    return _backend
+
+
+def save_game(player, current_day, total_days=10):
+    """
+    Save the current game state.
+    
+    Creates the data directory if it doesn't exist.
+    
+    Args:
+        player (Player): The player to save
+        current_day (int): Current day in the game
+        total_days (int): Target number of days to survive (default: 10)
+        
+    Returns:
+        bool: True if save successful, False otherwise
+    """
+    try:
+        with metrics.timer("save_seconds"):
+            get_backend().save(player, current_day, total_days)
+        print("\n💾 Game saved successfully!")
+        return True
+    except Exception as e:
+        print(f"\n❌ Error saving game: {e}")
+        return False
+
+
+def load_game(player_class=Player):
+    """
+    Load a saved game.
+    
+    Args:
+        player_class (type): Class of the loaded player, Player or SlottedPlayer
+            (default: Player)
+    
+    Returns:
+        tuple: (Player, current_day, total_days) if successful, (None, None, None) otherwise
+        
+    Handles:
+        - Missing save file
+        - Empty save file
+        - Corrupted JSON data
+        - Invalid save data format
+    """
+    try:
+        with metrics.timer("load_seconds"):
+            player, current_day, total_days = get_backend().load(player_class)
+        
+        print(f"\n✅ Game loaded! Welcome back, {player.name}!")
+        print(f"Resuming from day {current_day}...")
+        return player, current_day, total_days
+    
+    except NoSaveError:
+        print("\n📂 No save file found. Starting a new game...")
+        return None, None, None
+    except EmptySaveError:
+        print("\n📂 Save file is empty. Starting a new game...")
+        return None, None, None
+    except json.JSONDecodeError:
+        print("\n⚠️ Save file is corrupted. Starting a new game...")
+        return None, None, None
+    except Exception as e:
+        print(f"\n❌ Error loading game: {e}. Starting a new game...")
+        return None, None, None
+
+
+def delete_save():
+    """
+    Delete the saved game.
+    
+    Called when the game ends (victory or death) to clean up old saves.
+    
+    Returns:
+        bool: True if deletion successful or no save exists, False on error
+    """
+    try:
+        with metrics.timer("delete_seconds"):
+            deleted = get_backend().delete()
+        if deleted:
+            print("\n🗑️ Save file deleted.")
+        return True
+    except Exception as e:
+        print(f"\n❌ Error deleting save file: {e}")
+        return False
+
+
+def record_game(player, total_days, outcome, cause=""):
+    """
+    Add a finished game to the history, if the backend keeps one.
+    
+    The history is written right away: backends that buffer finished games
+    (SQLiteBackend) are flushed, so nothing is lost when the console exits.
+    
+    Args:
+        player (Player): The player at the end of the game
+        total_days (int): Target number of days to survive
+        outcome (str): "victory", "rescued" or "dead"
+        cause (str): Death causes as reported by check_conditions (default: "")
+        
+    Returns:
+        bool: True if the game was recorded, False otherwise
+    """
+    backend = get_backend()
+    if not hasattr(backend, "record_game"):
+        return False
+    try:
+        backend.record_game(player, total_days, outcome, cause)
+        if hasattr(backend, "flush_history"):
+            backend.flush_history()
+        return True
+    except Exception as e:
+        print(f"\n❌ Error recording game: {e}")
+        return False
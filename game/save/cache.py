@@ -0,0 +1,361 @@
+"""
+Session cache module.
+
+Keeps the save state of active games in memory, in front of any game.save
+backend (SQLite slots, JSON files...):
+- a save is a dictionary update: the session is marked dirty and a
+  background writer persists it later, coalescing all the turns played
+  in between into one write
+- a load of a cached session never touches the disk; missing saves are
+  cached too
+- the least recently used sessions are evicted beyond max_sessions; dirty
+  ones are kept in a pending buffer until the writer has stored them
+- the writer flushes every flush_interval seconds, or as soon as
+  max_dirty sessions are dirty or evicted; saves never write themselves.
+  When the pending buffer is full, a save waits for the writer to take it
+  (backpressure), so memory stays bounded by max_sessions + max_dirty
+  saves. Callers that must not wait (an event loop) check backlogged()
+  first and save from a worker thread while it is True
+- loads of sessions that are not cached read their backend, in the
+  calling thread
+- close() flushes everything
+
+Hits, misses, evictions, flushes and writes are counted in stats(), and in
+game.metrics when it is enabled (save_cache_total, save_cache_flush_seconds).
+
+Example:
+    store = SQLiteStore("data/server.db")
+    cache = SessionCache(lambda key: SQLiteBackend(store, player_key=key))
+    backend = cache.backend("alice")   # game.save backend for one player
+    backend.save(player, 3, 10)        # in memory, written within a second
+    ...
+    cache.close()
+"""
+
+import threading
+from collections import OrderedDict
+
+from game import metrics
+from game.player import Player
+from game.save.json_file import NoSaveError
+
+
+# Cached state of a session whose save was deleted or never existed
+DELETED = "deleted"
+
+
+def _pack(player, current_day, total_days):
+    return (player.name, player.hunger, player.thirst, player.energy, player.days_survived,
+            current_day, total_days)
+
+
+def _unpack(state, player_class):
+    name, hunger, thirst, energy, days_survived, current_day, total_days = state
+    player = player_class(name=name, hunger=hunger, thirst=thirst, energy=energy,
+                          days_survived=days_survived)
+    return player, current_day, total_days
+
+
+class SessionCache:
+    """
+    LRU cache of session save states with write-behind persistence.
+
+    A cache can be shared between threads; the states are guarded by an
+    internal lock, and the writes to the backends are serialized, in order.
+    """
+
+    def __init__(self, backend_factory, max_sessions=10_000, max_dirty=1_000, flush_interval=1.0):
+        """
+        Initialize the cache and start its writer thread.
+
+        Args:
+            backend_factory (callable): key -> game.save backend storing that session
+            max_sessions (int): Sessions kept in memory (default: 10 000)
+            max_dirty (int): Dirty sessions that trigger a flush, and size of
+                the buffer of evicted sessions waiting for a write (default: 1 000)
+            flush_interval (float): Seconds between two flushes (default: 1.0)
+        """
+        if max_sessions < 1 or max_dirty < 1:
+            raise ValueError("max_sessions and max_dirty must be at least 1.")
+        self.backend_factory = backend_factory
+        self.max_sessions = max_sessions
+        self.max_dirty = max_dirty
+        self.flush_interval = flush_interval
+        self.counters = {"hit": 0, "miss": 0, "eviction": 0, "flush": 0, "write": 0, "error": 0}
+
+        self._lock = threading.Lock()
+        # Notified when the writer takes the pending buffer
+        self._room = threading.Condition(self._lock)
+        self._write_lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._dirty = set()
+        self._evicted = {}
+        self._writing = {}
+        self._wake = threading.Event()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="save-cache-writer", daemon=True)
+        self._thread.start()
+
+    def backend(self, key):
+        """
+        Get a game.save backend for one session.
+
+        Args:
+            key (str): Session key, e.g. the player's name
+
+        Returns:
+            CachedBackend: Backend reading and writing through this cache
+        """
+        return CachedBackend(self, key)
+
+    def _count(self, result):
+        self.counters[result] += 1
+        if metrics.enabled:
+            metrics.increment("save_cache_total", result)
+
+    def get(self, key, player_class=Player):
+        """
+        Read the save state of a session.
+
+        Args:
+            key (str): Session key
+            player_class (type): Class of the loaded player (default: Player)
+
+        Returns:
+            tuple: (player, current_day, total_days)
+
+        Raises:
+            NoSaveError: If the session has no save
+        """
+        with self._lock:
+            state = self._entries.get(key)
+            if state is not None:
+                self._entries.move_to_end(key)
+            else:
+                state = self._evicted.get(key) or self._writing.get(key)
+            self._count("miss" if state is None else "hit")
+
+        if state is None:
+            try:
+                state = _pack(*self.backend_factory(key).load(player_class))
+            except NoSaveError:
+                state = DELETED
+            with self._lock:
+                # A save made meanwhile is newer than what was read
+                if key in self._entries or key in self._evicted:
+                    state = self._entries.get(key) or self._evicted[key]
+                else:
+                    self._insert(key, state)
+
+        if state is DELETED:
+            raise NoSaveError(key)
+        return _unpack(state, player_class)
+
+    def put(self, key, player, current_day, total_days):
+        """
+        Save the state of a session (written by the background writer).
+
+        Waits for the writer while the pending buffer is full (see backlogged()).
+
+        Args:
+            key (str): Session key
+            player (Player): The player to save
+            current_day (int): Current day in the game
+            total_days (int): Target number of days to survive
+        """
+        self._store(key, _pack(player, current_day, total_days))
+
+    def delete(self, key):
+        """
+        Delete the save of a session (written by the background writer).
+
+        Reads the backend if the session is not cached, and waits for the
+        writer while the pending buffer is full (see backlogged()).
+
+        Returns:
+            bool: True if the session had a save
+        """
+        with self._lock:
+            state = self._entries.get(key) or self._evicted.get(key) or self._writing.get(key)
+        if state is None:
+            try:
+                state = _pack(*self.backend_factory(key).load())
+            except NoSaveError:
+                state = DELETED
+        self._store(key, DELETED)
+        return state is not DELETED
+
+    def backlogged(self):
+        """
+        Tell whether a save would wait for the writer.
+
+        Returns:
+            bool: True while the buffer of evicted sessions waiting for a
+                write is full
+        """
+        return len(self._evicted) >= self.max_dirty
+
+    def _store(self, key, state):
+        with self._lock:
+            while len(self._evicted) >= self.max_dirty and not self._closed:
+                self._wake.set()
+                self._room.wait()
+            self._evicted.pop(key, None)
+            self._insert(key, state)
+            self._dirty.add(key)
+            full = len(self._evicted) >= self.max_dirty
+            if full or len(self._dirty) >= self.max_dirty:
+                self._wake.set()
+        if full and self._closed:
+            # No writer any more
+            self.flush()
+
+    def _insert(self, key, state):
+        # Called with the lock held
+        entries = self._entries
+        entries[key] = state
+        entries.move_to_end(key)
+        while len(entries) > self.max_sessions:
+            old_key, old_state = entries.popitem(last=False)
+            if old_key in self._dirty:
+                self._dirty.discard(old_key)
+                self._evicted[old_key] = old_state
+            self._count("eviction")
+
+    def flush(self):
+        """
+        Write every dirty session to its backend now.
+
+        Returns:
+            int: Number of sessions written
+
+        Raises:
+            Exception: The first write error; sessions that were not written
+                stay dirty and are retried by the next flush
+        """
+        with self._write_lock:
+            with self._lock:
+                batch = dict(self._evicted)
+                for key in self._dirty:
+                    batch[key] = self._entries[key]
+                self._dirty.clear()
+                self._evicted.clear()
+                self._writing = batch
+                self._room.notify_all()
+            if not batch:
+                return 0
+
+            written = 0
+            try:
+                with metrics.timer("save_cache_flush_seconds"):
+                    for key, state in batch.items():
+                        backend = self.backend_factory(key)
+                        if state is DELETED:
+                            backend.delete()
+                        else:
+                            backend.save(*_unpack(state, Player))
+                        written += 1
+            except Exception:
+                with self._lock:
+                    self._count("error")
+                    for key, state in list(batch.items())[written:]:
+                        if key in self._dirty or key in self._evicted:
+                            continue
+                        if key in self._entries:
+                            if self._entries[key] is state:
+                                self._dirty.add(key)
+                        else:
+                            self._evicted[key] = state
+                raise
+            finally:
+                with self._lock:
+                    self._writing = {}
+                    self.counters["write"] += written
+                    self._count("flush")
+                if metrics.enabled:
+                    metrics.increment("save_cache_total", "write", written)
+            return written
+
+    def _run(self):
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"\n❌ Error writing cached saves: {e}")
+
+    def stats(self):
+        """
+        Current size and counters of the cache.
+
+        Returns:
+            dict: sessions, dirty, pending (evicted, not written yet) and the
+                hit, miss, eviction, flush, write and error counters
+        """
+        with self._lock:
+            return dict(self.counters, sessions=len(self._entries), dirty=len(self._dirty),
+                        pending=len(self._evicted))
+
+    def close(self):
+        """Stop the writer thread and write every dirty session."""
+        if not self._closed:
+            with self._lock:
+                self._closed = True
+                # Savers waiting for room flush by themselves from now on
+                self._room.notify_all()
+            self._wake.set()
+            self._thread.join()
+        self.flush()
+
+
+class CachedBackend:
+    """
+    Save backend storing one session of a SessionCache.
+
+    Saves and deletions only update memory (see SessionCache); finished
+    games are recorded directly by the session's own backend.
+    """
+
+    # Saves do no I/O: they only wait while backlogged() is True. Loads and
+    # deletions of sessions that are not cached, and record_game, read or
+    # write the session's backend.
+    in_memory = True
+
+    def __init__(self, cache, key):
+        """
+        Initialize the backend.
+
+        Args:
+            cache (SessionCache): Cache holding the session
+            key (str): Session key
+        """
+        self.cache = cache
+        self.key = key
+        self.path = key
+
+    def save(self, player, current_day, total_days):
+        """Update the cached game state."""
+        self.cache.put(self.key, player, current_day, total_days)
+
+    def backlogged(self):
+        """True while a save would wait for the cache's writer."""
+        return self.cache.backlogged()
+
+    def load(self, player_class=Player):
+        """Read the game state, from memory when cached."""
+        return self.cache.get(self.key, player_class)
+
+    def delete(self):
+        """Remove the save. Returns True if it existed."""
+        return self.cache.delete(self.key)
+
+    def record_game(self, player, total_days, outcome, cause=""):
+        """Add a finished game to the history, if the session's backend keeps one."""
+        backend = self.cache.backend_factory(self.key)
+        if hasattr(backend, "record_game"):
+            backend.record_game(player, total_days, outcome, cause)
+
+    def close(self):
+        """Write the dirty sessions (the cache stays open)."""
+        self.cache.flush()
@@ -0,0 +1,169 @@
+"""
+JSON file save backend.
+
+Stores the game state in a single JSON file (the original save format).
+Files are written atomically: the data goes to a temporary file which then
+replaces the save file, so a crash mid-write never leaves a truncated save.
+"""
+
+import json
+import os
+
+from game.player import Player
+
+
+class NoSaveError(Exception):
+    """Raised when there is no saved game."""
+
+
+class EmptySaveError(Exception):
+    """Raised when the save file exists but is empty."""
+
+
+def make_save_data(player, current_day, total_days):
+    """
+    Build the save file layout for a game state.
+
+    Args:
+        player (Player): The player to save
+        current_day (int): Current day in the game
+        total_days (int): Target number of days to survive
+
+    Returns:
+        dict: Data ready to be written as JSON
+    """
+    return {
+        "day": current_day,
+        "total_days": total_days,
+        "player": {
+            "name": player.name,
+            "hunger": player.hunger,
+            "thirst": player.thirst,
+            "energy": player.energy,
+            "days_survived": player.days_survived
+        }
+    }
+
+
+def player_from_save_data(save_data, player_class=Player):
+    """
+    Rebuild a game state from the save file layout.
+
+    Args:
+        save_data (dict): Decoded save file
+        player_class (type): Player or SlottedPlayer (default: Player)
+
+    Returns:
+        tuple: (player, current_day, total_days)
+    """
+    player_data = save_data.get("player", {})
+    current_day = save_data.get("day", 0)
+    total_days = save_data.get("total_days", 10)
+
+    player = player_class(
+        name=player_data.get("name", "Survivor"),
+        hunger=player_data.get("hunger", 100),
+        thirst=player_data.get("thirst", 100),
+        energy=player_data.get("energy", 100),
+        days_survived=player_data.get("days_survived", 0)
+    )
+    return player, current_day, total_days
+
+
+def write_json_atomic(path, data, fsync=True, indent=2):
+    """
+    Write JSON data to a file atomically.
+
+    Args:
+        path (str): Destination file
+        data (dict): Data to write
+        fsync (bool): Flush the data to disk before renaming (default: True)
+        indent (int): JSON indentation (default: 2)
+    """
+    temporary = path + ".tmp"
+    with open(temporary, 'w') as f:
+        json.dump(data, f, indent=indent)
+        if fsync:
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(temporary, path)
+
+
+def read_json(path):
+    """
+    Read a JSON save file.
+
+    Args:
+        path (str): File to read
+
+    Returns:
+        dict: Decoded data
+
+    Raises:
+        NoSaveError: If the file does not exist
+        EmptySaveError: If the file is empty
+        json.JSONDecodeError: If the file is corrupted
+    """
+    if not os.path.exists(path):
+        raise NoSaveError(path)
+
+    with open(path, 'r') as f:
+        content = f.read().strip()
+    if not content:
+        raise EmptySaveError(path)
+
+    return json.loads(content)
+
+
+class JsonFileBackend:
+    """
+    Save backend rewriting a single JSON file on every save.
+    """
+
+    def __init__(self, path, fsync=False):
+        """
+        Initialize the backend.
+
+        Args:
+            path (str): Path of the JSON save file
+            fsync (bool): Flush every save to disk (default: False)
+        """
+        self.path = path
+        self.fsync = fsync
+        self._directory_ready = False
+
+    def _ensure_directory(self):
+        if not self._directory_ready:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._directory_ready = True
+
+    def save(self, player, current_day, total_days):
+        """Write the game state, replacing the previous save."""
+        self._ensure_directory()
+        write_json_atomic(self.path, make_save_data(player, current_day, total_days), self.fsync)
+
+    def load(self, player_class=Player):
+        """
+        Read the saved game state.
+
+        Returns:
+            tuple: (player, current_day, total_days)
+        """
+        return player_from_save_data(read_json(self.path), player_class)
+
+    def delete(self):
+        """
+        Remove the save file if it exists.
+
+        Returns:
+            bool: True if a save existed
+        """
+        if os.path.exists(self.path):
+            os.remove(self.path)
+            return True
+        return False
+
+    def close(self):
+        """Nothing to release, present for API compatibility."""
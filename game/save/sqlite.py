@@ -0,0 +1,312 @@
+"""
+SQLite save backend.
+
+Stores any number of save slots per player and the history of finished
+games in one SQLite database (standard library sqlite3):
+- WAL journal mode, so readers never block the writer
+- constant SQL strings, compiled once and reused from the sqlite3
+  statement cache
+- finished games are buffered and inserted in batches
+- indexes for top-N leaderboards and per-player history
+"""
+
+import os
+import sqlite3
+import threading
+import time
+
+from game.player import Player
+from game.save.json_file import NoSaveError
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS slots (
+    player TEXT NOT NULL,
+    slot TEXT NOT NULL,
+    name TEXT NOT NULL,
+    hunger INTEGER NOT NULL,
+    thirst INTEGER NOT NULL,
+    energy INTEGER NOT NULL,
+    days_survived INTEGER NOT NULL,
+    day INTEGER NOT NULL,
+    total_days INTEGER NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (player, slot)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    total_days INTEGER NOT NULL,
+    days_survived INTEGER NOT NULL,
+    outcome TEXT NOT NULL,
+    cause TEXT NOT NULL DEFAULT '',
+    finished_at REAL NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS games_by_days ON games (days_survived DESC, id);
+CREATE INDEX IF NOT EXISTS games_by_goal ON games (total_days, days_survived DESC, id);
+CREATE INDEX IF NOT EXISTS games_by_name ON games (name, id DESC);
+"""
+
+SAVE_SLOT = """
+INSERT INTO slots (player, slot, name, hunger, thirst, energy, days_survived, day, total_days, updated_at)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (player, slot) DO UPDATE SET
+    name = excluded.name, hunger = excluded.hunger, thirst = excluded.thirst,
+    energy = excluded.energy, days_survived = excluded.days_survived,
+    day = excluded.day, total_days = excluded.total_days, updated_at = excluded.updated_at
+"""
+
+LOAD_SLOT = """
+SELECT name, hunger, thirst, energy, days_survived, day, total_days
+FROM slots WHERE player = ? AND slot = ?
+"""
+
+DELETE_SLOT = "DELETE FROM slots WHERE player = ? AND slot = ?"
+
+LIST_SLOTS = "SELECT slot, day, total_days, updated_at FROM slots WHERE player = ? ORDER BY slot"
+
+INSERT_GAME = """
+INSERT INTO games (name, total_days, days_survived, outcome, cause, finished_at)
+VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+LEADERBOARD = """
+SELECT name, total_days, days_survived, outcome, cause, finished_at
+FROM games ORDER BY days_survived DESC, id LIMIT ?
+"""
+
+LEADERBOARD_BY_GOAL = """
+SELECT name, total_days, days_survived, outcome, cause, finished_at
+FROM games WHERE total_days = ? ORDER BY days_survived DESC, id LIMIT ?
+"""
+
+HISTORY = """
+SELECT name, total_days, days_survived, outcome, cause, finished_at
+FROM games WHERE name = ? ORDER BY id DESC LIMIT ?
+"""
+
+GAME_COLUMNS = ("name", "total_days", "days_survived", "outcome", "cause", "finished_at")
+
+
+class SQLiteStore:
+    """
+    SQLite database holding save slots and finished games.
+
+    A store can be shared between threads; every access is serialized by
+    an internal lock.
+    """
+
+    def __init__(self, path="data/saves.db", batch_size=500):
+        """
+        Open (and create if needed) the database.
+
+        Args:
+            path (str): Database file, or ":memory:" (default: "data/saves.db")
+            batch_size (int): Finished games buffered before an insert (default: 500)
+        """
+        if path != ":memory:":
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        self._pending = []
+        self._connection = sqlite3.connect(path, check_same_thread=False, cached_statements=64)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(SCHEMA)
+
+    def save_slot(self, player_key, slot, player, current_day, total_days):
+        """
+        Create or replace a save slot.
+
+        Args:
+            player_key (str): Owner of the slot (account or player name)
+            slot (str): Slot name
+            player (Player): The player to save
+            current_day (int): Current day in the game
+            total_days (int): Target number of days to survive
+        """
+        with self._lock, self._connection:
+            self._connection.execute(SAVE_SLOT, (
+                player_key, slot, player.name, player.hunger, player.thirst, player.energy,
+                player.days_survived, current_day, total_days, time.time()
+            ))
+
+    def load_slot(self, player_key, slot, player_class=Player):
+        """
+        Read a save slot.
+
+        Returns:
+            tuple: (player, current_day, total_days)
+
+        Raises:
+            NoSaveError: If the slot does not exist
+        """
+        with self._lock:
+            row = self._connection.execute(LOAD_SLOT, (player_key, slot)).fetchone()
+        if row is None:
+            raise NoSaveError(f"{player_key}/{slot}")
+
+        name, hunger, thirst, energy, days_survived, current_day, total_days = row
+        player = player_class(name=name, hunger=hunger, thirst=thirst, energy=energy,
+                              days_survived=days_survived)
+        return player, current_day, total_days
+
+    def delete_slot(self, player_key, slot):
+        """
+        Remove a save slot.
+
+        Returns:
+            bool: True if the slot existed
+        """
+        with self._lock, self._connection:
+            cursor = self._connection.execute(DELETE_SLOT, (player_key, slot))
+        return cursor.rowcount > 0
+
+    def list_slots(self, player_key):
+        """
+        List the save slots of a player.
+
+        Returns:
+            list: dicts with slot, day, total_days and updated_at
+        """
+        with self._lock:
+            rows = self._connection.execute(LIST_SLOTS, (player_key,)).fetchall()
+        return [dict(zip(("slot", "day", "total_days", "updated_at"), row)) for row in rows]
+
+    def record_game(self, name, total_days, days_survived, outcome, cause=""):
+        """
+        Add a finished game to the history.
+
+        Games are buffered and written in batches of batch_size; call flush()
+        to write them immediately.
+
+        Args:
+            name (str): Player's name
+            total_days (int): Target number of days to survive
+            days_survived (int): Days survived when the game ended
+            outcome (str): "victory", "rescued" or "dead"
+            cause (str): Death causes as reported by check_conditions (default: "")
+        """
+        with self._lock:
+            self._pending.append((name, total_days, days_survived, outcome, cause, time.time()))
+            if len(self._pending) >= self.batch_size:
+                self._flush_locked()
+
+    def record_games(self, games):
+        """
+        Add many finished games at once.
+
+        Args:
+            games (iterable): (name, total_days, days_survived, outcome, cause) tuples
+        """
+        now = time.time()
+        with self._lock:
+            self._pending.extend((*game, now) for game in games)
+            self._flush_locked()
+
+    def flush(self):
+        """Write the buffered finished games."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        if self._pending:
+            with self._connection:
+                self._connection.executemany(INSERT_GAME, self._pending)
+            self._pending = []
+
+    def leaderboard(self, limit=10, total_days=None):
+        """
+        Best finished games by days survived.
+
+        Args:
+            limit (int): Number of games (default: 10)
+            total_days (int): Only games with this survival goal (default: all)
+
+        Returns:
+            list: dicts with name, total_days, days_survived, outcome, cause, finished_at
+        """
+        with self._lock:
+            self._flush_locked()
+            if total_days is None:
+                rows = self._connection.execute(LEADERBOARD, (limit,)).fetchall()
+            else:
+                rows = self._connection.execute(LEADERBOARD_BY_GOAL, (total_days, limit)).fetchall()
+        return [dict(zip(GAME_COLUMNS, row)) for row in rows]
+
+    def history(self, name, limit=20):
+        """
+        Most recent finished games of a player.
+
+        Args:
+            name (str): Player's name
+            limit (int): Number of games (default: 20)
+
+        Returns:
+            list: dicts with name, total_days, days_survived, outcome, cause, finished_at
+        """
+        with self._lock:
+            self._flush_locked()
+            rows = self._connection.execute(HISTORY, (name, limit)).fetchall()
+        return [dict(zip(GAME_COLUMNS, row)) for row in rows]
+
+    def close(self):
+        """Write the buffered games and close the database."""
+        with self._lock:
+            if self._connection is not None:
+                self._flush_locked()
+                self._connection.close()
+                self._connection = None
+
+
+class SQLiteBackend:
+    """
+    Save backend storing one slot of an SQLiteStore.
+
+    Plugged with game.save.set_backend(), it makes save_game, load_game and
+    delete_save work on that slot, and record_game add to the history.
+    """
+
+    def __init__(self, store, player_key="default", slot="default"):
+        """
+        Initialize the backend.
+
+        Args:
+            store (SQLiteStore): Database to use
+            player_key (str): Owner of the slot (default: "default")
+            slot (str): Slot name (default: "default")
+        """
+        self.store = store
+        self.player_key = player_key
+        self.slot = slot
+        self.path = store.path
+
+    def save(self, player, current_day, total_days):
+        """Write the game state to the slot."""
+        self.store.save_slot(self.player_key, self.slot, player, current_day, total_days)
+
+    def load(self, player_class=Player):
+        """Read the game state from the slot."""
+        return self.store.load_slot(self.player_key, self.slot, player_class)
+
+    def delete(self):
+        """Remove the slot. Returns True if it existed."""
+        return self.store.delete_slot(self.player_key, self.slot)
+
+    def record_game(self, player, total_days, outcome, cause=""):
+        """Add a finished game to the history."""
+        self.store.record_game(player.name, total_days, player.days_survived, outcome, cause)
+
+    def flush_history(self):
+        """Write the buffered finished games now."""
+        self.store.flush()
+
+    def close(self):
+        """Write the buffered finished games (the store stays open)."""
+        self.store.flush()
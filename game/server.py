@@ -0,0 +1,529 @@
+"""
+Game server module.
+
+Hosts many games at once over TCP with asyncio. Each connection plays its
+own game with the same rules and texts as the console version, driven by
+an explicit state machine (SessionMachine) instead of a blocking loop.
+
+Line protocol (UTF-8):
+- the client sends one line per answer
+- the server answers with text lines, then one prompt line starting with
+  PROMPT_PREFIX; the client replies to that prompt
+- sending "quit" at any time saves the game and closes the connection
+
+Games are autosaved after every turn through a game.save backend. Saves
+run in a thread pool, off the event loop, and are coalesced per session.
+By default the saves go through a SessionCache (game.save.cache), so a
+turn only updates memory and a background thread writes the database;
+--cache-size 0 writes every turn to the database instead.
+
+Hints (action 6) run the advisor's search in the thread pool as well, so
+the event loop keeps serving the other sessions during a search. The
+sessions share one Advisor and its transposition table, guarded by a lock.
+The advisor's exact solution is loaded in the thread pool at startup.
+
+With --content, the actions and events are loaded from a content file
+(see game.content), which is reloaded whenever it changes on disk: games
+in progress use the new rules from their next turn.
+
+Usage:
+    python -m game.server [--host HOST] [--port PORT] [--db PATH] [--cache-size N]
+                          [--metrics PATH] [--content PATH]
+"""
+
+import argparse
+import asyncio
+import threading
+
+from game import metrics
+from game.player import Player
+from game.actions import ACTIONS
+from game.engine import GameSession, RESCUED
+from game.advisor import Advisor
+from game.gestion import ACTION_MENU, format_gauges, format_rescue, format_hint, check_conditions
+from game.save.json_file import NoSaveError
+
+
+PROMPT_PREFIX = "? "
+
+# Session states
+ASK_NAME = "ask_name"
+ASK_RESUME = "ask_resume"
+ASK_DAYS = "ask_days"
+PLAYING = "playing"
+ASK_REPLAY = "ask_replay"
+CLOSED = "closed"
+
+
+def session_name(line):
+    """
+    Player name given by an answer to the name prompt.
+
+    Returns:
+        str: The stripped answer, or "Survivor" if it is empty
+    """
+    return line.strip() or "Survivor"
+
+
+class SessionMachine:
+    """
+    State machine of one remote game.
+
+    The machine does no I/O: handle() takes the client's line and returns
+    the lines to send back. After each call, `save_requests` lists what the
+    server has to persist: ("save", player, current_day, total_days),
+    ("record", player, total_days, outcome, cause) and/or ("delete",), and
+    `hint_request` is (player, total_days) when the client asked for a
+    hint, to be answered with an Advisor and shown before the returned lines.
+    """
+
+    def __init__(self, saved_game_lookup=None, rng=None):
+        """
+        Initialize the machine.
+
+        Args:
+            saved_game_lookup (callable): name -> (player, current_day, total_days)
+                or None, used to offer resuming a saved game (default: no lookup)
+            rng (random.Random): Source of randomness (default: the random module)
+        """
+        self.saved_game_lookup = saved_game_lookup
+        self.rng = rng
+        self.state = ASK_NAME
+        self.name = None
+        self.session = None
+        self.saved = None
+        self.save_requests = []
+        self.hint_request = None
+        self.turns = 0
+
+    @property
+    def closed(self):
+        """bool: True once the client quit."""
+        return self.state == CLOSED
+
+    def start(self):
+        """
+        Lines sent when the client connects.
+
+        Returns:
+            tuple: (lines, prompt)
+        """
+        return [
+            "=" * 50,
+            "🏝️  WELCOME TO SURVIVE ISLAND  🏝️",
+            "=" * 50,
+        ], "👤 Enter your name:"
+
+    def handle(self, line):
+        """
+        Process one line from the client.
+
+        Args:
+            line (str): Client's answer, without the line terminator
+
+        Returns:
+            tuple: (lines, prompt) where prompt is None once the session is closed
+        """
+        line = line.strip()
+        self.save_requests = []
+        self.hint_request = None
+
+        if line.lower() == "quit":
+            return self._quit()
+
+        handler = getattr(self, "_on_" + self.state)
+        return handler(line)
+
+    def _quit(self):
+        lines = []
+        if self.state == PLAYING and self.session is not None and not self.session.finished:
+            self._request_save()
+            lines.append("👋 Game saved! See you next time!")
+        else:
+            lines.append("👋 Thanks for playing! See you next time!")
+        self.state = CLOSED
+        return lines, None
+
+    def _on_ask_name(self, line):
+        self.name = session_name(line)
+        if self.saved_game_lookup is not None:
+            self.saved = self.saved_game_lookup(self.name)
+        if self.saved is not None:
+            _, current_day, total_days = self.saved
+            self.state = ASK_RESUME
+            return [f"📂 A saved game was found (day {current_day} of {total_days})."], \
+                "Do you want to load it? (y/n)"
+        return self._ask_days([f"🌴 Welcome, {self.name}! Good luck!"])
+
+    def _on_ask_resume(self, line):
+        if line.lower() == "y":
+            player, current_day, total_days = self.saved
+            lines = [f"✅ Game loaded! Welcome back, {player.name}!", f"Resuming from day {current_day}..."]
+            return self._start_game(player, total_days, lines)
+        return self._ask_days([f"🌴 Welcome, {self.name}! Good luck!"])
+
+    def _ask_days(self, lines):
+        self.state = ASK_DAYS
+        return lines, "🎯 How many days do you think you can survive? (10-50):"
+
+    def _on_ask_days(self, line):
+        try:
+            total_days = int(line)
+        except ValueError:
+            return ["❌ Please enter a valid number."], "🎯 How many days do you think you can survive? (10-50):"
+        if not 10 <= total_days <= 50:
+            return ["❌ Please enter a number between 10 and 50."], \
+                "🎯 How many days do you think you can survive? (10-50):"
+        return self._start_game(Player(name=self.name), total_days, [])
+
+    def _start_game(self, player, total_days, lines):
+        self.session = GameSession(player=player, total_days=total_days, rng=self.rng)
+        self.state = PLAYING
+        lines += [
+            f"🏝️ Your goal: Survive {total_days} days on a desert island!",
+            "Manage your hunger, thirst, and energy wisely.",
+            "=" * 50,
+        ]
+        return self._turn_prompt(lines)
+
+    def _turn_prompt(self, lines):
+        player = self.session.player
+        lines += format_gauges(player)
+
+        continue_game, message = check_conditions(player, player.days_survived, self.session.total_days)
+        if not continue_game:
+            lines += ["=" * 50, message, "=" * 50]
+            self.save_requests = [
+                ("record", player, self.session.total_days, self.session.status, " and ".join(self.session.causes)),
+                ("delete",),
+            ]
+            self.state = ASK_REPLAY
+            return lines, "🔄 Do you want to play again? (y/n)"
+
+        return lines + ACTION_MENU, "Your choice (1-6):"
+
+    def _on_playing(self, line):
+        if line == "5":
+            return self._quit()
+        if line == "6":
+            player = self.session.player
+            snapshot = Player(name=player.name, hunger=player.hunger, thirst=player.thirst,
+                              energy=player.energy, days_survived=player.days_survived)
+            self.hint_request = (snapshot, self.session.total_days)
+            return [], "Your choice (1-6):"
+        if line not in ACTIONS:
+            return ["❌ Invalid choice. Please enter 1, 2, 3, 4, 5, or 6."], "Your choice (1-6):"
+
+        session = self.session
+        outcome = session.play(line)
+        self.turns += 1
+        lines = [
+            "-" * 40,
+            ACTIONS[line]["description"],
+            outcome.action_message,
+            "-" * 40,
+            "🎲 Random event...",
+        ]
+
+        if outcome.status == RESCUED:
+            lines += format_rescue(session.player)
+            self.save_requests = [("record", session.player, session.total_days, RESCUED, ""), ("delete",)]
+            self.state = ASK_REPLAY
+            return lines, "🔄 Do you want to play again? (y/n)"
+
+        lines.append(outcome.event_message)
+        self._request_save()
+        return self._turn_prompt(lines)
+
+    def _on_ask_replay(self, line):
+        if line.lower() == "y":
+            self.saved = None
+            return self._ask_days([])
+        self.state = CLOSED
+        return ["👋 Thanks for playing! See you next time!"], None
+
+    def _request_save(self):
+        player = self.session.player
+        snapshot = Player(name=player.name, hunger=player.hunger, thirst=player.thirst,
+                          energy=player.energy, days_survived=player.days_survived)
+        self.save_requests = [("save", snapshot, player.days_survived, self.session.total_days)]
+
+
+class Autosaver:
+    """
+    Persists the save requests of one session in a worker thread.
+
+    Only one write per session runs at a time; while it runs, newer save
+    requests replace older ones, so a slow disk never queues up turns.
+    Plain saves to backends flagged `in_memory` (CachedBackend) are applied
+    directly, unless the backend is backlogged; deletions and finished
+    games may read or write the database, so they always go to the pool.
+    """
+
+    def __init__(self, backend):
+        """
+        Initialize the autosaver.
+
+        Args:
+            backend: game.save backend dedicated to this session
+        """
+        self.backend = backend
+        self.pending = []
+        self.task = None
+
+    def submit(self, requests):
+        """Queue save requests; a plain "save" replaces a queued one."""
+        if (getattr(self.backend, "in_memory", False) and not self.pending
+                and all(request[0] == "save" for request in requests)
+                and not self.backend.backlogged()):
+            for request in requests:
+                self._apply(request)
+            return
+        for request in requests:
+            if request[0] == "save" and self.pending and self.pending[-1][0] == "save":
+                self.pending[-1] = request
+            else:
+                self.pending.append(request)
+        if self.pending and (self.task is None or self.task.done()):
+            self.task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while self.pending:
+            request = self.pending.pop(0)
+            await loop.run_in_executor(None, self._apply, request)
+
+    def _apply(self, request):
+        kind = request[0]
+        if kind == "save":
+            with metrics.timer("save_seconds"):
+                self.backend.save(*request[1:])
+        elif kind == "record":
+            if hasattr(self.backend, "record_game"):
+                self.backend.record_game(*request[1:])
+        elif kind == "delete":
+            with metrics.timer("delete_seconds"):
+                self.backend.delete()
+
+    async def drain(self):
+        """Wait until every queued request is written."""
+        while self.task is not None and not self.task.done():
+            await self.task
+
+
+class GameServer:
+    """
+    asyncio TCP server running one SessionMachine per connection.
+    """
+
+    def __init__(self, backend_factory, rng=None):
+        """
+        Initialize the server.
+
+        Args:
+            backend_factory (callable): name -> game.save backend for that player
+            rng (random.Random): Source of randomness shared by the sessions
+                (default: the random module)
+        """
+        self.backend_factory = backend_factory
+        self.rng = rng
+        self.connections = 0
+        self.turns = 0
+        self.server = None
+        self.handlers = set()
+        self.advisor = Advisor()
+        self.advisor_ready = None
+        self._advisor_lock = threading.Lock()
+
+    def advise(self, player, total_days):
+        """
+        Answer a hint request (called in the thread pool).
+
+        The transposition table of the shared advisor is not thread-safe,
+        so the searches run one at a time.
+
+        Returns:
+            Hint: Recommended action and values of the actions
+        """
+        with self._advisor_lock:
+            return self.advisor.advise(player, total_days)
+
+    def prepare_advisor(self):
+        """Load the advisor's exact solution (called in the thread pool)."""
+        with self._advisor_lock:
+            self.advisor.prepare()
+
+    async def start(self, host="127.0.0.1", port=8765, backlog=4096):
+        """Start listening. Returns the asyncio server."""
+        self.server = await asyncio.start_server(self.handle_client, host, port, limit=4096, backlog=backlog)
+        # Ready before the first hint, without delaying the first sessions
+        self.advisor_ready = asyncio.get_running_loop().run_in_executor(None, self.prepare_advisor)
+        return self.server
+
+    async def close(self):
+        """Stop listening and wait for the open sessions to finish their saves."""
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        if self.handlers:
+            await asyncio.gather(*self.handlers, return_exceptions=True)
+
+    async def handle_client(self, reader, writer):
+        """Run one session until the client quits or disconnects."""
+        task = asyncio.current_task()
+        self.handlers.add(task)
+        self.connections += 1
+        autosaver = None
+        backends = {}
+
+        def backend_for(name):
+            if name not in backends:
+                backends[name] = self.backend_factory(name)
+            return backends[name]
+
+        def lookup(name):
+            try:
+                return backend_for(name).load()
+            except NoSaveError:
+                return None
+
+        # Saved games are read in the thread pool before the machine asks for them
+        saved_games = {}
+        machine = SessionMachine(saved_game_lookup=saved_games.get, rng=self.rng)
+        loop = asyncio.get_running_loop()
+
+        try:
+            lines, prompt = machine.start()
+            writer.write(_encode(lines, prompt))
+
+            while not machine.closed:
+                raw = await reader.readline()
+                if not raw:
+                    break
+                line = raw.decode("utf-8", "replace")
+                if machine.state == ASK_NAME and line.strip().lower() != "quit":
+                    name = session_name(line)
+                    saved_games[name] = await loop.run_in_executor(None, lookup, name)
+                turns = machine.turns
+                lines, prompt = machine.handle(line)
+                self.turns += machine.turns - turns
+
+                if machine.hint_request is not None:
+                    hint = await loop.run_in_executor(None, self.advise, *machine.hint_request)
+                    lines = format_hint(hint) + lines
+
+                if machine.save_requests:
+                    if autosaver is None:
+                        autosaver = Autosaver(backend_for(machine.name))
+                    autosaver.submit(machine.save_requests)
+
+                writer.write(_encode(lines, prompt))
+                await writer.drain()
+
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.connections -= 1
+            if autosaver is not None:
+                await autosaver.drain()
+            writer.close()
+            self.handlers.discard(task)
+
+
+def _encode(lines, prompt):
+    text = "\n".join(line.strip("\n") for line in lines)
+    if prompt is not None:
+        text += "\n" + PROMPT_PREFIX + prompt
+    return (text + "\n").encode("utf-8")
+
+
+async def write_metrics(interval):
+    """Write the metrics snapshot file every `interval` seconds."""
+    loop = asyncio.get_running_loop()
+    while True:
+        await asyncio.sleep(interval)
+        await loop.run_in_executor(None, metrics.flush)
+
+
+async def watch_content(reloader, interval):
+    """
+    Check the content file every `interval` seconds and install it when it changed.
+
+    The file is read and parsed in the thread pool; only the swap of the
+    compiled tables runs on the event loop, between two turns.
+    """
+    from game.content import install
+
+    loop = asyncio.get_running_loop()
+    while True:
+        await asyncio.sleep(interval)
+        content = await loop.run_in_executor(None, reloader.poll)
+        if content is not None:
+            install(content)
+            print(f"🔄 Content reloaded from {reloader.path}")
+        elif reloader.error is not None:
+            print(f"❌ Content not reloaded: {reloader.error}")
+            reloader.error = None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SurviveIsland game server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--db", default="data/server.db", help="SQLite database for the saves")
+    parser.add_argument("--cache-size", type=int, default=10_000,
+                        help="sessions kept in memory, written in the background (0: write every turn)")
+    parser.add_argument("--flush-interval", type=float, default=1.0, help="seconds between cache writes")
+    parser.add_argument("--metrics", default=None,
+                        help="collect metrics and write a snapshot to this file (.prom or .json)")
+    parser.add_argument("--metrics-interval", type=float, default=10.0, help="seconds between snapshots")
+    parser.add_argument("--content", default=None, help="content file with the actions and events (.json or .toml)")
+    parser.add_argument("--content-interval", type=float, default=2.0, help="seconds between content file checks")
+    args = parser.parse_args()
+
+    reloader = None
+    if args.content:
+        from game.content import ContentReloader
+        reloader = ContentReloader(args.content)
+        if not reloader.check():
+            print(f"❌ Cannot load content: {reloader.error}")
+            return 1
+
+    if args.metrics:
+        metrics.enable(args.metrics)
+    else:
+        metrics.enable_from_environment()
+
+    from game.save.sqlite import SQLiteStore, SQLiteBackend
+    store = SQLiteStore(args.db)
+    cache = None
+    backend_factory = lambda name: SQLiteBackend(store, player_key=name)
+    if args.cache_size > 0:
+        from game.save.cache import SessionCache
+        cache = SessionCache(backend_factory, max_sessions=args.cache_size, flush_interval=args.flush_interval)
+        backend_factory = cache.backend
+
+    async def serve():
+        server = GameServer(backend_factory)
+        listener = await server.start(args.host, args.port)
+        print(f"🏝️ Listening on {args.host}:{args.port}")
+        if metrics.enabled:
+            asyncio.get_running_loop().create_task(write_metrics(args.metrics_interval))
+        if reloader is not None:
+            asyncio.get_running_loop().create_task(watch_content(reloader, args.content_interval))
+        async with listener:
+            await listener.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if cache is not None:
+            cache.close()
+        store.close()
+        metrics.flush()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,219 @@
+"""
+Optimal policy solver module.
+
+Computes by backward induction the exact probability of winning (surviving
+until the goal or being rescued) from every state, together with the best
+action, for every number of remaining days up to a horizon.
+
+The value of a state only depends on the number of days left, so one
+backward pass over the horizon answers every (days_survived, total_days)
+pair. Results are cached on disk as compressed arrays keyed by the rules.
+
+Requires NumPy.
+"""
+
+import os
+
+import numpy as np
+
+from game.actions import ACTIONS
+from game.markov import Lattice, action_outcomes, event_outcomes, rules_fingerprint
+from game import engine
+
+
+CACHE_DIR = "data/solver"
+MAX_HORIZON = 50
+
+
+class Solution:
+    """
+    Exact win probabilities and optimal actions.
+
+    Attributes:
+        values (ndarray): float32 array (horizon + 1, *lattice.shape);
+            values[k][s] is the win probability with k days left from state s
+        policy (ndarray): uint8 array (horizon + 1, *lattice.shape) holding
+            the best action code (1 to 4) with k days left, 0 when k == 0
+        lattice (Lattice): Gauge lattice the arrays are indexed by
+    """
+
+    def __init__(self, values, policy, lattice):
+        self.values = values
+        self.policy = policy
+        self.lattice = lattice
+
+    @property
+    def horizon(self):
+        """int: Largest number of remaining days solved."""
+        return len(self.values) - 1
+
+    def _days_left(self, player, total_days):
+        days_left = max(0, total_days - player.days_survived)
+        if days_left > self.horizon:
+            raise ValueError(f"Solution only covers {self.horizon} remaining days.")
+        return days_left
+
+    def win_probability(self, player, total_days):
+        """
+        Probability of winning from the player's state when playing optimally.
+
+        Args:
+            player (Player): Current player (gauges must be on the lattice)
+            total_days (int): Target number of days to survive
+
+        Returns:
+            float: Win probability between 0 and 1
+        """
+        days_left = self._days_left(player, total_days)
+        index = self.lattice.index(player.hunger, player.thirst, player.energy)
+        return float(self.values[days_left][index])
+
+    def best_action(self, player, total_days):
+        """
+        Best action for the player's state.
+
+        Args:
+            player (Player): Current player (gauges must be on the lattice)
+            total_days (int): Target number of days to survive
+
+        Returns:
+            str: Action number ("1" to "4"), or None if the game is over
+        """
+        days_left = self._days_left(player, total_days)
+        if days_left == 0 or not player.is_alive():
+            return None
+        index = self.lattice.index(player.hunger, player.thirst, player.energy)
+        return str(self.policy[days_left][index])
+
+    def action_values(self, player, total_days):
+        """
+        Win probability of every action from the player's state.
+
+        Args:
+            player (Player): Current player (gauges must be on the lattice)
+            total_days (int): Target number of days to survive
+
+        Returns:
+            dict: Action number -> win probability if played now, then optimally
+        """
+        days_left = self._days_left(player, total_days)
+        if days_left == 0 or not player.is_alive():
+            return {}
+
+        after_event = _after_action_values(self.lattice, self.values[days_left - 1].astype(np.float64))
+        lattice = self.lattice
+        state = (player.hunger, player.thirst, player.energy)
+        result = {}
+        for action in ACTIONS:
+            total = 0.0
+            for probability, dh, dt, de in action_outcomes(action):
+                target = tuple(min(100, max(0, value + delta)) for value, delta in zip(state, (dh, dt, de)))
+                total += probability * after_event[lattice.index(*target)]
+            result[action] = float(total)
+        return result
+
+
+def _after_action_values(lattice, next_values):
+    """
+    Win probability from the state reached right after the action.
+
+    Args:
+        lattice (Lattice): Gauge lattice
+        next_values (ndarray): Values with one day less left (0 on dead states)
+
+    Returns:
+        ndarray: Expected value over the random event and the daily decay
+    """
+    after_decay = lattice.gather(next_values, *engine.DAILY_DECAY)
+    result = np.zeros(lattice.shape)
+    for probability, dh, dt, de, rescue in event_outcomes():
+        if rescue:
+            result += probability
+        else:
+            result += probability * lattice.gather(after_decay, dh, dt, de)
+    return result
+
+
+def solve_arrays(horizon=MAX_HORIZON, lattice=None):
+    """
+    Run the backward induction without touching the disk cache.
+
+    Args:
+        horizon (int): Largest number of remaining days (default: 50)
+        lattice (Lattice): Gauge lattice (default: computed from the rules)
+
+    Returns:
+        Solution: Values and policy for 0 to horizon remaining days
+    """
+    lattice = lattice or Lattice()
+    alive = lattice.alive()
+    actions = sorted(ACTIONS, key=int)
+
+    values = np.zeros((horizon + 1,) + lattice.shape, dtype=np.float32)
+    policy = np.zeros((horizon + 1,) + lattice.shape, dtype=np.uint8)
+    values[0] = alive
+
+    current = alive.astype(np.float64)
+    for days_left in range(1, horizon + 1):
+        after_event = _after_action_values(lattice, current)
+
+        q_values = np.empty((len(actions),) + lattice.shape)
+        for i, action in enumerate(actions):
+            q = np.zeros(lattice.shape)
+            for probability, dh, dt, de in action_outcomes(action):
+                q += probability * lattice.gather(after_event, dh, dt, de)
+            q_values[i] = q
+
+        best = np.argmax(q_values, axis=0)
+        current = np.where(alive, np.max(q_values, axis=0), 0.0)
+        values[days_left] = current
+        policy[days_left] = np.where(alive, np.array([int(a) for a in actions])[best], 0)
+
+    return Solution(values, policy, lattice)
+
+
+def cache_path(horizon=MAX_HORIZON, cache_dir=CACHE_DIR):
+    """
+    Path of the cache file for the current rules.
+
+    Returns:
+        str: Path of the .npz file
+    """
+    return os.path.join(cache_dir, f"solution-{rules_fingerprint()}-{horizon}.npz")
+
+
+def solve(horizon=MAX_HORIZON, cache_dir=CACHE_DIR, use_cache=True):
+    """
+    Get the optimal solution, loading it from the disk cache when possible.
+
+    Args:
+        horizon (int): Largest number of remaining days (default: 50)
+        cache_dir (str): Directory of the cache files (default: "data/solver")
+        use_cache (bool): Read and write the cache (default: True)
+
+    Returns:
+        Solution: Values and policy for 0 to horizon remaining days
+    """
+    path = cache_path(horizon, cache_dir)
+
+    if use_cache and os.path.exists(path):
+        try:
+            with np.load(path) as data:
+                return Solution(data["values"], data["policy"], Lattice(tuple(data["steps"])))
+        except (OSError, KeyError, ValueError):
+            pass
+
+    solution = solve_arrays(horizon)
+
+    if use_cache:
+        os.makedirs(cache_dir, exist_ok=True)
+        temporary = path + ".tmp.npz"
+        np.savez_compressed(
+            temporary,
+            values=solution.values,
+            policy=solution.policy,
+            steps=np.array(solution.lattice.steps),
+        )
+        os.replace(temporary, path)
+
+    return solution
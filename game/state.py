@@ -0,0 +1,258 @@
+"""
+Packed game state module.
+
+Stores a complete game state (hunger, thirst, energy, days survived and
+survival goal) in a single integer. Packed states are immutable, hash and
+compare as plain integers, and can be stored by the million in a compact
+StateArray (8 bytes per state).
+
+Bit layout (least significant first):
+    hunger: 7 bits | thirst: 7 bits | energy: 7 bits |
+    days_survived: 12 bits | total_days: 12 bits
+"""
+
+from array import array
+
+from game.player import Player
+
+
+GAUGE_BITS = 7
+DAYS_BITS = 12
+
+THIRST_SHIFT = GAUGE_BITS
+ENERGY_SHIFT = 2 * GAUGE_BITS
+DAYS_SHIFT = 3 * GAUGE_BITS
+TOTAL_DAYS_SHIFT = 3 * GAUGE_BITS + DAYS_BITS
+
+GAUGE_MASK = (1 << GAUGE_BITS) - 1
+DAYS_MASK = (1 << DAYS_BITS) - 1
+
+
+class PackedState(int):
+    """
+    Game state packed into an integer.
+
+    Equality, hashing and copying are those of int, so states can be used
+    directly as dictionary keys or set members.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, hunger=100, thirst=100, energy=100, days_survived=0, total_days=10):
+        """
+        Pack a game state.
+
+        Args:
+            hunger (int): Hunger level (0-100, default: 100)
+            thirst (int): Thirst level (0-100, default: 100)
+            energy (int): Energy level (0-100, default: 100)
+            days_survived (int): Days survived (0-4095, default: 0)
+            total_days (int): Target number of days to survive (0-4095, default: 10)
+
+        Raises:
+            ValueError: If a field does not fit in its bits
+        """
+        for name, value in (("hunger", hunger), ("thirst", thirst), ("energy", energy)):
+            if not 0 <= value <= 100:
+                raise ValueError(f"{name} must be between 0 and 100, got {value}.")
+        for name, value in (("days_survived", days_survived), ("total_days", total_days)):
+            if not 0 <= value <= DAYS_MASK:
+                raise ValueError(f"{name} must be between 0 and {DAYS_MASK}, got {value}.")
+
+        return int.__new__(cls, hunger
+                           | thirst << THIRST_SHIFT
+                           | energy << ENERGY_SHIFT
+                           | days_survived << DAYS_SHIFT
+                           | total_days << TOTAL_DAYS_SHIFT)
+
+    @classmethod
+    def from_int(cls, value):
+        """Wrap an already packed integer (e.g. read from a StateArray)."""
+        return int.__new__(cls, value)
+
+    @property
+    def hunger(self):
+        return self & GAUGE_MASK
+
+    @property
+    def thirst(self):
+        return self >> THIRST_SHIFT & GAUGE_MASK
+
+    @property
+    def energy(self):
+        return self >> ENERGY_SHIFT & GAUGE_MASK
+
+    @property
+    def days_survived(self):
+        return self >> DAYS_SHIFT & DAYS_MASK
+
+    @property
+    def total_days(self):
+        return self >> TOTAL_DAYS_SHIFT & DAYS_MASK
+
+    def unpack(self):
+        """
+        Unpack every field.
+
+        Returns:
+            tuple: (hunger, thirst, energy, days_survived, total_days)
+        """
+        return (self & GAUGE_MASK,
+                self >> THIRST_SHIFT & GAUGE_MASK,
+                self >> ENERGY_SHIFT & GAUGE_MASK,
+                self >> DAYS_SHIFT & DAYS_MASK,
+                self >> TOTAL_DAYS_SHIFT & DAYS_MASK)
+
+    def replace(self, **changes):
+        """
+        Create a new state with some fields changed.
+
+        Args:
+            **changes: Fields to change (hunger, thirst, energy, days_survived, total_days)
+
+        Returns:
+            PackedState: New state
+        """
+        fields = dict(zip(("hunger", "thirst", "energy", "days_survived", "total_days"), self.unpack()))
+        fields.update(changes)
+        return PackedState(**fields)
+
+    def __repr__(self):
+        return ("PackedState(hunger={}, thirst={}, energy={}, days_survived={}, total_days={})"
+                .format(*self.unpack()))
+
+    @classmethod
+    def from_player(cls, player, total_days=10):
+        """
+        Pack the state of a player.
+
+        Args:
+            player (Player): Player to pack (the name is not stored)
+            total_days (int): Target number of days to survive (default: 10)
+
+        Returns:
+            PackedState: Packed state
+        """
+        return cls(player.hunger, player.thirst, player.energy, player.days_survived, total_days)
+
+    def to_player(self, name="Survivor", player_class=Player):
+        """
+        Rebuild a player from the packed state.
+
+        Args:
+            name (str): Player's name (default: "Survivor")
+            player_class (type): Player or SlottedPlayer (default: Player)
+
+        Returns:
+            Player: New player with the packed gauges and days
+        """
+        hunger, thirst, energy, days_survived, _ = self.unpack()
+        return player_class(hunger=hunger, thirst=thirst, energy=energy,
+                            days_survived=days_survived, name=name)
+
+    @classmethod
+    def from_save_data(cls, save_data):
+        """
+        Pack a state read from the save file layout used by game.save.
+
+        Missing fields get the same defaults as load_game.
+
+        Args:
+            save_data (dict): Decoded save file
+
+        Returns:
+            PackedState: Packed state
+        """
+        player_data = save_data.get("player", {})
+        return cls(
+            hunger=player_data.get("hunger", 100),
+            thirst=player_data.get("thirst", 100),
+            energy=player_data.get("energy", 100),
+            days_survived=player_data.get("days_survived", save_data.get("day", 0)),
+            total_days=save_data.get("total_days", 10),
+        )
+
+    def to_save_data(self, name="Survivor"):
+        """
+        Convert to the save file layout used by game.save.
+
+        Args:
+            name (str): Player's name (default: "Survivor")
+
+        Returns:
+            dict: Data ready to be written as JSON
+        """
+        hunger, thirst, energy, days_survived, total_days = self.unpack()
+        return {
+            "day": days_survived,
+            "total_days": total_days,
+            "player": {
+                "name": name,
+                "hunger": hunger,
+                "thirst": thirst,
+                "energy": energy,
+                "days_survived": days_survived
+            }
+        }
+
+
+class StateArray:
+    """
+    Compact sequence of packed states, 8 bytes per state.
+
+    Backed by an array('Q'), so it can be written to and read from bytes
+    directly, or viewed as a NumPy uint64 array with numpy.frombuffer.
+    """
+
+    def __init__(self, states=()):
+        """
+        Initialize the array.
+
+        Args:
+            states (iterable): Initial packed states or integers
+        """
+        self.data = array("Q", states)
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            result = StateArray()
+            result.data = self.data[index]
+            return result
+        return PackedState.from_int(self.data[index])
+
+    def __setitem__(self, index, state):
+        self.data[index] = state
+
+    def __iter__(self):
+        from_int = PackedState.from_int
+        return (from_int(value) for value in self.data)
+
+    def append(self, state):
+        """Add a packed state at the end."""
+        self.data.append(state)
+
+    def extend(self, states):
+        """Add several packed states at the end."""
+        self.data.extend(states)
+
+    def tobytes(self):
+        """bytes: Raw content (native byte order)."""
+        return self.data.tobytes()
+
+    @classmethod
+    def frombytes(cls, raw):
+        """
+        Rebuild an array from raw bytes produced by tobytes().
+
+        Args:
+            raw (bytes): Raw content
+
+        Returns:
+            StateArray: New array
+        """
+        result = cls()
+        result.data.frombytes(raw)
+        return result
@@ -0,0 +1,498 @@
+"""
+Streaming statistics module.
+
+Summarizes any number of games in constant memory: games are consumed one
+at a time from an iterator (e.g. iter_games), and only counters are kept:
+- games per outcome, victories per survival goal, deaths per cause (the
+  causes reported by check_conditions, alone and combined)
+- exact histograms of days survived, per outcome
+- quantiles of days survived, exact since they are read from the histogram
+- per-turn hazard rates: the fraction of the games still running at a
+  turn that end on that turn, per outcome
+- gauge means after each turn
+
+Every statistic is an integer count, so merging the statistics of
+different chunks or workers is exact, associative and commutative, and a
+snapshot (to_dict, or a run_streaming checkpoint) can be stored to resume
+a long run.
+
+Usage:
+    python -m game.stats --games 1000000 --days 10 [--checkpoint PATH] [--workers N]
+"""
+
+import math
+import os
+from collections import Counter, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from game.player import Player
+from game.engine import step, ONGOING, VICTORY, RESCUED, DEAD
+from game.montecarlo import DEFAULT_CHUNK_SIZE, chunk_rng, _make_policy
+
+
+STATUSES = (VICTORY, RESCUED, DEAD)
+GAUGES = ("hunger", "thirst", "energy")
+
+
+GameRecord = namedtuple("GameRecord", ["status", "causes", "days_survived", "total_days", "gauges"])
+GameRecord.__doc__ = """
+Result of one finished game.
+
+Fields:
+    status (str): Final status (VICTORY, RESCUED or DEAD)
+    causes (tuple): Depleted gauges when dead
+    days_survived (int): Days survived when the game ended
+    total_days (int): Target number of days to survive
+    gauges (list): (hunger, thirst, energy) after each turn played, or None
+"""
+
+
+def _grow(values, size, fill=0):
+    if len(values) < size:
+        values.extend(fill() if callable(fill) else fill for _ in range(size - len(values)))
+
+
+def turns_played(status, days_survived):
+    """
+    Number of turns played by a finished game.
+
+    A rescue ends the turn before the day is counted.
+
+    Returns:
+        int: Turns played
+    """
+    return days_survived + 1 if status == RESCUED else days_survived
+
+
+class StreamingStats:
+    """
+    Constant-memory statistics of a stream of finished games.
+
+    Memory grows with the longest game seen, not with the number of games.
+    """
+
+    def __init__(self):
+        self.games = 0
+        self.outcomes = Counter()
+        self.victories_by_goal = Counter()
+        self.death_causes = Counter()
+        self.cause_counts = Counter()
+        self.days = {status: [] for status in STATUSES}
+        # gauge_sums[turn - 1] = [games, hunger, thirst, energy] after that turn
+        self.gauge_sums = []
+
+    def add(self, status, causes, days_survived, total_days, gauges=None):
+        """
+        Record one finished game.
+
+        Args:
+            status (str): Final status (VICTORY, RESCUED or DEAD)
+            causes (tuple): Depleted gauges when dead
+            days_survived (int): Days survived when the game ended
+            total_days (int): Target number of days to survive
+            gauges (iterable): (hunger, thirst, energy) after each turn (optional)
+        """
+        self.games += 1
+        self.outcomes[status] += 1
+        if status == VICTORY:
+            self.victories_by_goal[total_days] += 1
+        elif status == DEAD:
+            self.death_causes[" and ".join(causes)] += 1
+            self.cause_counts.update(causes)
+
+        histogram = self.days[status]
+        _grow(histogram, days_survived + 1)
+        histogram[days_survived] += 1
+
+        if gauges is not None:
+            sums = self.gauge_sums
+            for turn, (hunger, thirst, energy) in enumerate(gauges):
+                if turn == len(sums):
+                    sums.append([0, 0, 0, 0])
+                row = sums[turn]
+                row[0] += 1
+                row[1] += hunger
+                row[2] += thirst
+                row[3] += energy
+
+    def consume(self, records):
+        """
+        Record every game of an iterable of GameRecord, one at a time.
+
+        Args:
+            records (iterable): GameRecord objects, e.g. from iter_games
+
+        Returns:
+            StreamingStats: self, to allow chaining
+        """
+        add = self.add
+        for record in records:
+            add(*record)
+        return self
+
+    def add_population(self, population):
+        """
+        Record the games of a vectorized simulation (without gauge trajectories).
+
+        Requires NumPy.
+
+        Args:
+            population (PopulationResult): Result of game.population.simulate
+
+        Returns:
+            StreamingStats: self, to allow chaining
+        """
+        import numpy as np
+        from game.population import STATUS_NAMES
+
+        self.games += len(population)
+        for code, status in enumerate(STATUS_NAMES):
+            if status not in self.days:
+                continue
+            days = population.days[population.status == code]
+            if not len(days):
+                continue
+            self.outcomes[status] += len(days)
+            if status == VICTORY:
+                self.victories_by_goal[population.total_days] += len(days)
+            histogram = self.days[status]
+            counts = np.bincount(days)
+            _grow(histogram, len(counts))
+            for day, count in enumerate(counts.tolist()):
+                histogram[day] += count
+
+        for label, count in population.cause_counts().items():
+            self.death_causes[label] += count
+            for cause in label.split(" and "):
+                self.cause_counts[cause] += count
+        return self
+
+    def merge(self, other):
+        """
+        Add the statistics of another aggregate into this one.
+
+        Args:
+            other (StreamingStats): Statistics of other games
+
+        Returns:
+            StreamingStats: self, to allow chaining
+        """
+        self.games += other.games
+        self.outcomes.update(other.outcomes)
+        self.victories_by_goal.update(other.victories_by_goal)
+        self.death_causes.update(other.death_causes)
+        self.cause_counts.update(other.cause_counts)
+        for status, histogram in other.days.items():
+            mine = self.days[status]
+            _grow(mine, len(histogram))
+            for day, count in enumerate(histogram):
+                mine[day] += count
+        _grow(self.gauge_sums, len(other.gauge_sums), lambda: [0, 0, 0, 0])
+        for mine, theirs in zip(self.gauge_sums, other.gauge_sums):
+            for i in range(4):
+                mine[i] += theirs[i]
+        return self
+
+    @property
+    def days_histogram(self):
+        """list: histogram[day] = number of games that ended with that many days survived."""
+        size = max(len(histogram) for histogram in self.days.values())
+        total = [0] * size
+        for histogram in self.days.values():
+            for day, count in enumerate(histogram):
+                total[day] += count
+        return total
+
+    def rate(self, status):
+        """
+        Fraction of games that ended with the given status.
+
+        Returns:
+            float: Rate between 0 and 1 (0 if no game was recorded)
+        """
+        return self.outcomes[status] / self.games if self.games else 0.0
+
+    @property
+    def mean_days(self):
+        """float: Average number of days survived (0 if no game was recorded)."""
+        if not self.games:
+            return 0.0
+        return sum(day * count for day, count in enumerate(self.days_histogram)) / self.games
+
+    def quantile(self, q):
+        """
+        Quantile of the days survived (nearest rank).
+
+        Args:
+            q (float): Quantile between 0 and 1
+
+        Returns:
+            int: Smallest number of days such that a fraction q of the games
+                survived at most that long (0 if no game was recorded)
+        """
+        if not self.games:
+            return 0
+        rank = max(1, math.ceil(q * self.games))
+        seen = 0
+        for day, count in enumerate(self.days_histogram):
+            seen += count
+            if seen >= rank:
+                return day
+        return len(self.days_histogram) - 1
+
+    def hazard(self, status=DEAD):
+        """
+        Per-turn hazard rate of an outcome.
+
+        Args:
+            status (str): VICTORY, RESCUED or DEAD (default: DEAD)
+
+        Returns:
+            list: (turn, games_at_risk, rate) for every turn played by at
+                least one game, where rate is the fraction of the games
+                playing that turn which ended it with the given status
+        """
+        ended = Counter()
+        for name, histogram in self.days.items():
+            for day, count in enumerate(histogram):
+                if count:
+                    ended[(name, turns_played(name, day))] += count
+
+        last_turn = max((turn for _, turn in ended), default=0)
+        at_risk = self.games
+        rates = []
+        for turn in range(1, last_turn + 1):
+            if at_risk:
+                rates.append((turn, at_risk, ended[(status, turn)] / at_risk))
+            at_risk -= sum(ended[(name, turn)] for name in STATUSES)
+        return rates
+
+    def gauge_means(self):
+        """
+        Mean gauges after each turn, over the games that played it.
+
+        Returns:
+            list: (turn, games, mean_hunger, mean_thirst, mean_energy)
+        """
+        return [(turn, games, hunger / games, thirst / games, energy / games)
+                for turn, (games, hunger, thirst, energy) in enumerate(self.gauge_sums, 1) if games]
+
+    def __eq__(self, other):
+        return isinstance(other, StreamingStats) and self.to_dict() == other.to_dict()
+
+    def to_dict(self):
+        """
+        Convert the statistics to plain data (JSON compatible).
+
+        Returns:
+            dict: Every counter; from_dict() restores the object
+        """
+        return {
+            "games": self.games,
+            "outcomes": dict(self.outcomes),
+            "victories_by_goal": {str(goal): count for goal, count in sorted(self.victories_by_goal.items())},
+            "death_causes": dict(self.death_causes),
+            "cause_counts": dict(self.cause_counts),
+            "days": {status: list(histogram) for status, histogram in self.days.items()},
+            "gauge_sums": [list(row) for row in self.gauge_sums],
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Rebuild statistics from to_dict() output.
+
+        Args:
+            data (dict): Snapshot
+
+        Returns:
+            StreamingStats: The restored statistics
+        """
+        stats = cls()
+        stats.games = data["games"]
+        stats.outcomes.update(data["outcomes"])
+        stats.victories_by_goal.update({int(goal): count for goal, count in data["victories_by_goal"].items()})
+        stats.death_causes.update(data["death_causes"])
+        stats.cause_counts.update(data["cause_counts"])
+        for status in STATUSES:
+            stats.days[status] = list(data["days"].get(status, []))
+        stats.gauge_sums = [list(row) for row in data["gauge_sums"]]
+        return stats
+
+    def summary(self):
+        """
+        Format the main statistics.
+
+        Returns:
+            list: Lines of text
+        """
+        lines = [f"🎲 Games: {self.games:,}"]
+        for status in STATUSES:
+            lines.append(f"   {status:8} {100 * self.rate(status):6.2f}%")
+        for cause, count in self.cause_counts.most_common():
+            lines.append(f"   💀 {cause:8} {count:,}")
+        lines.append(f"📅 Days survived: mean {self.mean_days:.2f}, median {self.quantile(0.5)}, "
+                     f"p90 {self.quantile(0.9)}, p99 {self.quantile(0.99)}")
+        means = {row[0]: row[2:] for row in self.gauge_means()}
+        for turn, games, rate in self.hazard(DEAD):
+            line = f"   turn {turn:3}: {games:>12,} playing, death hazard {100 * rate:6.2f}%"
+            if turn in means:
+                line += ", mean gauges {:5.1f} / {:5.1f} / {:5.1f}".format(*means[turn])
+            lines.append(line)
+        return lines
+
+
+def iter_games(seed, chunk, n_games, total_days, policy="random"):
+    """
+    Play the games of one chunk, yielding them one by one.
+
+    The games are the same as those of game.montecarlo.run_chunk with the
+    same arguments.
+
+    Args:
+        seed (int): Seed of the whole run
+        chunk (int): Index of the chunk
+        n_games (int): Number of games in this chunk
+        total_days (int): Target number of days to survive
+        policy: "random", an action number ("1" to "4") or a picklable
+            callable (player, total_days) -> action number
+
+    Yields:
+        GameRecord: Each finished game, with its gauges after every turn
+    """
+    rng = chunk_rng(seed, chunk)
+    choose = _make_policy(policy, rng)
+
+    for _ in range(n_games):
+        player = Player()
+        gauges = []
+        status = ONGOING
+        while status == ONGOING:
+            _, outcome = step(player, choose(player, total_days), total_days, rng)
+            status = outcome.status
+            gauges.append((player.hunger, player.thirst, player.energy))
+        yield GameRecord(status, outcome.causes, player.days_survived, total_days, gauges)
+
+
+def stream_chunk(seed, chunk, n_games, total_days, policy="random"):
+    """
+    Summarize one chunk of games.
+
+    Returns:
+        StreamingStats: Statistics of the chunk
+    """
+    return StreamingStats().consume(iter_games(seed, chunk, n_games, total_days, policy))
+
+
+def _stream_chunk_args(args):
+    return stream_chunk(*args)
+
+
+def _policy_name(policy):
+    if isinstance(policy, str):
+        return policy
+    return f"{type(policy).__module__}.{getattr(policy, '__qualname__', type(policy).__qualname__)}"
+
+
+def save_checkpoint(path, config, next_chunk, stats):
+    """
+    Write a checkpoint of a run atomically.
+
+    Args:
+        path (str): Checkpoint file
+        config (dict): Parameters of the run
+        next_chunk (int): First chunk not included in stats
+        stats (StreamingStats): Statistics of the chunks before next_chunk
+    """
+    from game.save.json_file import write_json_atomic
+    write_json_atomic(path, {"config": config, "next_chunk": next_chunk, "stats": stats.to_dict()}, indent=None)
+
+
+def load_checkpoint(path):
+    """
+    Read a checkpoint written by save_checkpoint.
+
+    Returns:
+        tuple: (config, next_chunk, stats)
+    """
+    from game.save.json_file import read_json
+    data = read_json(path)
+    return data["config"], data["next_chunk"], StreamingStats.from_dict(data["stats"])
+
+
+def run_streaming(n_games, total_days=10, policy="random", seed=0, workers=None,
+                  chunk_size=DEFAULT_CHUNK_SIZE, checkpoint=None, checkpoint_every=10):
+    """
+    Play n_games headless games in parallel and summarize them in constant memory.
+
+    With a checkpoint file, the statistics are saved every checkpoint_every
+    chunks, and a run started again with the same parameters resumes from
+    the last checkpoint. The result is the same as an uninterrupted run.
+
+    Args:
+        n_games (int): Total number of games
+        total_days (int): Target number of days to survive (default: 10)
+        policy: "random" (default), an action number ("1" to "4") or a
+            picklable callable (player, total_days) -> action number
+        seed (int): Seed of the run (default: 0)
+        workers (int): Number of processes; 1 runs in the current process
+            (default: one per CPU)
+        chunk_size (int): Games per chunk (default: 10,000)
+        checkpoint (str): Checkpoint file (default: None, no checkpoint)
+        checkpoint_every (int): Chunks between checkpoints (default: 10)
+
+    Returns:
+        StreamingStats: Statistics of all games
+
+    Raises:
+        ValueError: If the checkpoint belongs to a run with other parameters
+    """
+    config = {"n_games": n_games, "total_days": total_days, "policy": _policy_name(policy),
+              "seed": seed, "chunk_size": chunk_size}
+    stats = StreamingStats()
+    first_chunk = 0
+
+    if checkpoint and os.path.exists(checkpoint):
+        saved_config, first_chunk, stats = load_checkpoint(checkpoint)
+        if saved_config != config:
+            raise ValueError(f"Checkpoint {checkpoint} belongs to another run: {saved_config}")
+
+    tasks = []
+    for chunk, start in enumerate(range(0, n_games, chunk_size)):
+        if chunk >= first_chunk:
+            tasks.append((seed, chunk, min(chunk_size, n_games - start), total_days, policy))
+
+    def collect(partials):
+        for done, partial in enumerate(partials, 1):
+            stats.merge(partial)
+            if checkpoint and (done % checkpoint_every == 0 or done == len(tasks)):
+                save_checkpoint(checkpoint, config, first_chunk + done, stats)
+
+    if workers == 1 or len(tasks) <= 1:
+        collect(map(_stream_chunk_args, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            collect(executor.map(_stream_chunk_args, tasks))
+
+    return stats
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="SurviveIsland streaming game statistics")
+    parser.add_argument("--games", type=int, default=100_000)
+    parser.add_argument("--days", type=int, default=10, help="survival goal")
+    parser.add_argument("--policy", default="random", help="\"random\" or an action number")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--checkpoint", default=None, help="checkpoint file to save to and resume from")
+    args = parser.parse_args()
+
+    stats = run_streaming(args.games, args.days, args.policy, args.seed, args.workers, checkpoint=args.checkpoint)
+    for line in stats.summary():
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,386 @@
+"""
+Parameter sweep module.
+
+Evaluates many variants of the game rules for balancing: every
+configuration changes some parameters of the built-in content (see
+game.content), then plays many simulated games with it in a process pool
+and reports victory, rescue and death rates.
+
+Parameters are named by their place in the content:
+- "actions.<action>.<outcome>.<gauge>": gauge change of an action outcome,
+  e.g. "actions.fish.0.hunger" (action by name or number, outcome index)
+- "actions.<action>.success": probability of the first outcome of a
+  two-outcome action (the 50% odds of fishing and searching water),
+  rounded to a multiple of 1/20
+- "events.<event>.weight" and "events.<event>.<outcome>.<gauge>"
+- "decay.<gauge>": gauge change at the end of every day
+
+Configurations come from a grid (every combination) or a random search.
+Results are cached on disk, one file per configuration keyed by a hash
+of the full rules and simulation settings, so a repeated sweep only plays
+the configurations it has never seen. Every configuration plays the same
+random streams (common random numbers), which makes differences between
+configurations much less noisy than independent runs.
+
+Usage:
+    python -m game.sweep --param actions.fish.success=0.3,0.5,0.7 --param events.rain.weight=1,2,3
+    python -m game.sweep --random 200 --param decay.hunger=-8:-2 --param actions.fish.0.hunger=10:30
+"""
+
+import copy
+import hashlib
+import itertools
+import json
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from fractions import Fraction
+
+from game import content
+from game.bots import BOTS
+from game.montecarlo import SimulationResult
+from game.tournament import play_chunk, can_vectorize, numpy_available
+
+
+SWEEP_VERSION = 1
+SWEEP_DIR = "data/sweeps"
+SUCCESS_DENOMINATOR = 20
+DEFAULT_CHUNK_SIZE = 250_000
+
+
+def _action_key(actions, name):
+    if name in actions:
+        return name
+    for key, entry in actions.items():
+        if entry["name"] == name:
+            return key
+    raise KeyError(name)
+
+
+def _set_success(entry, probability, where):
+    distinct = []
+    for outcome in entry["outcomes"]:
+        if outcome not in distinct:
+            distinct.append(outcome)
+    if len(distinct) != 2:
+        raise ValueError(f"{where}: success needs an action with two different outcomes.")
+    if not 0 <= probability <= 1:
+        raise ValueError(f"{where}: success must be between 0 and 1.")
+
+    ratio = Fraction(round(probability * SUCCESS_DENOMINATOR), SUCCESS_DENOMINATOR)
+    success, failure = distinct
+    entry["outcomes"] = [success] * ratio.numerator + [failure] * (ratio.denominator - ratio.numerator)
+
+
+def apply_params(base, params):
+    """
+    Build the content of a configuration.
+
+    Args:
+        base (dict): Content in the data file format (see content.export_content)
+        params (dict): Parameter name -> value
+
+    Returns:
+        dict: New content, base is not modified
+
+    Raises:
+        ValueError: If a parameter name is invalid
+    """
+    data = copy.deepcopy(base)
+    successes = []
+
+    for name, value in sorted(params.items()):
+        parts = name.split(".")
+        section = parts[0]
+        try:
+            if section == "decay" and len(parts) == 2 and parts[1] in content.GAUGES:
+                data["decay"][parts[1]] = int(value)
+                continue
+            if section == "actions":
+                entry = data["actions"][_action_key(data["actions"], parts[1])]
+            elif section == "events":
+                entry = data["events"][parts[1]]
+            else:
+                raise KeyError(section)
+
+            if parts[2:] == ["success"] and section == "actions":
+                successes.append((entry, float(value), name))
+            elif parts[2:] == ["weight"] and section == "events":
+                entry["weight"] = value
+            elif len(parts) == 4 and parts[3] in content.GAUGES:
+                entry["outcomes"][int(parts[2])][parts[3]] = int(value)
+            else:
+                raise KeyError(name)
+        except (KeyError, IndexError, ValueError):
+            raise ValueError(f"Invalid parameter: {name!r}") from None
+
+    # Odds last, so that they replicate outcomes with their final deltas
+    for entry, probability, name in successes:
+        _set_success(entry, probability, name)
+
+    return data
+
+
+def grid(space):
+    """
+    Every combination of parameter values.
+
+    Args:
+        space (dict): Parameter name -> list of values
+
+    Returns:
+        list: One params dict per configuration
+    """
+    names = list(space)
+    return [dict(zip(names, values)) for values in itertools.product(*(space[name] for name in names))]
+
+
+def random_search(space, n_configs, seed=0):
+    """
+    Random parameter values.
+
+    Args:
+        space (dict): Parameter name -> list of values (one is picked) or
+            (low, high) tuple (integers if both bounds are, floats otherwise)
+        n_configs (int): Number of configurations
+        seed (int): Seed of the search (default: 0)
+
+    Returns:
+        list: One params dict per configuration
+    """
+    rng = random.Random(seed)
+    configs = []
+    for _ in range(n_configs):
+        params = {}
+        for name, values in space.items():
+            if isinstance(values, tuple):
+                low, high = values
+                if isinstance(low, int) and isinstance(high, int):
+                    params[name] = rng.randint(low, high)
+                else:
+                    params[name] = round(rng.uniform(low, high), 4)
+            else:
+                params[name] = rng.choice(values)
+        configs.append(params)
+    return configs
+
+
+def resolve_engine(policy, engine="auto"):
+    """
+    Simulation path used for a policy.
+
+    Returns:
+        str: "vectorized" or "engine"
+    """
+    if engine == "auto":
+        return "vectorized" if numpy_available() and can_vectorize(BOTS[policy]) else "engine"
+    return engine
+
+
+def config_key(rules, settings):
+    """
+    Cache key of a configuration.
+
+    Args:
+        rules (dict): Content of the configuration
+        settings (dict): Simulation settings (goal, games, policy, seed, engine)
+
+    Returns:
+        str: Hexadecimal digest
+    """
+    data = {"version": SWEEP_VERSION, "rules": rules, "settings": settings}
+    return hashlib.sha256(json.dumps(data, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()[:24]
+
+
+def evaluate(rules, total_days, n_games, policy="random", seed=0, engine="vectorized",
+             chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Play the games of one configuration.
+
+    The rules are installed for the duration of the evaluation only.
+
+    Args:
+        rules (dict): Content of the configuration (data file format)
+        total_days (int): Target number of days to survive
+        n_games (int): Number of games
+        policy (str): Bot name in game.bots.BOTS (default: "random")
+        seed (int): Seed shared by every configuration (default: 0)
+        engine (str): "vectorized" or "engine" (default: "vectorized")
+        chunk_size (int): Games per chunk (default: 250,000)
+
+    Returns:
+        dict: SimulationResult.to_dict() of the games
+    """
+    previous = content.parse_content(content.export_content())
+    content.install(content.parse_content(rules))
+    try:
+        result = SimulationResult(total_days)
+        for chunk, start in enumerate(range(0, n_games, chunk_size)):
+            # A fresh bot table per configuration: the gauge lattice depends on the rules
+            result.merge(play_chunk(policy, BOTS[policy], total_days, min(chunk_size, n_games - start),
+                                    seed, chunk, engine))
+    finally:
+        content.install(previous)
+    return result.to_dict()
+
+
+def _evaluate_args(args):
+    return evaluate(*args)
+
+
+def run_sweep(configs, total_days=10, n_games=100_000, policy="random", seed=0, workers=None,
+              engine="auto", cache_dir=SWEEP_DIR, base=None):
+    """
+    Evaluate configurations, reusing cached results.
+
+    Args:
+        configs (list): params dicts (see grid and random_search)
+        total_days (int): Target number of days to survive (default: 10)
+        n_games (int): Games per configuration (default: 100,000)
+        policy (str): Bot name in game.bots.BOTS (default: "random")
+        seed (int): Seed shared by every configuration (default: 0)
+        workers (int): Number of processes; 1 runs in the current process
+            (default: one per CPU)
+        engine (str): "auto", "vectorized" or "engine" (default: "auto")
+        cache_dir (str): Cache directory, or None to disable the cache
+            (default: data/sweeps)
+        base (dict): Content the parameters apply to (default: the current rules)
+
+    Returns:
+        list: One row per configuration, in order: dict with "params",
+            "key", "cached" and "result" (SimulationResult.to_dict())
+    """
+    from game.save.json_file import write_json_atomic
+
+    if policy not in BOTS:
+        raise ValueError(f"Unknown policy: {policy!r}")
+    base = base if base is not None else content.export_content()
+    settings = {"total_days": total_days, "games": n_games, "policy": policy, "seed": seed,
+                "engine": resolve_engine(policy, engine)}
+
+    rows, tasks, pending = [], [], []
+    for params in configs:
+        rules = apply_params(base, params)
+        key = config_key(rules, settings)
+        row = {"params": params, "key": key, "cached": False, "result": None}
+        path = os.path.join(cache_dir, key + ".json") if cache_dir else None
+        if path and os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                row["result"] = json.load(f)["result"]
+            row["cached"] = True
+        else:
+            tasks.append((rules, total_days, n_games, policy, seed, settings["engine"]))
+            pending.append(row)
+        rows.append(row)
+
+    if cache_dir and tasks:
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def collect(results):
+        for row, result in zip(pending, results):
+            row["result"] = result
+            if cache_dir:
+                # Written as soon as it is known: an interrupted sweep keeps its progress
+                write_json_atomic(os.path.join(cache_dir, row["key"] + ".json"),
+                                  {"params": row["params"], "settings": settings, "result": result},
+                                  fsync=False, indent=None)
+
+    if workers == 1 or len(tasks) <= 1:
+        collect(map(_evaluate_args, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            collect(executor.map(_evaluate_args, tasks))
+
+    return rows
+
+
+def format_table(rows):
+    """
+    Format sweep results as a text table.
+
+    Returns:
+        list: Lines of text
+    """
+    names = sorted({name for row in rows for name in row["params"]})
+    widths = [max(len(name), 8) for name in names]
+    header = " ".join(f"{name:>{width}}" for name, width in zip(names, widths))
+    lines = [f"{header} {'victory':>8} {'rescue':>8} {'death':>8} {'days':>6}",
+             "-" * (len(header) + 34)]
+    for row in rows:
+        result = row["result"]
+        values = " ".join(f"{row['params'].get(name, ''):>{width}}" for name, width in zip(names, widths))
+        lines.append(
+            f"{values} {100 * result['victory_rate']:7.2f}% {100 * result['rescue_rate']:7.2f}% "
+            f"{100 * result['death_rate']:7.2f}% {result['mean_days']:6.2f}" + (" (cached)" if row["cached"] else "")
+        )
+    return lines
+
+
+def _parse_value(text):
+    for kind in (int, float):
+        try:
+            return kind(text)
+        except ValueError:
+            pass
+    raise ValueError(f"Invalid number: {text!r}")
+
+
+def parse_space(specs):
+    """
+    Parse --param options: "name=v1,v2,..." (values) or "name=low:high" (range).
+
+    Returns:
+        dict: Parameter name -> list of values or (low, high) tuple
+    """
+    space = {}
+    for spec in specs:
+        name, _, values = spec.partition("=")
+        if ":" in values:
+            low, high = values.split(":", 1)
+            space[name.strip()] = (_parse_value(low), _parse_value(high))
+        else:
+            space[name.strip()] = [_parse_value(value) for value in values.split(",")]
+    return space
+
+
+def main():
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="SurviveIsland parameter sweep")
+    parser.add_argument("--param", action="append", required=True,
+                        help="parameter values \"name=v1,v2\" or range \"name=low:high\" (random search)")
+    parser.add_argument("--random", type=int, default=None, metavar="N", help="random search of N configurations")
+    parser.add_argument("--games", type=int, default=100_000, help="games per configuration")
+    parser.add_argument("--days", type=int, default=10, help="survival goal")
+    parser.add_argument("--policy", default="random", choices=sorted(BOTS))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--engine", choices=("auto", "vectorized", "engine"), default="auto")
+    parser.add_argument("--no-cache", action="store_true")
+    parser.add_argument("--sort", choices=("victory", "rescue", "death", "days"), default=None)
+    args = parser.parse_args()
+
+    space = parse_space(args.param)
+    if args.random is not None:
+        configs = random_search(space, args.random, args.seed)
+    elif any(isinstance(values, tuple) for values in space.values()):
+        parser.error("ranges (low:high) need --random")
+    else:
+        configs = grid(space)
+
+    start = time.perf_counter()
+    rows = run_sweep(configs, args.days, args.games, args.policy, args.seed, args.workers, args.engine,
+                     cache_dir=None if args.no_cache else SWEEP_DIR)
+    if args.sort:
+        field = {"victory": "victory_rate", "rescue": "rescue_rate", "death": "death_rate", "days": "mean_days"}
+        rows.sort(key=lambda row: -row["result"][field[args.sort]])
+
+    for line in format_table(rows):
+        print(line)
+    cached = sum(row["cached"] for row in rows)
+    print(f"\n✅ {len(rows)} configuration(s), {cached} from the cache, in {time.perf_counter() - start:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,335 @@
+"""
+Tournament module.
+
+Runs every bot over many seeded games at several survival goals, in
+parallel, and reports victory rate, rescue rate and mean days survived
+with 95% confidence intervals.
+
+Two simulation paths give the same statistics:
+- "vectorized" (requires NumPy): deterministic bots that only look at the
+  gauges are tabulated once over every reachable gauge state, then played
+  by game.population.simulate
+- "engine": games are played one by one through the headless engine by
+  game.montecarlo, for any picklable strategy
+
+With engine="auto" (default), each bot uses the vectorized path when NumPy
+is installed and the bot allows it.
+
+Usage:
+    python -m game.tournament [--games 1000000] [--goals 10 25 50] [--workers N]
+"""
+
+import argparse
+import importlib.util
+import math
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+
+from game.player import Player
+from game.bots import BOTS, RandomBot
+from game.montecarlo import SimulationResult, run_chunk
+
+
+DEFAULT_GOALS = (10, 25, 50)
+DEFAULT_CHUNK_SIZE = 250_000
+Z_95 = 1.959963984540054
+
+_tables = {}
+
+
+def wilson_interval(successes, trials, z=Z_95):
+    """
+    Wilson score interval of a proportion.
+
+    Args:
+        successes (int): Number of successes
+        trials (int): Number of trials
+        z (float): Normal quantile (default: 95% interval)
+
+    Returns:
+        tuple: (low, high), (0.0, 1.0) when there is no trial
+    """
+    if trials == 0:
+        return 0.0, 1.0
+    p = successes / trials
+    denominator = 1 + z * z / trials
+    center = (p + z * z / (2 * trials)) / denominator
+    margin = z * math.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials)) / denominator
+    return max(0.0, center - margin), min(1.0, center + margin)
+
+
+def mean_interval(histogram, z=Z_95):
+    """
+    Mean of a histogram and its normal confidence interval.
+
+    Args:
+        histogram (list): histogram[value] = number of observations
+        z (float): Normal quantile (default: 95% interval)
+
+    Returns:
+        tuple: (mean, low, high)
+    """
+    n = sum(histogram)
+    if n == 0:
+        return 0.0, 0.0, 0.0
+    mean = sum(value * count for value, count in enumerate(histogram)) / n
+    if n == 1:
+        return mean, mean, mean
+    variance = sum(count * (value - mean) ** 2 for value, count in enumerate(histogram)) / (n - 1)
+    margin = z * math.sqrt(variance / n)
+    return mean, mean - margin, mean + margin
+
+
+class Standing:
+    """
+    Result of one bot at one survival goal.
+    """
+
+    def __init__(self, bot, result):
+        """
+        Args:
+            bot (str): Bot name
+            result (SimulationResult): Statistics of its games
+        """
+        self.bot = bot
+        self.result = result
+
+    @property
+    def total_days(self):
+        return self.result.total_days
+
+    @property
+    def games(self):
+        return self.result.games
+
+    @property
+    def victory_interval(self):
+        """tuple: 95% Wilson interval of the victory rate."""
+        return wilson_interval(self.result.outcomes["victory"], self.result.games)
+
+    @property
+    def rescue_interval(self):
+        """tuple: 95% Wilson interval of the rescue rate."""
+        return wilson_interval(self.result.outcomes["rescued"], self.result.games)
+
+    @property
+    def mean_days_interval(self):
+        """tuple: (mean, low, high) days survived."""
+        return mean_interval(self.result.days_histogram)
+
+    def to_dict(self):
+        mean, low, high = self.mean_days_interval
+        return {
+            "bot": self.bot,
+            "total_days": self.total_days,
+            "games": self.games,
+            "victory_rate": self.result.victory_rate,
+            "victory_interval": list(self.victory_interval),
+            "rescue_rate": self.result.rescue_rate,
+            "rescue_interval": list(self.rescue_interval),
+            "death_rate": self.result.death_rate,
+            "mean_days": mean,
+            "mean_days_interval": [low, high],
+        }
+
+
+def numpy_available():
+    """bool: True if the vectorized path can be used."""
+    return importlib.util.find_spec("numpy") is not None
+
+
+def can_vectorize(bot):
+    """
+    Check whether a bot can be played by the vectorized simulator.
+
+    Returns:
+        bool: True for RandomBot and for deterministic bots that ignore the days
+    """
+    if isinstance(bot, RandomBot):
+        return True
+    return getattr(bot, "deterministic", False) and not getattr(bot, "uses_days", True)
+
+
+def compile_bot(bot, lattice=None):
+    """
+    Tabulate a gauge-only deterministic bot over every lattice state.
+
+    Requires NumPy.
+
+    Args:
+        bot (callable): Strategy with deterministic=True and uses_days=False
+        lattice (Lattice): Gauge lattice (default: computed from the rules)
+
+    Returns:
+        tuple: (table, steps) where table[h // steps[0], t // steps[1], e // steps[2]]
+            is the action code of the state (hunger h, thirst t, energy e)
+    """
+    import numpy as np
+    from game.markov import Lattice
+
+    lattice = lattice or Lattice()
+    player = Player()
+    table = np.zeros(lattice.shape, dtype=np.int64)
+    hunger_values, thirst_values, energy_values = (lattice.values(axis).tolist() for axis in range(3))
+
+    for i, hunger in enumerate(hunger_values):
+        player.hunger = hunger
+        for j, thirst in enumerate(thirst_values):
+            player.thirst = thirst
+            row = table[i, j]
+            for k, energy in enumerate(energy_values):
+                player.energy = energy
+                row[k] = int(bot(player, 0))
+
+    return table, tuple(lattice.steps)
+
+
+def _bot_table(name, bot):
+    # Tables of the built-in bots are kept for the next chunks run by this process
+    if bot is not None:
+        return compile_bot(bot)
+    if name not in _tables:
+        _tables[name] = compile_bot(BOTS[name])
+    return _tables[name]
+
+
+def _seed_words(seed, name, total_days, chunk):
+    return [seed, zlib.crc32(name.encode("utf-8")), total_days, chunk]
+
+
+def play_chunk(name, bot, total_days, n_games, seed, chunk, engine):
+    """
+    Play one chunk of games of a bot.
+
+    Args:
+        name (str): Bot name (part of the random stream identity)
+        bot (callable): Strategy, or None to look the name up in BOTS
+        total_days (int): Target number of days to survive
+        n_games (int): Number of games
+        seed (int): Seed of the tournament
+        chunk (int): Index of the chunk
+        engine (str): "vectorized" or "engine"
+
+    Returns:
+        SimulationResult: Statistics of the chunk
+    """
+    strategy = BOTS[name] if bot is None else bot
+
+    if engine == "engine":
+        policy = "random" if isinstance(strategy, RandomBot) else strategy
+        return run_chunk(f"{seed}:{name}", chunk, n_games, total_days, policy)
+
+    from game.population import simulate
+
+    if isinstance(strategy, RandomBot):
+        policy = "random"
+    else:
+        table, (step_h, step_t, step_e) = _bot_table(name, bot)
+        policy = lambda hunger, thirst, energy, days: table[hunger // step_h, thirst // step_t, energy // step_e]
+
+    population = simulate(n_games, total_days, policy, seed=_seed_words(seed, name, total_days, chunk))
+    return SimulationResult.from_population(population)
+
+
+def _play_chunk_args(args):
+    return (args[0], args[2]), play_chunk(*args)
+
+
+def run_tournament(bots=None, goals=DEFAULT_GOALS, n_games=1_000_000, seed=0, workers=None,
+                   engine="auto", chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Play every bot at every survival goal.
+
+    Args:
+        bots: Bot names (looked up in BOTS) or a dict name -> strategy
+            (default: every bot of BOTS). Custom strategies must be picklable.
+        goals (iterable): Survival goals (default: 10, 25 and 50 days)
+        n_games (int): Games per bot and goal (default: 1,000,000)
+        seed (int): Seed of the tournament (default: 0)
+        workers (int): Number of processes; 1 runs in the current process
+            (default: one per CPU)
+        engine (str): "auto", "vectorized" or "engine" (default: "auto")
+        chunk_size (int): Games per task. Part of the experiment definition:
+            changing it changes the random streams (default: 250,000)
+
+    Returns:
+        list: Standing objects, by goal then by decreasing victory rate
+    """
+    if bots is None:
+        bots = {name: None for name in BOTS}
+    elif not isinstance(bots, dict):
+        bots = {name: None for name in bots}
+
+    vectorized = engine != "engine" and numpy_available()
+    if engine == "vectorized" and not vectorized:
+        raise ValueError("The vectorized engine requires NumPy.")
+
+    tasks = []
+    for name, bot in bots.items():
+        strategy = BOTS[name] if bot is None else bot
+        bot_engine = "vectorized" if vectorized and can_vectorize(strategy) else "engine"
+        if engine == "vectorized" and bot_engine != "vectorized":
+            raise ValueError(f"Bot {name!r} cannot be vectorized.")
+        for total_days in goals:
+            for chunk, start in enumerate(range(0, n_games, chunk_size)):
+                tasks.append((name, bot, total_days, min(chunk_size, n_games - start), seed, chunk, bot_engine))
+
+    results = {(name, total_days): SimulationResult(total_days) for name in bots for total_days in goals}
+
+    if workers == 1 or len(tasks) <= 1:
+        partials = map(_play_chunk_args, tasks)
+        for key, partial in partials:
+            results[key].merge(partial)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for key, partial in executor.map(_play_chunk_args, tasks):
+                results[key].merge(partial)
+
+    standings = [Standing(name, result) for (name, _), result in results.items()]
+    standings.sort(key=lambda standing: (standing.total_days, -standing.result.victory_rate, standing.bot))
+    return standings
+
+
+def format_standings(standings):
+    """
+    Format standings as a text table.
+
+    Returns:
+        list: Lines of text
+    """
+    lines = []
+    goal = None
+    for standing in standings:
+        if standing.total_days != goal:
+            goal = standing.total_days
+            lines += ["", f"🎯 Goal: {goal} days", "=" * 96,
+                      f"{'bot':26} {'victory':>22} {'rescue':>22} {'mean days':>22}", "-" * 96]
+        victory_low, victory_high = standing.victory_interval
+        rescue_low, rescue_high = standing.rescue_interval
+        mean, low, high = standing.mean_days_interval
+        lines.append(
+            f"{standing.bot:26} "
+            f"{100 * standing.result.victory_rate:6.2f}% [{100 * victory_low:5.2f}, {100 * victory_high:5.2f}] "
+            f"{100 * standing.result.rescue_rate:6.2f}% [{100 * rescue_low:5.2f}, {100 * rescue_high:5.2f}] "
+            f"{mean:6.2f} [{low:6.2f}, {high:6.2f}]"
+        )
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SurviveIsland bot tournament")
+    parser.add_argument("--games", type=int, default=1_000_000, help="games per bot and goal")
+    parser.add_argument("--goals", type=int, nargs="+", default=list(DEFAULT_GOALS))
+    parser.add_argument("--bots", nargs="+", default=None, choices=sorted(BOTS))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--engine", choices=("auto", "vectorized", "engine"), default="auto")
+    args = parser.parse_args()
+
+    standings = run_tournament(args.bots, args.goals, args.games, args.seed, args.workers, args.engine)
+    for line in format_standings(standings):
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
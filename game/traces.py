@@ -0,0 +1,524 @@
+"""
+Game traces module.
+
+Stores every turn of many games in a columnar trace store: a directory with
+one binary file per column (fixed-width little-endian integers) and a small
+meta.json describing the columns, the event names and the row count.
+
+One row per turn:
+    game (uint32), day (uint16), action (uint8, 1-4), event (uint8, index in
+    meta["events"]), hunger/thirst/energy before the turn and after it
+    (uint8 each), status after the turn (uint8, index in STATUSES)
+That is 17 bytes per turn.
+
+TraceWriter buffers rows in stdlib arrays and appends them to the column
+files in chunks. TraceReader maps the column files in memory (numpy.memmap,
+or mmap without NumPy) and filters and aggregates them chunk by chunk, so
+tables of billions of rows are never loaded in RAM. For example, the death
+probability by action taken when thirst is under 20:
+
+    reader = TraceReader("data/traces")
+    reader.rates("action", where=[("thirst_before", "<", 20)], outcome=("status", "dead"))
+
+Usage:
+    python -m game.traces record DIR [--games N] [--days D]
+    python -m game.traces query DIR --by action [--where "thirst_before<20"] [--outcome status=dead]
+"""
+
+import os
+import sys
+import mmap
+import operator
+from array import array
+
+from game.player import Player
+from game.engine import step, ONGOING, VICTORY, RESCUED, DEAD
+from game.montecarlo import DEFAULT_CHUNK_SIZE, chunk_rng, _make_policy
+
+
+FORMAT_VERSION = 1
+META_FILE = "meta.json"
+TRACE_DIR = "data/traces"
+DEFAULT_CHUNK_ROWS = 1 << 16
+DEFAULT_SCAN_ROWS = 1 << 22
+
+STATUSES = (ONGOING, VICTORY, RESCUED, DEAD)
+
+# (column, array typecode, size in bytes)
+COLUMNS = (
+    ("game", "I", 4),
+    ("day", "H", 2),
+    ("action", "B", 1),
+    ("event", "B", 1),
+    ("hunger_before", "B", 1),
+    ("thirst_before", "B", 1),
+    ("energy_before", "B", 1),
+    ("hunger_after", "B", 1),
+    ("thirst_after", "B", 1),
+    ("energy_after", "B", 1),
+    ("status", "B", 1),
+)
+COLUMN_NAMES = tuple(name for name, _, _ in COLUMNS)
+
+OPERATORS = {
+    "<": operator.lt,
+    "<=": operator.le,
+    "==": operator.eq,
+    "!=": operator.ne,
+    ">=": operator.ge,
+    ">": operator.gt,
+}
+
+
+def _column_path(directory, name):
+    return os.path.join(directory, name + ".bin")
+
+
+def _read_meta(directory):
+    import json
+    with open(os.path.join(directory, META_FILE), "r", encoding="utf-8") as f:
+        meta = json.load(f)
+    if meta.get("version") != FORMAT_VERSION:
+        raise ValueError(f"Unsupported trace format version: {meta.get('version')!r}")
+    return meta
+
+
+class TraceWriter:
+    """
+    Appends turns to a trace store.
+
+    Use it as a context manager, or call close() to write the last rows.
+    Opening an existing store appends to it.
+    """
+
+    def __init__(self, directory=TRACE_DIR, chunk_rows=DEFAULT_CHUNK_ROWS):
+        """
+        Open a trace store for writing.
+
+        Args:
+            directory (str): Store directory, created if needed (default: data/traces)
+            chunk_rows (int): Rows buffered before they are written (default: 65,536)
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.chunk_rows = chunk_rows
+
+        if os.path.exists(os.path.join(directory, META_FILE)):
+            meta = _read_meta(directory)
+            self.rows = meta["rows"]
+            self.games = meta["games"]
+            self.events = list(meta["events"])
+        else:
+            self.rows = 0
+            self.games = 0
+            self.events = []
+        self.event_ids = {name: index for index, name in enumerate(self.events)}
+        self.status_ids = {status: index for index, status in enumerate(STATUSES)}
+
+        self.buffers = [array(typecode) for _, typecode, _ in COLUMNS]
+        self.files = []
+        for name, _, size in COLUMNS:
+            f = open(_column_path(directory, name), "ab")
+            # Drop a partial chunk left by a crash after the last meta update
+            f.truncate(self.rows * size)
+            self.files.append(f)
+
+    def new_game(self):
+        """
+        Reserve the id of the next game.
+
+        Returns:
+            int: Game id
+        """
+        game = self.games
+        self.games += 1
+        return game
+
+    def event_id(self, event):
+        """Index of an event name in the store, added on first use."""
+        index = self.event_ids.get(event)
+        if index is None:
+            if len(self.events) > 255:
+                raise ValueError("A trace store holds at most 256 different events.")
+            index = self.event_ids[event] = len(self.events)
+            self.events.append(event)
+        return index
+
+    def record(self, game, day, action, event, before, after, status):
+        """
+        Append one turn.
+
+        Args:
+            game (int): Game id (see new_game)
+            day (int): Day played (1 for the first turn)
+            action (str): Action number ("1" to "4")
+            event (str): Key of the event
+            before (tuple): (hunger, thirst, energy) before the turn
+            after (tuple): (hunger, thirst, energy) after the turn
+            status (str): Game status after the turn
+        """
+        game_column, day_column, action_column, event_column, hb, tb, eb, ha, ta, ea, status_column = self.buffers
+        game_column.append(game)
+        day_column.append(day)
+        action_column.append(int(action))
+        event_column.append(self.event_ids[event] if event in self.event_ids else self.event_id(event))
+        hb.append(before[0])
+        tb.append(before[1])
+        eb.append(before[2])
+        ha.append(after[0])
+        ta.append(after[1])
+        ea.append(after[2])
+        status_column.append(self.status_ids[status])
+        if len(game_column) >= self.chunk_rows:
+            self.flush()
+
+    def flush(self):
+        """Write the buffered rows and update meta.json."""
+        buffered = len(self.buffers[0])
+        if buffered:
+            for buffer, f in zip(self.buffers, self.files):
+                if sys.byteorder != "little":
+                    buffer.byteswap()
+                f.write(buffer.tobytes())
+                f.flush()
+                del buffer[:]
+            self.rows += buffered
+        self._write_meta()
+
+    def _write_meta(self):
+        from game.save.json_file import write_json_atomic
+        meta = {
+            "version": FORMAT_VERSION,
+            "rows": self.rows,
+            "games": self.games,
+            "columns": [[name, typecode] for name, typecode, _ in COLUMNS],
+            "events": self.events,
+            "statuses": list(STATUSES),
+        }
+        write_json_atomic(os.path.join(self.directory, META_FILE), meta, fsync=False)
+
+    def close(self):
+        """Write the remaining rows and close the column files."""
+        self.flush()
+        for f in self.files:
+            f.close()
+        self.files = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def record_chunk(writer, seed, chunk, n_games, total_days, policy="random"):
+    """
+    Play one chunk of games and append every turn to a trace store.
+
+    The games are the same as those of game.montecarlo.run_chunk with the
+    same arguments.
+
+    Args:
+        writer (TraceWriter): Open trace store
+        seed (int): Seed of the whole run
+        chunk (int): Index of the chunk
+        n_games (int): Number of games in this chunk
+        total_days (int): Target number of days to survive
+        policy: "random", an action number ("1" to "4") or a callable
+            (player, total_days) -> action number
+
+    Returns:
+        int: Number of turns recorded
+    """
+    rng = chunk_rng(seed, chunk)
+    choose = _make_policy(policy, rng)
+    event_ids = writer.event_ids
+    status_ids = writer.status_ids
+    action_ids = {str(action): action for action in range(1, 5)}
+    # Bound appends of every column, in COLUMNS order
+    (game_column, day_column, action_column, event_column, hunger_before, thirst_before, energy_before,
+     hunger_after, thirst_after, energy_after, status_column) = [buffer.append for buffer in writer.buffers]
+    turns = 0
+
+    for _ in range(n_games):
+        game = writer.new_game()
+        player = Player()
+        status = ONGOING
+        while status == ONGOING:
+            hunger_before(player.hunger)
+            thirst_before(player.thirst)
+            energy_before(player.energy)
+            action = choose(player, total_days)
+            _, outcome = step(player, action, total_days, rng)
+            status = outcome.status
+            event = outcome.event
+            game_column(game)
+            day_column(player.days_survived + 1 if status == RESCUED else player.days_survived)
+            action_column(action_ids[action])
+            event_column(event_ids[event] if event in event_ids else writer.event_id(event))
+            hunger_after(player.hunger)
+            thirst_after(player.thirst)
+            energy_after(player.energy)
+            status_column(status_ids[status])
+            turns += 1
+
+        if len(writer.buffers[0]) >= writer.chunk_rows:
+            writer.flush()
+
+    return turns
+
+
+def record_games(n_games, total_days=10, policy="random", seed=0, directory=TRACE_DIR,
+                 chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Play n_games games and append every turn to a trace store.
+
+    Args:
+        n_games (int): Number of games
+        total_days (int): Target number of days to survive (default: 10)
+        policy: "random" (default), an action number or a callable
+        seed (int): Seed of the run (default: 0)
+        directory (str): Store directory (default: data/traces)
+        chunk_size (int): Games per random stream, as in game.montecarlo (default: 10,000)
+
+    Returns:
+        int: Number of turns recorded
+    """
+    turns = 0
+    with TraceWriter(directory) as writer:
+        for chunk, start in enumerate(range(0, n_games, chunk_size)):
+            turns += record_chunk(writer, seed, chunk, min(chunk_size, n_games - start), total_days, policy)
+    return turns
+
+
+class TraceReader:
+    """
+    Read-only view of a trace store, mapped in memory.
+
+    Columns are numpy.memmap arrays when NumPy is installed, memoryviews
+    over mmap otherwise. Queries scan them in chunks of scan_rows rows.
+    """
+
+    def __init__(self, directory=TRACE_DIR, scan_rows=DEFAULT_SCAN_ROWS, use_numpy=None):
+        """
+        Open a trace store.
+
+        Args:
+            directory (str): Store directory (default: data/traces)
+            scan_rows (int): Rows per scanned chunk (default: 4,194,304)
+            use_numpy (bool): Force or disable NumPy (default: use it if installed)
+
+        Raises:
+            OSError: If the store does not exist
+            ValueError: If the store has an unsupported format
+        """
+        meta = _read_meta(directory)
+        self.directory = directory
+        self.rows = meta["rows"]
+        self.games = meta["games"]
+        self.events = meta["events"]
+        self.scan_rows = scan_rows
+
+        if use_numpy is None:
+            import importlib.util
+            use_numpy = importlib.util.find_spec("numpy") is not None
+        self.numpy = use_numpy
+
+        self._maps = []
+        self.columns = {}
+        for name, typecode, size in COLUMNS:
+            self.columns[name] = self._open_column(name, typecode, size)
+
+    def _open_column(self, name, typecode, size):
+        path = _column_path(self.directory, name)
+        if self.numpy:
+            import numpy as np
+            if not self.rows:
+                return np.zeros(0, dtype=f"<u{size}")
+            return np.memmap(path, dtype=f"<u{size}", mode="r", shape=(self.rows,))
+        if sys.byteorder != "little" and size > 1:
+            raise ValueError("Reading traces without NumPy requires a little-endian machine.")
+        if not self.rows:
+            return memoryview(b"").cast(typecode)
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), self.rows * size, access=mmap.ACCESS_READ)
+        self._maps.append(mapped)
+        return memoryview(mapped).cast(typecode)
+
+    def __len__(self):
+        return self.rows
+
+    def close(self):
+        """Release the memory maps."""
+        self.columns = {}
+        for mapped in self._maps:
+            try:
+                mapped.close()
+            except BufferError:
+                # Still referenced by a chunk held by the caller
+                pass
+        self._maps = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def encode(self, column, value):
+        """
+        Convert a readable value to the integer stored in a column.
+
+        Actions are given as "1" to "4", events by name, statuses by name.
+        """
+        if column == "event" and isinstance(value, str):
+            return self.events.index(value) if value in self.events else -1
+        if column == "status" and isinstance(value, str):
+            return STATUSES.index(value)
+        return int(value)
+
+    def decode(self, column, value):
+        """Convert a stored integer to a readable value (inverse of encode)."""
+        if column == "event":
+            return self.events[value]
+        if column == "status":
+            return STATUSES[value]
+        if column == "action":
+            return str(value)
+        return value
+
+    def scan(self, columns=COLUMN_NAMES):
+        """
+        Iterate over the store in chunks.
+
+        Args:
+            columns (iterable): Column names to read (default: all)
+
+        Yields:
+            dict: column -> array of up to scan_rows consecutive rows
+        """
+        for start in range(0, self.rows, self.scan_rows):
+            stop = min(start + self.scan_rows, self.rows)
+            yield {name: self.columns[name][start:stop] for name in columns}
+
+    def counts(self, group_by, where=(), outcome=None):
+        """
+        Count rows per value of a column, and optionally rows matching an outcome.
+
+        Args:
+            group_by (str): Column to group by
+            where (iterable): (column, operator, value) conditions, all required;
+                operators: <, <=, ==, !=, >=, >
+            outcome (tuple): (column, value) to count among the selected rows
+
+        Returns:
+            dict: value -> (rows, outcome_rows), values decoded (see decode)
+        """
+        conditions = [(column, OPERATORS[op], self.encode(column, value)) for column, op, value in where]
+        if outcome is not None:
+            outcome = (outcome[0], self.encode(*outcome))
+        needed = {group_by} | {column for column, _, _ in conditions}
+        if outcome is not None:
+            needed.add(outcome[0])
+
+        if self.numpy:
+            totals, hits = self._counts_numpy(group_by, conditions, outcome, needed)
+        else:
+            totals, hits = self._counts_python(group_by, conditions, outcome, needed)
+        return {self.decode(group_by, key): (count, hits.get(key, 0)) for key, count in sorted(totals.items())}
+
+    def _counts_numpy(self, group_by, conditions, outcome, needed):
+        import numpy as np
+
+        totals, hits = {}, {}
+
+        def add(counts, keys):
+            values, numbers = np.unique(keys, return_counts=True)
+            for key, number in zip(values.tolist(), numbers.tolist()):
+                counts[key] = counts.get(key, 0) + number
+
+        for chunk in self.scan(needed):
+            keys = chunk[group_by]
+            if conditions:
+                mask = np.ones(len(keys), dtype=bool)
+                for column, compare, value in conditions:
+                    mask &= compare(chunk[column], value)
+                keys = keys[mask]
+            add(totals, keys)
+            if outcome is not None:
+                matched = chunk[outcome[0]] == outcome[1]
+                add(hits, keys[matched[mask]] if conditions else chunk[group_by][matched])
+        return totals, hits
+
+    def _counts_python(self, group_by, conditions, outcome, needed):
+        totals, hits = {}, {}
+        for chunk in self.scan(needed):
+            keys = chunk[group_by]
+            for row in range(len(keys)):
+                if all(compare(chunk[column][row], value) for column, compare, value in conditions):
+                    key = keys[row]
+                    totals[key] = totals.get(key, 0) + 1
+                    if outcome is not None and chunk[outcome[0]][row] == outcome[1]:
+                        hits[key] = hits.get(key, 0) + 1
+        return totals, hits
+
+    def rates(self, group_by, where=(), outcome=("status", DEAD)):
+        """
+        Probability of an outcome per value of a column.
+
+        Args:
+            group_by (str): Column to group by
+            where (iterable): (column, operator, value) conditions
+            outcome (tuple): (column, value) (default: death on that turn)
+
+        Returns:
+            dict: value -> (rows, probability)
+        """
+        return {key: (rows, matches / rows) for key, (rows, matches) in self.counts(group_by, where, outcome).items()}
+
+
+def _parse_condition(text):
+    for op in ("<=", ">=", "==", "!=", "<", ">"):
+        if op in text:
+            column, value = text.split(op, 1)
+            return column.strip(), op, value.strip()
+    raise ValueError(f"Invalid condition: {text!r}")
+
+
+def main():
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="SurviveIsland game traces")
+    commands = parser.add_subparsers(dest="command", required=True)
+    record = commands.add_parser("record", help="play games and append their turns to a store")
+    record.add_argument("directory")
+    record.add_argument("--games", type=int, default=100_000)
+    record.add_argument("--days", type=int, default=10, help="survival goal")
+    record.add_argument("--policy", default="random", help="\"random\" or an action number")
+    record.add_argument("--seed", type=int, default=0)
+    query = commands.add_parser("query", help="outcome rate per value of a column")
+    query.add_argument("directory")
+    query.add_argument("--by", required=True, choices=COLUMN_NAMES)
+    query.add_argument("--where", action="append", default=[], help="condition such as \"thirst_before<20\"")
+    query.add_argument("--outcome", default="status=dead", help="column=value counted (default: status=dead)")
+    args = parser.parse_args()
+
+    if args.command == "record":
+        start = time.perf_counter()
+        turns = record_games(args.games, args.days, args.policy, args.seed, args.directory)
+        print(f"✅ {turns:,} turns of {args.games:,} games recorded in {time.perf_counter() - start:.1f} s")
+        return 0
+
+    column, value = args.outcome.split("=", 1)
+    with TraceReader(args.directory) as reader:
+        rates = reader.rates(args.by, [_parse_condition(text) for text in args.where], (column, value))
+        print(f"📊 {len(reader):,} turns, P({args.outcome}) by {args.by}"
+              + (f" where {' and '.join(args.where)}" if args.where else ""))
+        for key, (rows, probability) in rates.items():
+            print(f"   {key!s:>16}  {rows:>14,} turns  {100 * probability:6.2f}%")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,51 @@
+"""
+Tests of the exact forward propagation: totals, policy forms and agreement with the population simulation.
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from game.forward import propagate
+from game.player import Player
+from game.population import simulate
+
+
+def mixed_policy(hunger, thirst, energy, days):
+    return np.where(energy < 30, 2, np.where(thirst < hunger, 3, 1))
+
+
+def scalar_policy(player, total_days):
+    return "2" if player.energy < 30 else "3" if player.thirst < player.hunger else "1"
+
+
+def test_totals_sum_to_one():
+    totals = propagate("3", total_days=20).totals()
+    assert totals["victory"] + totals["rescued"] + totals["dead"] == pytest.approx(1.0)
+    causes = {key: value for key, value in totals.items() if key not in ("victory", "rescued", "dead")}
+    assert sum(causes.values()) == pytest.approx(totals["dead"])
+
+
+def test_goal_already_reached():
+    assert propagate("2", total_days=0).totals() == {"victory": 1.0, "rescued": 0.0, "dead": 0.0}
+
+
+def test_policy_forms_agree():
+    expected = propagate(mixed_policy, total_days=15, vectorized=True).totals()
+    assert propagate(scalar_policy, total_days=15).totals() == pytest.approx(expected)
+    assert propagate("3", total_days=15).totals() == pytest.approx(propagate(lambda player, total_days: "3", total_days=15).totals())
+
+
+@pytest.mark.parametrize("policy, vectorized", [("3", False), (mixed_policy, True)])
+def test_matches_population_simulation(policy, vectorized):
+    n_players = 200_000
+    totals = propagate(policy, total_days=15, vectorized=vectorized).totals()
+    counts = simulate(n_players, total_days=15, policy=policy, seed=1).outcome_counts()
+    for status, count in counts.items():
+        assert count / n_players == pytest.approx(totals[status], abs=0.005)
+
+
+@pytest.mark.parametrize("player", [Player(days_survived=5), Player(hunger=0)])
+def test_rejects_finished_games(player):
+    with pytest.raises(ValueError):
+        propagate("1", total_days=3, player=player)
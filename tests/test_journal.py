@@ -0,0 +1,159 @@
+"""
+Tests of the journaled save backend: torn writes, bad CRCs and compaction.
+"""
+
+import builtins
+import os
+
+import pytest
+
+from game.player import Player
+from game.save.journal import JournalBackend, RECORD_SIZE, last_record, pack_record
+
+
+def make_player(day):
+    gauge = day % 50
+    return Player(name="Robinson", hunger=100 - gauge, thirst=90 - gauge, energy=80 - gauge, days_survived=day)
+
+
+def play(backend, days, total_days=50):
+    for day in range(1, days + 1):
+        backend.save(make_player(day), day, total_days)
+
+
+def state(player):
+    return player.name, player.hunger, player.thirst, player.energy, player.days_survived
+
+
+def test_round_trip_through_journal(tmp_path):
+    backend = JournalBackend(str(tmp_path / "save.json"), compact_every=100)
+    play(backend, 10)
+    backend.close()
+
+    # One snapshot, then one record per save
+    assert os.path.getsize(backend.journal_path) == 9 * RECORD_SIZE
+    player, current_day, total_days = JournalBackend(backend.path).load()
+    assert state(player) == state(make_player(10))
+    assert (current_day, total_days) == (10, 50)
+
+
+def test_compaction_round_trip(tmp_path):
+    backend = JournalBackend(str(tmp_path / "save.json"), compact_every=100)
+    play(backend, 250)
+    backend.close()
+
+    # Snapshots at saves 1, 102 and 203, then 47 journal records
+    assert os.path.getsize(backend.journal_path) == 47 * RECORD_SIZE
+    player, current_day, _ = JournalBackend(backend.path).load()
+    assert state(player) == state(make_player(250))
+    assert current_day == 250
+
+
+def test_reload_continues_the_journal(tmp_path):
+    backend = JournalBackend(str(tmp_path / "save.json"), compact_every=100)
+    play(backend, 5)
+    backend.close()
+
+    reloaded = JournalBackend(backend.path)
+    reloaded.load()
+    reloaded.save(make_player(6), 6, 50)
+    reloaded.close()
+
+    assert os.path.getsize(backend.journal_path) == 5 * RECORD_SIZE
+    player, current_day, _ = JournalBackend(backend.path).load()
+    assert state(player) == state(make_player(6))
+    assert current_day == 6
+
+
+def test_torn_tail_is_ignored_and_truncated(tmp_path):
+    backend = JournalBackend(str(tmp_path / "save.json"))
+    play(backend, 5)
+    backend.close()
+
+    # A crash in the middle of the sixth record
+    with open(backend.journal_path, "ab") as f:
+        f.write(pack_record(99, make_player(6), 6, 50)[:RECORD_SIZE // 2])
+
+    reloaded = JournalBackend(backend.path)
+    player, current_day, _ = reloaded.load()
+    assert state(player) == state(make_player(5))
+    assert current_day == 5
+    reloaded.close()
+    assert os.path.getsize(backend.journal_path) == 4 * RECORD_SIZE
+
+
+def test_bad_crc_falls_back_to_previous_record(tmp_path):
+    backend = JournalBackend(str(tmp_path / "save.json"))
+    play(backend, 5)
+    backend.close()
+
+    # Corrupt the body of the last record
+    with open(backend.journal_path, "r+b") as f:
+        f.seek(3 * RECORD_SIZE + 5)
+        f.write(b"\xff")
+
+    reloaded = JournalBackend(backend.path)
+    player, current_day, _ = reloaded.load()
+    assert state(player) == state(make_player(4))
+    assert current_day == 4
+    reloaded.close()
+    assert os.path.getsize(backend.journal_path) == 3 * RECORD_SIZE
+
+
+def test_every_record_corrupt_falls_back_to_snapshot(tmp_path):
+    backend = JournalBackend(str(tmp_path / "save.json"))
+    play(backend, 3)
+    backend.close()
+
+    with open(backend.journal_path, "r+b") as f:
+        raw = bytearray(f.read())
+        for start in range(0, len(raw), RECORD_SIZE):
+            raw[start + RECORD_SIZE - 1] ^= 0xFF
+        f.seek(0)
+        f.write(raw)
+
+    player, current_day, _ = JournalBackend(backend.path).load()
+    assert state(player) == state(make_player(1))
+    assert current_day == 1
+
+
+def test_new_game_snapshot_outranks_old_journal(tmp_path, monkeypatch):
+    old = JournalBackend(str(tmp_path / "save.json"))
+    play(old, 5)
+    old.close()
+
+    # A new process starts a new game without loading the old one, and
+    # crashes after the snapshot, before the journal is truncated
+    def crash_on_truncate(path, mode="r", *args, **kwargs):
+        if mode == "wb":
+            raise KeyboardInterrupt
+        return builtins.open(path, mode, *args, **kwargs)
+
+    new = JournalBackend(old.path)
+    monkeypatch.setattr("game.save.journal.open", crash_on_truncate, raising=False)
+    with pytest.raises(KeyboardInterrupt):
+        new.save(Player(name="Friday"), 1, 30)
+    monkeypatch.undo()
+
+    player, current_day, total_days = JournalBackend(old.path).load()
+    assert state(player) == state(Player(name="Friday"))
+    assert (current_day, total_days) == (1, 30)
+
+
+def test_stale_records_before_snapshot_are_skipped():
+    raw = pack_record(3, make_player(3), 3, 50) + pack_record(4, make_player(4), 4, 50)
+
+    assert last_record(raw, min_seq=4) == (None, 0)
+    fields, length = last_record(raw, min_seq=3)
+    assert fields[0] == 4
+    assert length == 2 * RECORD_SIZE
+
+
+def test_delete_removes_snapshot_and_journal(tmp_path):
+    backend = JournalBackend(str(tmp_path / "save.json"))
+    play(backend, 3)
+
+    assert backend.delete()
+    assert not os.path.exists(backend.path)
+    assert not os.path.exists(backend.journal_path)
+    assert not backend.delete()
@@ -0,0 +1,99 @@
+"""
+Tests of the binary replays: encoding round trips and divergence detection.
+"""
+
+import random
+
+import pytest
+
+from game.engine import ONGOING, VICTORY, step
+from game.player import Player
+from game.replay import (MAGIC, Replay, ReplayRecorder, read_varint, run_replay, verify_file,
+                         verify_replay, write_varint)
+
+
+def record_game(seed=4, total_days=10, checksums=True):
+    """Play a seeded game cycling through the actions (seed 4 lasts ten turns and is won)."""
+    rng = random.Random(seed)
+    player = Player(name="Robinson")
+    recorder = ReplayRecorder(player, total_days, seed, checksums)
+    status = ONGOING
+    turn = 0
+    while status == ONGOING:
+        action = "1234"[turn % 4]
+        _, outcome = step(player, action, total_days, rng)
+        recorder.record(action, player)
+        status = outcome.status
+        turn += 1
+    return recorder.finish(status)
+
+
+def fields(replay):
+    return (replay.seed, replay.total_days, replay.start, replay.name,
+            replay.actions, replay.checksums, replay.status)
+
+
+@pytest.mark.parametrize("value", [0, 1, 127, 128, 300, 2 ** 32, 2 ** 63 - 1])
+def test_varint_round_trip(value):
+    buffer = bytearray(b"x")
+    write_varint(buffer, value)
+    assert read_varint(bytes(buffer), 1) == (value, len(buffer))
+
+
+def test_negative_varint_is_rejected():
+    with pytest.raises(ValueError):
+        write_varint(bytearray(), -1)
+
+
+@pytest.mark.parametrize("checksums", [True, False])
+def test_bytes_round_trip(checksums):
+    replay = record_game(checksums=checksums)
+    assert replay.status == VICTORY and len(replay.actions) == 10
+    decoded = Replay.from_bytes(replay.to_bytes())
+    assert fields(decoded) == fields(replay)
+    assert verify_replay(decoded) == (True, "10 turns, victory")
+
+
+def test_file_round_trip(tmp_path):
+    replay = record_game()
+    path = str(tmp_path / "game.sirp")
+    replay.save(path)
+    assert fields(Replay.load(path)) == fields(replay)
+    assert verify_file(path) == (path, True, "10 turns, victory")
+
+
+def test_tampered_checksum_diverges_at_its_turn():
+    replay = record_game()
+    replay.checksums[6] ^= 1
+    assert run_replay(replay)[2] == 6
+    assert verify_replay(replay) == (False, "diverges at turn 7")
+
+
+def test_tampered_action_diverges_at_its_turn():
+    replay = record_game()
+    replay.actions[3] = "2" if replay.actions[3] != "2" else "1"
+    assert run_replay(replay)[2] == 3
+    assert verify_replay(Replay.from_bytes(replay.to_bytes()))[0] is False
+
+
+def test_tampered_actions_without_checksums_change_the_game():
+    replay = record_game(checksums=False)
+    replay.actions = ["4"] * len(replay.actions)
+    assert verify_replay(replay) == (False, "diverges at turn 6")
+
+
+@pytest.mark.parametrize("data", [b"", b"NOPE\x01\x00", MAGIC + b"\x63\x00"])
+def test_bad_header_is_rejected(data):
+    with pytest.raises(ValueError):
+        Replay.from_bytes(data)
+
+
+def test_truncated_replay_is_rejected(tmp_path):
+    data = record_game().to_bytes()
+    with pytest.raises(ValueError):
+        Replay.from_bytes(data[:-3])
+    path = str(tmp_path / "truncated.sirp")
+    with open(path, "wb") as f:
+        f.write(data[:10])
+    path, ok, message = verify_file(path)
+    assert not ok and message.startswith("unreadable")
@@ -0,0 +1,53 @@
+"""
+Tests of the exact solver: its values against the forward propagation and the advisor's search.
+"""
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from game.advisor import Advisor
+from game.forward import propagate
+from game.player import Player
+from game.solver import solve_arrays
+
+TOTAL_DAYS = 6
+STATES = [(100, 100, 100, 0), (30, 25, 10, 0), (20, 20, 5, 1), (50, 10, 40, 2), (15, 60, 8, 3)]
+
+
+@pytest.fixture(scope="module")
+def solution():
+    return solve_arrays(horizon=TOTAL_DAYS)
+
+
+def make_player(hunger, thirst, energy, days_survived):
+    return Player(hunger=hunger, thirst=thirst, energy=energy, days_survived=days_survived)
+
+
+@pytest.mark.parametrize("start", STATES)
+def test_win_probability_matches_forward_propagation(solution, start):
+    player = make_player(*start)
+    totals = propagate(solution, total_days=TOTAL_DAYS, player=player).totals()
+    assert totals["victory"] + totals["rescued"] == pytest.approx(solution.win_probability(player, TOTAL_DAYS), abs=1e-6)
+    assert totals["victory"] + totals["rescued"] + totals["dead"] == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize("start", [(100, 100, 100, 3), (40, 35, 20, 4), (15, 60, 8, 3)])
+def test_full_depth_search_matches_solver(solution, start):
+    player = make_player(*start)
+    hint = Advisor(exact=False, time_budget=60).advise(player, TOTAL_DAYS)
+    assert hint.exact
+    assert hint.depth == TOTAL_DAYS - player.days_survived
+    assert hint.win_probability == pytest.approx(solution.win_probability(player, TOTAL_DAYS), abs=1e-6)
+    values = solution.action_values(player, TOTAL_DAYS)
+    for action, value in hint.action_values.items():
+        assert value == pytest.approx(values[action], abs=1e-6)
+
+
+def test_exact_hint_uses_solver_values(solution):
+    player = make_player(30, 25, 10, 0)
+    advisor = Advisor()
+    advisor.solution, advisor._solution_generation = solution, advisor.generation
+    hint = advisor.advise(player, TOTAL_DAYS)
+    assert hint.exact
+    assert hint.win_probability == pytest.approx(solution.win_probability(player, TOTAL_DAYS), abs=1e-6)
@@ -0,0 +1,67 @@
+"""
+Tests of the packed game state: field limits, conversions and the compact array.
+"""
+
+import itertools
+
+import pytest
+
+from game.player import Player, SlottedPlayer
+from game.state import DAYS_MASK, PackedState, StateArray
+
+FIELDS = ("hunger", "thirst", "energy", "days_survived", "total_days")
+LIMITS = {"hunger": (0, 100), "thirst": (0, 100), "energy": (0, 100),
+          "days_survived": (0, DAYS_MASK), "total_days": (0, DAYS_MASK)}
+
+
+@pytest.mark.parametrize("values", list(itertools.product(*(LIMITS[field] for field in FIELDS))))
+def test_limits_round_trip(values):
+    state = PackedState(*values)
+    assert state.unpack() == values
+    assert tuple(getattr(state, field) for field in FIELDS) == values
+    assert PackedState.from_int(int(state)) == state
+
+
+@pytest.mark.parametrize("field", FIELDS)
+@pytest.mark.parametrize("offset", [-1, 1])
+def test_out_of_range_fields_are_rejected(field, offset):
+    low, high = LIMITS[field]
+    with pytest.raises(ValueError):
+        PackedState(**{field: low - 1 if offset < 0 else high + 1})
+
+
+def test_replace_changes_one_field():
+    state = PackedState(hunger=40, thirst=30, energy=20, days_survived=7, total_days=30)
+    changed = state.replace(energy=100, days_survived=DAYS_MASK)
+    assert changed.unpack() == (40, 30, 100, DAYS_MASK, 30)
+    assert state.unpack() == (40, 30, 20, 7, 30)
+    with pytest.raises(ValueError):
+        state.replace(thirst=101)
+
+
+@pytest.mark.parametrize("player_class", [Player, SlottedPlayer])
+def test_player_round_trip(player_class):
+    player = player_class(hunger=0, thirst=100, energy=55, days_survived=DAYS_MASK, name="Robinson")
+    state = PackedState.from_player(player, total_days=DAYS_MASK)
+    rebuilt = state.to_player("Robinson", player_class)
+    assert isinstance(rebuilt, player_class)
+    assert (rebuilt.name, rebuilt.hunger, rebuilt.thirst, rebuilt.energy, rebuilt.days_survived) == \
+        ("Robinson", 0, 100, 55, DAYS_MASK)
+
+
+def test_save_data_round_trip():
+    state = PackedState(hunger=12, thirst=0, energy=100, days_survived=49, total_days=50)
+    save_data = state.to_save_data("Robinson")
+    assert save_data["player"]["name"] == "Robinson"
+    assert PackedState.from_save_data(save_data) == state
+    assert PackedState.from_save_data({}) == PackedState()
+
+
+def test_state_array_bytes_round_trip():
+    states = [PackedState(*values) for values in itertools.product((0, 100), (0, 100), (0, 100), (0, DAYS_MASK), (DAYS_MASK,))]
+    array = StateArray(states)
+    assert len(array.tobytes()) == 8 * len(states)
+    rebuilt = StateArray.frombytes(array.tobytes())
+    assert list(rebuilt) == states
+    assert rebuilt[3].unpack() == states[3].unpack()
+    assert list(rebuilt[1:3]) == states[1:3]
@@ -0,0 +1,61 @@
+"""
+Tests of the streaming statistics: merging partial aggregates and checkpoints.
+"""
+
+import pytest
+
+from game.stats import StreamingStats, iter_games, load_checkpoint, run_streaming, save_checkpoint, stream_chunk
+
+
+@pytest.fixture(scope="module")
+def records():
+    # Short games first and longer goals last, so that merging has to grow the histograms
+    games = list(iter_games(seed=3, chunk=0, n_games=300, total_days=5))
+    games += list(iter_games(seed=3, chunk=1, n_games=300, total_days=15, policy="2"))
+    return games
+
+
+def summaries(stats):
+    return (stats.games, stats.mean_days, [stats.quantile(q) for q in (0.1, 0.5, 0.9, 1.0)],
+            stats.hazard(), stats.gauge_means(), stats.days_histogram,
+            [stats.rate(status) for status in stats.days])
+
+
+@pytest.mark.parametrize("split", [0, 1, 150, 300, 450, 599, 600])
+def test_merge_equals_single_pass(records, split):
+    single = StreamingStats().consume(records)
+    first = StreamingStats().consume(records[:split])
+    second = StreamingStats().consume(records[split:])
+    assert first.merge(second) == single
+    assert summaries(first) == summaries(single)
+
+
+def test_merge_order_does_not_matter(records):
+    parts = [StreamingStats().consume(records[start:start + 100]) for start in range(0, len(records), 100)]
+    forward, backward = StreamingStats(), StreamingStats()
+    for part in parts:
+        forward.merge(part)
+    for part in reversed(parts):
+        backward.merge(part)
+    assert forward == backward == StreamingStats().consume(records)
+
+
+def test_merged_chunks_equal_run(records):
+    merged = stream_chunk(7, 0, 200, 10).merge(stream_chunk(7, 1, 200, 10))
+    assert run_streaming(400, total_days=10, seed=7, workers=1, chunk_size=200) == merged
+
+
+def test_checkpoint_round_trip(records, tmp_path):
+    stats = StreamingStats().consume(records)
+    path = str(tmp_path / "checkpoint.json")
+    save_checkpoint(path, {"seed": 3}, 2, stats)
+    config, next_chunk, restored = load_checkpoint(path)
+    assert (config, next_chunk) == ({"seed": 3}, 2)
+    assert restored == stats
+    assert summaries(restored) == summaries(stats)
+
+
+def test_empty_stats():
+    stats = StreamingStats()
+    assert (stats.mean_days, stats.quantile(0.5), stats.rate("dead"), stats.hazard()) == (0.0, 0, 0.0, [])
+    assert StreamingStats().merge(stats) == stats